@@ -0,0 +1,31 @@
+"""add offer valid_to
+
+Revision ID: 5b1e0c7d2a94
+Revises: 873d509c773b
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1e0c7d2a94'
+down_revision: Union[str, None] = '873d509c773b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('coin_pool_offers', sa.Column('valid_to', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False))
+    # Every existing row was a single scrape, valid only at its creation time
+    op.execute("UPDATE coin_pool_offers SET valid_to = created_at")
+    op.create_index('ix_coin_pool_offers_offer_key_created_at', 'coin_pool_offers',
+                    ['pool_id', 'coin_id', 'chain_id', 'lock_period', sa.text('created_at DESC')])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_coin_pool_offers_offer_key_created_at', table_name='coin_pool_offers')
+    op.drop_column('coin_pool_offers', 'valid_to')
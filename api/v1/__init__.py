@@ -6,6 +6,7 @@ from .pool_views import router as pool_router
 from .offer_views import router as offer_router
 from .clicker_views import router as clicker_router
 from .tg_log import router as log_router
+from .logo_views import router as logo_router
 
 
 router = APIRouter()
@@ -16,3 +17,4 @@ router.include_router(pool_router, prefix="/pool", tags=["pool"])
 router.include_router(offer_router, prefix="/offer", tags=["offer"])
 router.include_router(clicker_router, prefix="/clicker", tags=["clicker"])
 router.include_router(log_router, prefix="/log", tags=["log"])
+router.include_router(logo_router, prefix="/logo", tags=["logo"])
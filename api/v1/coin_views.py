@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from core import logger
+from core.logo_variants import logo_variant_urls
 from core.models import db_helper, Coin, CoinPrice, Chain, coin_chain, CoinPoolOffer
 from core.schemas import CoinResponse, CoinExtendedResponse
 from utils import Ordering
@@ -193,6 +194,7 @@ async def get_all_coins_extended(
                 name=coin.name,
                 code=coin.code,
                 logo=coin.logo,
+                logo_variants=logo_variant_urls(coin.logo),
                 current_price=current_price,
                 max_apr=max_apr,
                 min_amount_from=min_amount_from
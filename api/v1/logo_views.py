@@ -0,0 +1,103 @@
+import base64
+import hashlib
+import mimetypes
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+import aiofiles
+import orjson
+from async_lru import alru_cache
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core import logger, settings
+from core.logo_variants import logo_variant_paths
+from core.models import db_helper, Coin, Chain, Pool
+from core.schemas import LogoBundleResponse
+
+router = APIRouter()
+
+# (kind, id, logo path, sizes of its WebP variants) of every logo in a bundle, sorted
+BundleSignature = Tuple[Tuple[str, str, str, Tuple[int, ...]], ...]
+
+
+@alru_cache(maxsize=2048)
+async def _data_uri(path: str) -> str:
+    """
+    Logo file as a data URI. Content-addressed files never change, so each file is read once.
+    Read errors are raised, so they are not cached.
+    """
+    async with aiofiles.open(path, "rb") as f:
+        data = await f.read()
+    media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    return f"data:{media_type};base64,{base64.b64encode(data).decode()}"
+
+
+async def _assemble_bundle(signature: BundleSignature, size: Optional[int], skip_unreadable: bool) -> bytes:
+    bundle = LogoBundleResponse()
+    for kind, object_id, logo_path, variant_sizes in signature:
+        # The variant closest to the requested size from above, the original if there is none
+        fitting = [variant_size for variant_size in variant_sizes if size and variant_size >= size]
+        path = logo_variant_paths(logo_path).get(min(fitting), logo_path) if fitting else logo_path
+        try:
+            getattr(bundle, kind)[object_id] = await _data_uri(path)
+        except OSError as e:
+            if not skip_unreadable:
+                raise
+            logger.error(f"Error reading logo {path} for the bundle: {str(e)}")
+    return orjson.dumps(bundle.model_dump())
+
+
+@alru_cache(maxsize=32)
+async def _build_bundle(signature: BundleSignature, size: Optional[int]) -> bytes:
+    """Complete bundle of a signature. Raises OSError if a logo can't be read, so partial bundles are not cached."""
+    return await _assemble_bundle(signature, size, skip_unreadable=False)
+
+
+@router.get("/bundle", response_model=LogoBundleResponse)
+async def get_logo_bundle(
+        request: Request,
+        session: AsyncSession = Depends(db_helper.session_getter),
+        size: Optional[int] = Query(None, gt=0, description="Logo size in pixels, the smallest WebP variant "
+                                                               "that fits is embedded. Originals if omitted"),
+        pool_ids: Optional[List[UUID]] = Query(None, description="Pools to include, e.g. those of an offers page"),
+):
+    """
+    All active coin and chain logos, and optionally pool logos, as data URIs in one response.
+
+    The bundle is built once per set of logos and their variants, and cached. Its ETag changes with any logo
+    or variant, so clients revalidate with If-None-Match and only download it again when one changed.
+    """
+    try:
+        rows = []
+        for kind, model, ids in (("coins", Coin, None), ("chains", Chain, None), ("pools", Pool, pool_ids)):
+            if model is Pool and not ids:
+                continue
+            query = select(model.id, model.logo).where(model.is_active == True, model.logo.isnot(None))
+            if ids:
+                query = query.where(model.id.in_(ids))
+            result = await session.execute(query)
+            rows.extend((kind, str(object_id), str(logo), tuple(sorted(logo_variant_paths(str(logo)))))
+                        for object_id, logo in result.all())
+    except SQLAlchemyError as e:
+        logger.exception(f"Unexpected error occurred in get_logo_bundle: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    signature: BundleSignature = tuple(sorted(rows))
+    etag = '"' + hashlib.sha256(orjson.dumps([size, signature])).hexdigest()[:32] + '"'
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={settings.media.logo_bundle_max_age}"}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    try:
+        content = await _build_bundle(signature, size)
+    except OSError as e:
+        # Serve what can be read, but don't let clients or the cache keep it
+        logger.error(f"Logo bundle incomplete, not cached: {str(e)}")
+        content = await _assemble_bundle(signature, size, skip_unreadable=True)
+        headers = {"Cache-Control": "no-store"}
+
+    return Response(content=content, media_type="application/json", headers=headers)
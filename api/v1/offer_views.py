@@ -20,7 +20,7 @@ router = APIRouter()
 
 offer_ordering = Ordering(CoinPoolOffer,
                           [
-                              "lock_period", "apr", "created_at", "amount_from",
+                              "lock_period", "apr", "created_at", "valid_to", "amount_from",
                               "pool_share", "liquidity_token", "liquidity_token_name",
                               "coin_id", "pool_id", "chain_id", "id",
                           ],
@@ -210,7 +210,8 @@ async def get_offer_by_id(
                     CoinPoolOffer.pool_id == base_offer.pool_id,
                     CoinPoolOffer.chain_id == base_offer.chain_id,
                     CoinPoolOffer.lock_period == base_offer.lock_period,
-                    CoinPoolOffer.created_at >= start_date,
+                    # Rows are ranges from created_at to valid_to, take every range that reaches into the period
+                    CoinPoolOffer.valid_to >= start_date,
                     CoinPoolOffer.is_active == True,
                 )
                 .order_by(CoinPoolOffer.created_at.desc())
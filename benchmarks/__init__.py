@@ -0,0 +1,7 @@
+__all__ = [
+    'percentile',
+    'run_metadata',
+    'save_results',
+]
+
+from .common import percentile, run_metadata, save_results
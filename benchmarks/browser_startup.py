@@ -0,0 +1,68 @@
+"""
+Browser startup time of the DefiLlama scraper, new headless mode against the Xvfb fallback:
+
+    python -m benchmarks.browser_startup --runs 5
+
+Each run launches Chrome and opens about:blank; the Xvfb display start is counted once per mode,
+the same way the driver pool pays for it. No network access is needed.
+"""
+import argparse
+import statistics
+import time
+from typing import Dict, List
+
+from core.config import settings
+from scraping.parse_defilama import DefiLamaScraper
+from benchmarks.common import run_metadata, save_results, percentile
+
+
+def measure(use_xvfb: bool, runs: int) -> Dict:
+    settings.scraper.use_xvfb = use_xvfb
+    timings: List[float] = []
+
+    started = time.perf_counter()
+    try:
+        for _ in range(runs):
+            launch = time.perf_counter()
+            driver = DefiLamaScraper._create_pooled_driver()
+            driver.get("about:blank")
+            timings.append(time.perf_counter() - launch)
+            driver.quit()
+    finally:
+        DefiLamaScraper._stop_display()
+    total = time.perf_counter() - started
+
+    timings.sort()
+    return {
+        "mode": "xvfb" if use_xvfb else "headless=new",
+        "runs": runs,
+        "max_s": round(timings[-1], 3),
+        "p50_s": round(statistics.median(timings), 3),
+        "p95_s": round(percentile(timings, 95), 3),
+        "total_s": round(total, 3),
+    }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Compare browser startup time with and without Xvfb")
+    parser.add_argument("--runs", type=int, default=5, help="Browser launches per mode")
+    parser.add_argument("--output", help="Write JSON results to this path")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    results = [measure(use_xvfb, args.runs) for use_xvfb in (False, True)]
+
+    print(f"{'mode':<16}{'runs':>6}{'max s':>10}{'p50 s':>10}{'p95 s':>10}{'total s':>10}")
+    print("-" * 62)
+    for r in results:
+        print(f"{r['mode']:<16}{r['runs']:>6}{r['max_s']:>10}{r['p50_s']:>10}{r['p95_s']:>10}{r['total_s']:>10}")
+
+    if args.output:
+        params = {k: v for k, v in vars(args).items() if k != "output"}
+        save_results(args.output, {**run_metadata(params), "results": results})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import json
+import math
+import os
+import platform
+import subprocess
+from datetime import datetime, UTC
+from typing import List, Dict, Any
+
+
+# Telegram ids of generated users start from this value, so the load driver can hit existing users
+TG_USER_ID_BASE = 900_000_000
+
+# Default seed, the same seed gives the same dataset and the same request sequence
+DEFAULT_SEED = 42
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list.
+
+    :param sorted_values: Sorted values
+    :param pct: Percentile in range (0, 100]
+    :return: Percentile value or 0.0 for an empty list
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def git_revision() -> str:
+    """Return the current commit hash, so results can be compared across commits."""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL,
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run_metadata(params: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "revision": git_revision(),
+        "timestamp": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "params": params,
+    }
+
+
+def save_results(path: str, results: Dict[str, Any]) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, default=str)
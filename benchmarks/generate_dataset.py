@@ -0,0 +1,222 @@
+"""
+Synthetic dataset generator for the load benchmarks.
+
+Populates a local Postgres (the one configured through the usual POSTGRES_* variables) with
+deterministic data: the same arguments and seed always produce the same rows, so results of
+`benchmarks.load_api` are comparable across commits.
+
+Usage:
+    alembic upgrade head
+    python -m benchmarks.generate_dataset --coins 50 --chains 20 --pools 500 --days 90 --users 10000 --truncate
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, UTC
+from typing import List, Dict, Iterable
+
+from sqlalchemy import insert, text
+
+from core import logger
+from core.models import (
+    db_helper, Chain, Coin, Pool, CoinPoolOffer, CoinPrice, Clicker, coin_chain, check_and_update_tables,
+)
+from core.models.tg_log import tg_users, tg_users_log
+from benchmarks.common import TG_USER_ID_BASE, DEFAULT_SEED
+
+PRICE_TICK = timedelta(minutes=10)
+
+TRUNCATE_STATEMENT = (
+    "TRUNCATE coin_pool_offers, coin_prices, coin_chain, pools, coins, chains, clickers, "
+    "tg_users_log, tg_users RESTART IDENTITY CASCADE"
+)
+
+
+class DatasetGenerator:
+    def __init__(self, coins: int, chains: int, pools: int, days: int, users: int, logs_per_user: int,
+                 clickers: int, seed: int, batch_size: int):
+        self.coins = coins
+        self.chains = chains
+        self.pools = pools
+        self.days = days
+        self.users = users
+        self.logs_per_user = logs_per_user
+        self.clickers = clickers
+        self.batch_size = batch_size
+        self.rng = random.Random(seed)
+        # Offers and prices end at the start of the current day, so reruns on the same day are identical
+        self.end = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+        self.start = self.end - timedelta(days=days)
+
+    def _uuid(self) -> uuid.UUID:
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def build_coins(self) -> List[Dict]:
+        return [
+            {"id": self._uuid(), "name": f"Bench Coin {i}", "code": f"BC{i}",
+             "coin_id_for_price_getter": None, "is_active": True}
+            for i in range(self.coins)
+        ]
+
+    def build_chains(self) -> List[Dict]:
+        return [{"id": self._uuid(), "name": f"Bench Chain {i}", "is_active": True} for i in range(self.chains)]
+
+    def build_pools(self) -> List[Dict]:
+        return [
+            {"id": self._uuid(), "name": f"Bench Pool {i}", "website_url": f"https://pool-{i}.example.com",
+             "parsing_source": "benchmark", "is_active": True}
+            for i in range(self.pools)
+        ]
+
+    def build_coin_chain(self, coins: List[Dict], chains: List[Dict]) -> List[Dict]:
+        rows = []
+        for chain in chains:
+            for coin in self.rng.sample(coins, k=min(len(coins), self.rng.randint(1, 3))):
+                rows.append({"coin_id": coin["id"], "chain_id": chain["id"]})
+        return rows
+
+    def iter_offers(self, pools: List[Dict], coin_chain_rows: List[Dict]) -> Iterable[Dict]:
+        """One offer per pool and day, each pool is bound to a single coin/chain pair."""
+        for pool in pools:
+            pair = self.rng.choice(coin_chain_rows)
+            apr = self.rng.uniform(1, 25)
+            lock_period = self.rng.choice([0, 0, 7, 14, 30])
+            for day in range(self.days):
+                apr = min(100.0, max(0.0, apr + self.rng.uniform(-0.5, 0.5)))
+                yield {
+                    "id": self._uuid(),
+                    "coin_id": pair["coin_id"],
+                    "chain_id": pair["chain_id"],
+                    "pool_id": pool["id"],
+                    "apr": round(apr, 4),
+                    "fee": round(self.rng.uniform(0, 10), 2),
+                    "amount_from": round(self.rng.uniform(0, 100), 2),
+                    "lock_period": lock_period,
+                    "pool_share": round(self.rng.uniform(0, 5), 4),
+                    "liquidity_token": False,
+                    "liquidity_token_name": None,
+                    "created_at": self.start + timedelta(days=day + 1),
+                    "valid_to": self.start + timedelta(days=day + 1),
+                    "is_active": True,
+                }
+
+    def iter_prices(self, coins: List[Dict]) -> Iterable[Dict]:
+        ticks = int(timedelta(days=self.days) / PRICE_TICK)
+        for coin in coins:
+            price = self.rng.uniform(0.01, 3000)
+            for tick in range(ticks):
+                price = max(0.00000001, price * (1 + self.rng.uniform(-0.002, 0.002)))
+                yield {
+                    "id": self._uuid(),
+                    "coin_id": coin["id"],
+                    "price": price,
+                    "created_at": self.start + PRICE_TICK * (tick + 1),
+                    "is_active": True,
+                }
+
+    def build_clickers(self) -> List[Dict]:
+        return [
+            {"id": self._uuid(), "name": f"Bench Clicker {i}", "description": "Synthetic clicker",
+             "audience": self.rng.randint(1_000, 50_000_000), "coin": f"BC{i % max(self.coins, 1)}",
+             "is_active": True}
+            for i in range(self.clickers)
+        ]
+
+    def build_users(self) -> List[Dict]:
+        return [{"tg_user": TG_USER_ID_BASE + i, "username": f"bench_user_{i}", "is_superuser": False}
+                for i in range(self.users)]
+
+    def iter_logs(self) -> Iterable[Dict]:
+        for i in range(self.users):
+            for n in range(self.logs_per_user):
+                yield {
+                    "tg_user": TG_USER_ID_BASE + i,
+                    "url_log": f"/offers?page={n % 10 + 1}",
+                    "context": {"action": "open", "n": n},
+                }
+
+    async def insert_batched(self, session, table, rows: Iterable[Dict]) -> int:
+        total = 0
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                await session.execute(insert(table), batch)
+                total += len(batch)
+                batch = []
+        if batch:
+            await session.execute(insert(table), batch)
+            total += len(batch)
+        return total
+
+    async def run(self, truncate: bool) -> Dict[str, int]:
+        await check_and_update_tables(engine=db_helper.engine)
+
+        counts = {}
+        async for session in db_helper.session_getter():
+            try:
+                if truncate:
+                    await session.execute(text(TRUNCATE_STATEMENT))
+                    logger.info("Truncated benchmark tables")
+
+                coins = self.build_coins()
+                chains = self.build_chains()
+                pools = self.build_pools()
+                coin_chain_rows = self.build_coin_chain(coins, chains)
+
+                counts["coins"] = await self.insert_batched(session, Coin.__table__, coins)
+                counts["chains"] = await self.insert_batched(session, Chain.__table__, chains)
+                counts["pools"] = await self.insert_batched(session, Pool.__table__, pools)
+                counts["coin_chain"] = await self.insert_batched(session, coin_chain, coin_chain_rows)
+                counts["offers"] = await self.insert_batched(
+                    session, CoinPoolOffer.__table__, self.iter_offers(pools, coin_chain_rows))
+                counts["prices"] = await self.insert_batched(session, CoinPrice.__table__, self.iter_prices(coins))
+                counts["clickers"] = await self.insert_batched(session, Clicker.__table__, self.build_clickers())
+                counts["tg_users"] = await self.insert_batched(session, tg_users, self.build_users())
+                counts["tg_users_log"] = await self.insert_batched(session, tg_users_log, self.iter_logs())
+
+                await session.commit()
+            except Exception as e:
+                logger.exception(f"Error generating benchmark dataset: {str(e)}")
+                await session.rollback()
+                raise
+            finally:
+                await session.close()
+
+        return counts
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Populate the database with a synthetic benchmark dataset")
+    parser.add_argument("--coins", type=int, default=20, help="Number of coins")
+    parser.add_argument("--chains", type=int, default=10, help="Number of chains")
+    parser.add_argument("--pools", type=int, default=200, help="Number of pools")
+    parser.add_argument("--days", type=int, default=30, help="Days of daily offers and 10-minute price ticks")
+    parser.add_argument("--users", type=int, default=1000, help="Number of Telegram users")
+    parser.add_argument("--logs-per-user", type=int, default=10, help="Telegram logs per user")
+    parser.add_argument("--clickers", type=int, default=50, help="Number of clickers")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Random seed")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Rows per INSERT statement")
+    parser.add_argument("--truncate", action="store_true", help="Truncate all tables before generating")
+    return parser.parse_args()
+
+
+async def main():
+    args = parse_args()
+    generator = DatasetGenerator(
+        coins=args.coins, chains=args.chains, pools=args.pools, days=args.days, users=args.users,
+        logs_per_user=args.logs_per_user, clickers=args.clickers, seed=args.seed, batch_size=args.batch_size,
+    )
+    started = time.perf_counter()
+    try:
+        counts = await generator.run(truncate=args.truncate)
+    finally:
+        await db_helper.dispose()
+
+    logger.info(f"Generated benchmark dataset in {time.perf_counter() - started:.1f}s: {counts}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
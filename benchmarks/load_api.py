@@ -0,0 +1,215 @@
+"""
+Async load driver for the `api/v1` routes.
+
+Every route is hit with the same number of requests at a fixed concurrency, one route at a time,
+and p50/p95/p99 latency and throughput are reported per route. Ids for detail routes are picked
+from the list endpoints with a seeded RNG, so two runs against the same dataset issue the same requests.
+
+Usage:
+    python -m benchmarks.load_api --base-url http://localhost:8000 --concurrency 16 --requests 500 \
+        --output bench_results/load_api.json
+"""
+import argparse
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List, Dict, Any, Optional
+
+import aiohttp
+
+from benchmarks.common import TG_USER_ID_BASE, DEFAULT_SEED, percentile, run_metadata, save_results
+
+
+# Logo size of the sized bundle routes, one of the default MEDIA_LOGO_VARIANT_SIZES
+BUNDLE_LOGO_SIZE = 64
+
+
+@dataclass
+class Route:
+    name: str
+    method: str
+    path: Callable[[int], str]
+    body: Optional[Callable[[int], Dict[str, Any]]] = None
+    headers: Optional[Dict[str, str]] = None
+
+
+@dataclass
+class RouteResult:
+    name: str
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+    wall_time: float = 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        values = sorted(self.latencies)
+        count = len(values)
+        return {
+            "route": self.name,
+            "requests": count,
+            "errors": self.errors,
+            "p50_ms": round(percentile(values, 50) * 1000, 2),
+            "p95_ms": round(percentile(values, 95) * 1000, 2),
+            "p99_ms": round(percentile(values, 99) * 1000, 2),
+            "throughput_rps": round(count / self.wall_time, 2) if self.wall_time else 0.0,
+        }
+
+
+async def fetch_ids(session: aiohttp.ClientSession, api: str) -> Dict[str, List[str]]:
+    ids = {}
+    for name in ("coin", "chain", "pool", "clicker"):
+        async with session.get(f"{api}/{name}/") as response:
+            response.raise_for_status()
+            ids[name] = [item["id"] for item in await response.json()]
+    async with session.get(f"{api}/offer/", params={"page_size": 100}) as response:
+        response.raise_for_status()
+        ids["offer"] = [item["id"] for item in (await response.json())["items"]]
+    return ids
+
+
+async def fetch_bundle_etags(session: aiohttp.ClientSession, api: str) -> Dict[str, str]:
+    """Current ETags of the logo bundle paths, sent back as If-None-Match by the revalidation routes."""
+    etags = {}
+    for path in ("/logo/bundle", f"/logo/bundle?size={BUNDLE_LOGO_SIZE}"):
+        async with session.get(api + path) as response:
+            response.raise_for_status()
+            # A bundle with an unreadable logo is served without an ETag, it is then fetched in full
+            if "ETag" in response.headers:
+                etags[path] = response.headers["ETag"]
+    return etags
+
+
+def build_routes(ids: Dict[str, List[str]], etags: Dict[str, str], users: int, seed: int) -> List[Route]:
+    rng = random.Random(seed)
+
+    def pick(name: str) -> Callable[[int], str]:
+        values = ids.get(name) or []
+        if not values:
+            return lambda i: ""
+        sequence = [rng.choice(values) for _ in range(1024)]
+        return lambda i: sequence[i % len(sequence)]
+
+    coin, chain, pool, offer, clicker = (pick(n) for n in ("coin", "chain", "pool", "offer", "clicker"))
+
+    def tg_user(i: int) -> int:
+        return TG_USER_ID_BASE + (i % max(users, 1))
+
+    def if_none_match(path: str) -> Dict[str, str]:
+        return {"If-None-Match": etags[path]} if path in etags else {}
+
+    sized_bundle = f"/logo/bundle?size={BUNDLE_LOGO_SIZE}"
+
+    routes = [
+        Route("GET /coin/", "GET", lambda i: "/coin/"),
+        Route("GET /coin/{id}", "GET", lambda i: f"/coin/{coin(i)}"),
+        Route("GET /coin/extended/", "GET", lambda i: "/coin/extended/"),
+        Route("GET /chain/", "GET", lambda i: "/chain/"),
+        Route("GET /chain/{id}", "GET", lambda i: f"/chain/{chain(i)}"),
+        Route("GET /pool/", "GET", lambda i: "/pool/"),
+        Route("GET /pool/{id}", "GET", lambda i: f"/pool/{pool(i)}"),
+        Route("GET /offer/", "GET", lambda i: f"/offer/?page={i % 5 + 1}"),
+        Route("GET /offer/{id}", "GET", lambda i: f"/offer/{offer(i)}"),
+        Route("GET /offer/{id}?days=30", "GET", lambda i: f"/offer/{offer(i)}?days=30"),
+        Route("GET /clicker/", "GET", lambda i: "/clicker/"),
+        Route("GET /clicker/{id}", "GET", lambda i: f"/clicker/{clicker(i)}"),
+        Route("GET /logo/bundle", "GET", lambda i: "/logo/bundle"),
+        Route("GET /logo/bundle 304", "GET", lambda i: "/logo/bundle", headers=if_none_match("/logo/bundle")),
+        Route("GET /logo/bundle?size", "GET", lambda i: sized_bundle),
+        Route("GET /logo/bundle?size 304", "GET", lambda i: sized_bundle, headers=if_none_match(sized_bundle)),
+        Route("POST /log/tg-user", "POST", lambda i: "/log/tg-user",
+              lambda i: {"tg_user": tg_user(i), "username": None}),
+        Route("POST /log/tg-user-log", "POST", lambda i: "/log/tg-user-log",
+              lambda i: {"tg_user": tg_user(i), "url_log": "/benchmark", "context": {"n": i}}),
+    ]
+    return routes
+
+
+async def run_route(session: aiohttp.ClientSession, api: str, route: Route, requests: int, warmup: int,
+                    concurrency: int) -> RouteResult:
+    result = RouteResult(name=route.name)
+
+    async def call(i: int, record: bool):
+        url = api + route.path(i)
+        body = route.body(i) if route.body else None
+        started = time.perf_counter()
+        try:
+            async with session.request(route.method, url, json=body, headers=route.headers) as response:
+                await response.read()
+                ok = response.status < 400
+        except aiohttp.ClientError:
+            ok = False
+        elapsed = time.perf_counter() - started
+        if record:
+            result.latencies.append(elapsed)
+            if not ok:
+                result.errors += 1
+
+    async def worker(queue: asyncio.Queue, record: bool):
+        while True:
+            try:
+                i = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await call(i, record)
+
+    for record, count in ((False, warmup), (True, requests)):
+        queue = asyncio.Queue()
+        for i in range(count):
+            queue.put_nowait(i)
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(queue, record) for _ in range(concurrency)))
+        if record:
+            result.wall_time = time.perf_counter() - started
+
+    return result
+
+
+def print_report(summaries: List[Dict[str, Any]]) -> None:
+    header = f"{'route':<28}{'req':>7}{'err':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'rps':>10}"
+    print(header)
+    print("-" * len(header))
+    for s in summaries:
+        print(f"{s['route']:<28}{s['requests']:>7}{s['errors']:>6}{s['p50_ms']:>10}{s['p95_ms']:>10}"
+              f"{s['p99_ms']:>10}{s['throughput_rps']:>10}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Load test every api/v1 route")
+    parser.add_argument("--base-url", default="http://localhost:8000", help="Application base URL")
+    parser.add_argument("--prefix", default="/api/v1", help="API prefix")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent requests per route")
+    parser.add_argument("--requests", type=int, default=500, help="Measured requests per route")
+    parser.add_argument("--warmup", type=int, default=20, help="Unmeasured warmup requests per route")
+    parser.add_argument("--users", type=int, default=1000, help="Number of generated Telegram users")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Random seed for id selection")
+    parser.add_argument("--route", action="append", help="Run only routes containing this substring")
+    parser.add_argument("--output", help="Write JSON results to this path")
+    return parser.parse_args()
+
+
+async def main():
+    args = parse_args()
+    api = args.base_url.rstrip("/") + args.prefix
+
+    connector = aiohttp.TCPConnector(limit=args.concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        ids = await fetch_ids(session, api)
+        etags = await fetch_bundle_etags(session, api)
+        routes = build_routes(ids, etags, args.users, args.seed)
+        if args.route:
+            routes = [r for r in routes if any(part in r.name for part in args.route)]
+
+        summaries = []
+        for route in routes:
+            result = await run_route(session, api, route, args.requests, args.warmup, args.concurrency)
+            summaries.append(result.summary())
+
+    print_report(summaries)
+
+    if args.output:
+        params = {k: v for k, v in vars(args).items() if k != "output"}
+        save_results(args.output, {**run_metadata(params), "routes": summaries})
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,77 @@
+"""
+Page load time and transferred bytes per resource blocking profile, against the live sites:
+
+    python -m benchmarks.resource_blocking --url https://validator.info/lava --url https://defillama.com/lsd --runs 3
+
+Every page is loaded in a fresh browser per profile, so caches don't favour the later profiles.
+"""
+import argparse
+import statistics
+import time
+from typing import Dict, List
+
+from core.config import settings
+from scraping.resource_blocking import BLOCKING_PROFILES, get_page_metrics
+from scraping.scrapers_validator_info import BaseScraper
+from benchmarks.common import run_metadata, save_results
+
+
+def measure(url: str, profile: str, runs: int) -> Dict:
+    settings.scraper.blocking_profile_validator_info = profile
+    wall, load, size, requests = [], [], [], []
+
+    for _ in range(runs):
+        driver = BaseScraper.get_chrome_driver()
+        try:
+            started = time.perf_counter()
+            driver.get(url)
+            wall.append((time.perf_counter() - started) * 1000)
+            metrics = get_page_metrics(driver)
+            load.append(metrics.get("load_ms") or 0)
+            size.append(metrics.get("bytes") or 0)
+            requests.append(metrics.get("requests") or 0)
+        finally:
+            driver.quit()
+
+    return {
+        "url": url,
+        "profile": profile,
+        "wall_ms": round(statistics.median(wall)),
+        "load_ms": round(statistics.median(load)),
+        "kib": round(statistics.median(size) / 1024),
+        "requests": round(statistics.median(requests)),
+    }
+
+
+def print_report(results: List[Dict]) -> None:
+    baseline = {r["url"]: r for r in results if r["profile"] == "none"}
+    print(f"{'url':<40}{'profile':<14}{'wall ms':>10}{'load ms':>10}{'KiB':>10}{'requests':>10}{'saved ms':>10}{'saved KiB':>11}")
+    print("-" * 115)
+    for r in results:
+        base = baseline.get(r["url"], r)
+        print(f"{r['url'][:39]:<40}{r['profile']:<14}{r['wall_ms']:>10}{r['load_ms']:>10}{r['kib']:>10}"
+              f"{r['requests']:>10}{base['wall_ms'] - r['wall_ms']:>10}{base['kib'] - r['kib']:>11}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Measure the effect of resource blocking profiles")
+    parser.add_argument("--url", action="append", help="Page to load, can be repeated")
+    parser.add_argument("--runs", type=int, default=3, help="Loads per page and profile, the median is reported")
+    parser.add_argument("--output", help="Write JSON results to this path")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    urls = args.url or ["https://validator.info/lava", "https://defillama.com/lsd"]
+
+    results = [measure(url, profile, args.runs) for url in urls for profile in BLOCKING_PROFILES]
+    print_report(results)
+
+    if args.output:
+        params = {k: v for k, v in vars(args).items() if k != "output"}
+        save_results(args.output, {**run_metadata(params), "results": results})
+
+
+if __name__ == "__main__":
+    main()
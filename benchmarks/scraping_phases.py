@@ -0,0 +1,154 @@
+"""
+Timing benchmark for every scraping phase, runnable fully offline.
+
+Record fixtures once against the live sites:
+    python -m benchmarks.scraping_phases --mode record --chain lava --chain celestia
+
+Then replay them from the local stand-in server, without network access:
+    python -m benchmarks.scraping_phases --mode replay --chain lava --chain celestia --output bench_results/scraping.json
+
+Only the scraping phases are measured, nothing is written to the database.
+Scrapers are called directly in this process, bypassing the scraping worker.
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import List, Dict, Any
+
+from core.config import settings
+from core.fastapi_storage import CustomFileSystemStorage
+from scraping.replay import ReplayServer
+from scraping.driver_pool import close_driver_pools
+from scraping.http_client import close_http_session
+from scraping.parse_defilama import DefiLamaScraper
+from scraping.defillama_data import fetch_lsd_rows
+from scraping.image_downloader import download_images, image_extension
+from scraping.scrapers_validator_info import (
+    MainPageScraper, ValidatorDataScraper, ValidatorLinkAndImageScraper, ValidatorExternalLinksScraper, scrape_chains,
+)
+from services.update_coin_price import get_crypto_prices, coins_should_exist
+from benchmarks.common import run_metadata, save_results
+
+
+class PhaseTimer:
+    def __init__(self):
+        self.phases: List[Dict[str, Any]] = []
+
+    @contextmanager
+    def phase(self, name: str):
+        record = {"phase": name, "items": 0}
+        started = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["seconds"] = round(time.perf_counter() - started, 3)
+            self.phases.append(record)
+
+    def report(self) -> None:
+        print(f"{'phase':<40}{'items':>8}{'seconds':>10}")
+        print("-" * 58)
+        for p in self.phases:
+            print(f"{p['phase']:<40}{p['items']:>8}{p['seconds']:>10}")
+
+
+async def run_phases(chains: List[str], website_limit: int, external_link_limit: int, workers: int) -> PhaseTimer:
+    timer = PhaseTimer()
+
+    with timer.phase("coingecko prices") as p:
+        prices = await get_crypto_prices(list(coins_should_exist.values()))
+        p["items"] = len(prices)
+
+    defillama = DefiLamaScraper()
+    with timer.phase("defillama page data (http)") as p:
+        p["items"] = len(await fetch_lsd_rows(defillama.url))
+
+    with timer.phase("defillama table (browser)") as p:
+        rows = defillama.scrape_validator_data(defillama.url)
+        p["items"] = len(rows)
+
+    with timer.phase("defillama validator websites") as p:
+        for row in rows[:website_limit]:
+            defillama.extract_validator_website(row[1])
+            p["items"] += 1
+
+    main_page_scraper = MainPageScraper(["https://validator.info"])
+    with timer.phase("validator.info main page (http)") as p:
+        p["items"] = len(main_page_scraper.extract_data_from_main_page(await main_page_scraper.fetch_main_page() or ""))
+
+    with timer.phase("validator.info main page (browser)") as p:
+        chains_data = main_page_scraper.extract_data_from_main_page(main_page_scraper.scrape_main_page() or "")
+        p["items"] = len(chains_data)
+
+    for chain in chains:
+        url = f"https://validator.info/{chain}"
+
+        with timer.phase(f"{chain}: validator page") as p:
+            df, validator_links = ValidatorDataScraper([url]).scrape_validator_page(url)
+            validators = set(df["Validator"]) if df is not None and not df.empty else set()
+            p["items"] = len(validators)
+
+        link_image_data = ValidatorLinkAndImageScraper([url]).scrape_validator_links_and_images(
+            validator_links, validators)
+
+        with timer.phase(f"{chain}: image downloads") as p, tempfile.TemporaryDirectory() as media_dir:
+            images = {name: (data["img_url"], f"{name}{image_extension(data['img_url'])}")
+                      for name, data in link_image_data.items() if data.get("img_url")}
+            p["items"] = len(await download_images(images, CustomFileSystemStorage(media_dir)))
+
+        with timer.phase(f"{chain}: external links") as p:
+            limited = dict(list(link_image_data.items())[:external_link_limit])
+            p["items"] = sum(1 for link in ValidatorExternalLinksScraper().scrape_external_links(limited).values() if link)
+
+    with timer.phase(f"all chains, {workers} browser workers") as p:
+        urls = [f"https://validator.info/{chain}" for chain in chains]
+        results = scrape_chains(urls, existing_pool_names=(), workers=workers)
+        p["items"] = sum(1 for result in results.values() if result is not None)
+
+    return timer
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Time every scraping phase against recorded fixtures")
+    parser.add_argument("--mode", choices=["record", "replay"], default="replay",
+                        help="Record fixtures from the live sites or replay them offline")
+    parser.add_argument("--fixtures-dir", default=settings.scraper.fixtures_dir, help="Fixtures directory")
+    parser.add_argument("--chain", action="append", help="validator.info chain slug, e.g. lava")
+    parser.add_argument("--website-limit", type=int, default=3, help="DefiLlama validator pages to visit")
+    parser.add_argument("--external-link-limit", type=int, default=10, help="validator.info validator pages to visit")
+    parser.add_argument("--workers", type=int, default=settings.scraper.browser_workers,
+                        help="Browser workers for the parallel all-chains phase")
+    parser.add_argument("--output", help="Write JSON results to this path")
+    return parser.parse_args()
+
+
+async def main():
+    args = parse_args()
+    chains = args.chain or ["lava"]
+
+    settings.scraper.fixtures_dir = args.fixtures_dir
+    settings.scraper.replay_mode = args.mode
+
+    server = None
+    if args.mode == "replay":
+        server = ReplayServer(args.fixtures_dir).start()
+        settings.scraper.replay_url = server.url
+
+    try:
+        timer = await run_phases(chains, args.website_limit, args.external_link_limit, args.workers)
+    finally:
+        close_driver_pools()
+        await close_http_session()
+        if server:
+            server.stop()
+
+    timer.report()
+
+    if args.output:
+        params = {k: v for k, v in vars(args).items() if k != "output"}
+        save_results(args.output, {**run_metadata(params), "phases": timer.phases})
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,154 @@
+"""
+Microbenchmark of validator.info table cleaning and offer building, per-cell against vectorized:
+
+    python -m benchmarks.validator_table --rows 10000 --runs 5
+
+The table is synthetic and deterministic (see --seed) and shaped like scraped validator.info rows.
+No browser, network or database is needed; the per-cell stage is a copy of the code before vectorization.
+"""
+import argparse
+import random
+import re
+import statistics
+import time
+import uuid
+from typing import Callable, Dict, List
+
+import pandas as pd
+
+from scraping.validator_table import (
+    clean_validator_names, clean_numeric_values, parse_amounts, build_offer_columns, offer_rows,
+)
+from benchmarks.common import DEFAULT_SEED, run_metadata, save_results
+
+HEADERS = ["Validator", "Total staked", "Voting power", "Delegators", "Votes", "Fee", "APR", "Blocks", ""]
+
+
+def generate_rows(count: int, seed: int) -> List[List[str]]:
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        name = f"{i + 1} {'NEW ' if rng.random() < 0.1 else ''}Validator  {i}"
+        rows.append([
+            name,
+            f"{rng.uniform(1e3, 1e8):,.2f} TIA\n${rng.uniform(1e3, 1e9):,.0f}",
+            f"{rng.uniform(0, 5):.2f}%",
+            f"{rng.randint(1, 50000):,}",
+            f"{rng.randint(0, 40)} / {rng.randint(40, 60)}",
+            f"{rng.choice([0, 5, 10, 100]):.2f}%\nCommission",
+            f"{rng.uniform(5, 20):.2f}%",
+            f"{rng.randint(0, 10000):,}",
+            "",
+        ])
+    return rows
+
+
+# Per-cell implementation before vectorization, kept here as the baseline
+
+def _legacy_clean_validator_name(name: str) -> str:
+    name = re.sub(r'^(\d+\s+)+', '', name)
+    name = re.sub(r'\bNEW\s*', '', name)
+    name = re.sub(r'\s+', ' ', name).strip()
+    return name
+
+
+def _legacy_clean_numeric_value(value: str, column_name: str) -> str:
+    value = value.split('\n')[0] if '\n' in value else value
+    if column_name == "Votes":
+        value = re.sub(r'[^0-9/\s]', '', value)
+    else:
+        value = re.sub(r'[^0-9.,%]', '', value)
+    return value.strip()
+
+
+def legacy_stage(rows: List[List[str]], pools_dict: Dict[str, uuid.UUID], coin_id, chain_id) -> List[Dict]:
+    df = pd.DataFrame(rows, columns=HEADERS)
+    for col in df.columns:
+        if col == "Validator":
+            df[col] = df[col].apply(_legacy_clean_validator_name)
+        else:
+            df[col] = df[col].apply(lambda x: _legacy_clean_numeric_value(x, col))
+
+    df['staked_usd'] = df['Total staked'].apply(
+        lambda x: float(re.sub(r'[^\d.]', '', str(x))) if pd.notna(x) else 0) * 1.5
+    df['pool_share'] = df['staked_usd'] / df['staked_usd'].sum() * 100
+    df = df.rename(columns={'Validator': 'name', 'APR': 'apr', 'Fee': 'fee'})
+
+    offers = []
+    for _, row in df.iterrows():
+        pool_id = pools_dict.get(row['name'])
+        if not pool_id:
+            continue
+        offers.append({
+            "coin_id": coin_id,
+            "pool_id": pool_id,
+            "chain_id": chain_id,
+            "apr": float(row['apr'].strip('%')) if pd.notna(row['apr']) else None,
+            "fee": float(row['fee'].strip('%')) if pd.notna(row['fee']) else None,
+            "pool_share": float(row['pool_share']) if pd.notna(row['pool_share']) else None,
+            "lock_period": 0,
+        })
+    return offers
+
+
+def vectorized_stage(rows: List[List[str]], pools_dict: Dict[str, uuid.UUID], coin_id, chain_id) -> List[Dict]:
+    df = pd.DataFrame(rows, columns=HEADERS)
+    for col in df.columns:
+        if col == "Validator":
+            df[col] = clean_validator_names(df[col])
+        else:
+            df[col] = clean_numeric_values(df[col], col)
+
+    df['staked_usd'] = parse_amounts(df['Total staked']) * 1.5
+    df['pool_share'] = df['staked_usd'] / df['staked_usd'].sum() * 100
+    df = df.rename(columns={'Validator': 'name', 'APR': 'apr', 'Fee': 'fee'})
+
+    return offer_rows(build_offer_columns(df, pools_dict, coin_id, chain_id))
+
+
+def measure(stage: Callable, runs: int, *args) -> Dict:
+    timings = []
+    result = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = stage(*args)
+        timings.append(time.perf_counter() - started)
+    return {"median_s": round(statistics.median(timings), 4), "min_s": round(min(timings), 4), "offers": len(result),
+            "result": result}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Compare per-cell and vectorized validator table processing")
+    parser.add_argument("--rows", type=int, default=10000, help="Rows of the synthetic validator table")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per implementation, the median is reported")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Seed of the synthetic table")
+    parser.add_argument("--output", help="Write JSON results to this path")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    rows = generate_rows(args.rows, args.seed)
+    # Nine out of ten validators have a pool in the database
+    pools_dict = {f"Validator {i}": uuid.UUID(int=i + 1) for i in range(args.rows) if i % 10}
+    coin_id, chain_id = uuid.UUID(int=10 ** 9), uuid.UUID(int=10 ** 9 + 1)
+
+    legacy = measure(legacy_stage, args.runs, rows, pools_dict, coin_id, chain_id)
+    vectorized = measure(vectorized_stage, args.runs, rows, pools_dict, coin_id, chain_id)
+    if legacy.pop("result") != vectorized.pop("result"):
+        raise SystemExit("Vectorized offers differ from the per-cell baseline")
+
+    results = [{"implementation": "per-cell", **legacy}, {"implementation": "vectorized", **vectorized}]
+    print(f"{'implementation':<16}{'rows':>8}{'offers':>8}{'median s':>10}{'min s':>10}")
+    print("-" * 52)
+    for r in results:
+        print(f"{r['implementation']:<16}{args.rows:>8}{r['offers']:>8}{r['median_s']:>10}{r['min_s']:>10}")
+    print(f"speedup: {legacy['median_s'] / vectorized['median_s']:.1f}x")
+
+    if args.output:
+        params = {k: v for k, v in vars(args).items() if k != "output"}
+        save_results(args.output, {**run_metadata(params), "results": results})
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,16 @@
 import asyncio
 
 from services import update_coin_prices
-from scraping import run_parsing
+from scraping import run_parsing, scraping_worker, close_http_session
 
 
 async def collect_data_on_start():
     await update_coin_prices()
-    await run_parsing()
+    try:
+        await run_parsing()
+    finally:
+        scraping_worker.stop()
+        await close_http_session()
 
 
 if __name__ == "__main__":
@@ -5,8 +5,9 @@ __all__ = [
     'pool_storage',
     'chain_storage',
     'clicker_storage',
+    'StoredFile',
 ]
 
 from .config import settings
 from .logger import logger
-from .fastapi_storage import coin_storage, pool_storage, chain_storage, clicker_storage
+from .fastapi_storage import coin_storage, pool_storage, chain_storage, clicker_storage, StoredFile
@@ -1,3 +1,4 @@
+import os
 from typing import Any
 
 from fastapi import UploadFile
@@ -8,8 +9,9 @@ from sqlalchemy.orm import selectinload
 from starlette.requests import Request
 from starlette.responses import RedirectResponse
 
-from core import logger
+from core import logger, StoredFile
 from core.admin import async_sqladmin_db_helper
+from core.logo_variants import create_logo_variants
 
 
 class BaseAdminModel(ModelView):
@@ -33,6 +35,9 @@ class BaseAdminModel(ModelView):
         'id': {'readonly': True},
     }
 
+    # Content-addressed storage of the 'logo' column, None for models without a logo
+    logo_storage = None
+
     async def get_one(self, _id):
         async with self.session as session:
             stmt = select(self.model).options(selectinload('*')).filter_by(id=_id)
@@ -42,6 +47,74 @@ class BaseAdminModel(ModelView):
     async def get_form(self, form_class, obj: Any = None):
         return await super().get_form(form_class, obj)
 
+    async def on_model_change(self, data: dict, model: Any, is_created: bool, request: Request) -> None:
+        """
+        Store an uploaded logo under its content hash before the model is saved,
+        so FileType references the stored file instead of writing the upload under its own name.
+        """
+        request.state.stored_logo = None
+        if self.logo_storage is None or 'logo' not in data:
+            return
+
+        request.state.replaced_logo = None if is_created else model.logo
+        logo = data['logo']
+        if not isinstance(logo, UploadFile) or not logo.filename:
+            return
+
+        if not is_created and model.logo and os.path.basename(logo.filename) == os.path.basename(str(model.logo)):
+            # The stored logo submitted again unchanged, nothing to store or release
+            data.pop('logo')
+            request.state.replaced_logo = None
+            return
+
+        if not await logo.read(1):
+            return
+        await logo.seek(0)
+
+        try:
+            name = await self.logo_storage.put(logo)
+            request.state.stored_logo = name
+            await create_logo_variants(self.logo_storage, [name])
+            data['logo'] = StoredFile(name)
+        except Exception as e:
+            logger.error(f"Error uploading logo for {self.name} {getattr(model, 'name', model.id)}: {str(e)}")
+            # Keep the current logo
+            data.pop('logo')
+            request.state.replaced_logo = None
+            await self._release_stored_logo(request)
+
+    async def _release_stored_logo(self, request: Request) -> None:
+        """Release the reference taken by on_model_change when the model is not saved with it."""
+        stored_logo = getattr(request.state, 'stored_logo', None)
+        request.state.stored_logo = None
+        if self.logo_storage is not None and stored_logo:
+            await self.logo_storage.release([stored_logo])
+
+    async def insert_model(self, request: Request, data: dict) -> Any:
+        try:
+            return await super().insert_model(request, data)
+        except Exception:
+            await self._release_stored_logo(request)
+            raise
+
+    async def update_model(self, request: Request, pk: str, data: dict) -> Any:
+        try:
+            return await super().update_model(request, pk, data)
+        except Exception:
+            await self._release_stored_logo(request)
+            raise
+
+    async def after_model_change(self, data: dict, model: Any, is_created: bool, request: Request) -> None:
+        """Release the reference to the logo that was replaced or cleared."""
+        # Saved with the model, the reference is kept from here on
+        request.state.stored_logo = None
+        replaced_logo = getattr(request.state, 'replaced_logo', None)
+        if self.logo_storage is not None and replaced_logo:
+            try:
+                await self.logo_storage.delete(replaced_logo)
+            except Exception as e:
+                logger.error(f"Error releasing replaced logo {replaced_logo} of {self.name}: {str(e)}")
+
     async def _handle_file_upload(self, field_name: str, file: UploadFile):
         if isinstance(file, UploadFile):
             content = await file.read()
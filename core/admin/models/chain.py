@@ -1,6 +1,6 @@
 from typing import Any
 
-from fastapi import HTTPException, UploadFile
+from fastapi import HTTPException
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 from starlette.requests import Request
@@ -20,6 +20,8 @@ class ChainAdmin(BaseAdminModel, model=Chain):
     column_filters = [Chain.is_active, Chain.name]
     column_details_list = ['name', 'is_active', 'id', 'logo', 'coins', 'coin_pool_offers']
 
+    logo_storage = chain_storage
+
     form_columns = ['name', 'coins', 'is_active', 'logo']
     form_args = {
         'name': {'validators': [validators.DataRequired()]},
@@ -67,20 +69,7 @@ class ChainAdmin(BaseAdminModel, model=Chain):
         try:
             action = "Created" if is_created else "Updated"
             logger.info(f"{action} Chain successfully with id: {model.id}")
-
-            # Process logo upload
-            logo = data.get('logo')
-            if logo and isinstance(logo, UploadFile):
-                try:
-                    file_path = await chain_storage.put(logo)
-                    model.logo = file_path
-                    logger.info(f"Logo uploaded for chain: {model.name}")
-
-                    async with self.session as session:
-                        await session.merge(model)
-                        await session.commit()
-                except Exception as e:
-                    logger.error(f"Error uploading logo for chain {model.name}: {str(e)}")
+            await super().after_model_change(data, model, is_created, request)
         except Exception as e:
             logger.error(f"Error in after_model_change for {self.name}: {str(e)}")
             raise HTTPException(status_code=500,
@@ -90,7 +79,7 @@ class ChainAdmin(BaseAdminModel, model=Chain):
         model = await self.get_one(pk)
         if model and model.logo:
             try:
-                chain_storage.delete(model.logo)
+                await chain_storage.delete(model.logo)
                 logger.info(f"Logo deleted for chain: {model.name}")
             except Exception as e:
                 logger.error(f"Error deleting logo for chain {model.name}: {str(e)}")
@@ -1,4 +1,4 @@
-from fastapi import HTTPException, UploadFile
+from fastapi import HTTPException
 from starlette.requests import Request
 from wtforms import validators
 from wtforms.fields import FileField
@@ -14,6 +14,8 @@ class ClickerAdmin(BaseAdminModel, model=Clicker):
     column_sortable_list = ["name", "coin", "audience", "app_launch_date", "token_launch_date"]
     column_filters = ["coin", "app_launch_date", "token_launch_date", "is_active"]
 
+    logo_storage = clicker_storage
+
     form_columns = [
         "name", "description", "time_spent", "link", "audience", "coin",
         "app_launch_date", "token_launch_date", "telegram_channel", "partners", "comment", "is_active", "logo"
@@ -41,20 +43,7 @@ class ClickerAdmin(BaseAdminModel, model=Clicker):
         try:
             action = "Created" if is_created else "Updated"
             logger.info(f"{action} Clicker successfully with id: {model.id}")
-
-            # Process logo upload
-            logo = data.get('logo')
-            if logo and isinstance(logo, UploadFile):
-                try:
-                    file_path = await clicker_storage.put(logo)
-                    model.logo = file_path
-                    logger.info(f"Logo uploaded for clicker: {model.name}")
-
-                    async with self.session as session:
-                        await session.merge(model)
-                        await session.commit()
-                except Exception as e:
-                    logger.error(f"Error uploading logo for clicker {model.name}: {str(e)}")
+            await super().after_model_change(data, model, is_created, request)
         except Exception as e:
             logger.error(f"Error in after_model_change for {self.name}: {str(e)}")
             raise HTTPException(status_code=500,
@@ -64,7 +53,7 @@ class ClickerAdmin(BaseAdminModel, model=Clicker):
         model = await self.get_one(pk)
         if model and model.logo:
             try:
-                clicker_storage.delete(model.logo)
+                await clicker_storage.delete(model.logo)
                 logger.info(f"Logo deleted for clicker: {model.name}")
             except Exception as e:
                 logger.error(f"Error deleting logo for clicker {model.name}: {str(e)}")
@@ -1,6 +1,6 @@
 from typing import Any
 
-from fastapi import HTTPException, UploadFile
+from fastapi import HTTPException
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 from starlette.requests import Request
@@ -20,6 +20,8 @@ class CoinAdmin(BaseAdminModel, model=Coin):
     column_filters = [Coin.is_active, Coin.name, Coin.code]
     column_details_list = ['name', 'code', 'is_active', 'id', 'logo', 'chains', 'pools', 'coin_id_for_price_getter']
 
+    logo_storage = coin_storage
+
     form_columns = ['name', 'code', 'chains', 'is_active', 'logo', 'coin_id_for_price_getter']
     form_args = {
         'name': {'validators': [validators.Optional()]},
@@ -73,20 +75,7 @@ class CoinAdmin(BaseAdminModel, model=Coin):
         try:
             action = "Created" if is_created else "Updated"
             logger.info(f"{action} Coin successfully with id: {model.id}")
-
-            # Process logo upload
-            logo = data.get('logo')
-            if logo and isinstance(logo, UploadFile):
-                try:
-                    file_path = await coin_storage.put(logo)
-                    model.logo = file_path
-                    logger.info(f"Logo uploaded for coin: {model.name}")
-
-                    async with self.session as session:
-                        await session.merge(model)
-                        await session.commit()
-                except Exception as e:
-                    logger.error(f"Error uploading logo for coin {model.name}: {str(e)}")
+            await super().after_model_change(data, model, is_created, request)
         except Exception as e:
             logger.error(f"Error in after_model_change for {self.name}: {str(e)}")
             raise HTTPException(status_code=500, detail=f"An unexpected error occurred while create/update {self.name}. Error: {str(e)}")
@@ -95,7 +84,7 @@ class CoinAdmin(BaseAdminModel, model=Coin):
         model = await self.get_one(pk)
         if model and model.logo:
             try:
-                coin_storage.delete(model.logo)
+                await coin_storage.delete(model.logo)
                 logger.info(f"Logo deleted for coin: {model.name}")
             except Exception as e:
                 logger.error(f"Error deleting logo for coin {model.name}: {str(e)}")
@@ -27,7 +27,7 @@ def validate_lock_period(form, field):
 
 class CoinPoolOfferAdmin(BaseAdminModel, model=CoinPoolOffer):
     column_list = [
-        'pool', 'chain', 'coin', CoinPoolOffer.created_at, CoinPoolOffer.is_active,
+        'pool', 'chain', 'coin', CoinPoolOffer.created_at, CoinPoolOffer.valid_to, CoinPoolOffer.is_active,
         CoinPoolOffer.lock_period, CoinPoolOffer.apr, CoinPoolOffer.fee, CoinPoolOffer.amount_from,
         CoinPoolOffer.pool_share, CoinPoolOffer.liquidity_token,
         CoinPoolOffer.liquidity_token_name, CoinPoolOffer.id,
@@ -38,7 +38,7 @@ class CoinPoolOfferAdmin(BaseAdminModel, model=CoinPoolOffer):
         'chain': lambda m, a: str(m.chain) if m.chain else None,
     }
     column_sortable_list = [
-        CoinPoolOffer.apr, CoinPoolOffer.created_at,
+        CoinPoolOffer.apr, CoinPoolOffer.created_at, CoinPoolOffer.valid_to,
         CoinPoolOffer.amount_from, CoinPoolOffer.lock_period,
         CoinPoolOffer.pool_share, CoinPoolOffer.liquidity_token,
         CoinPoolOffer.liquidity_token_name, CoinPoolOffer.is_active,
@@ -49,7 +49,7 @@ class CoinPoolOfferAdmin(BaseAdminModel, model=CoinPoolOffer):
                               CoinPoolOffer.coin_id, CoinPoolOffer.pool_id, CoinPoolOffer.chain_id,
                               CoinPoolOffer.id]
     column_filters = [
-        CoinPoolOffer.apr, CoinPoolOffer.created_at,
+        CoinPoolOffer.apr, CoinPoolOffer.created_at, CoinPoolOffer.valid_to,
         CoinPoolOffer.amount_from, CoinPoolOffer.lock_period,
         CoinPoolOffer.pool_share, CoinPoolOffer.liquidity_token,
         CoinPoolOffer.liquidity_token_name, CoinPoolOffer.is_active,
@@ -57,7 +57,7 @@ class CoinPoolOfferAdmin(BaseAdminModel, model=CoinPoolOffer):
     ]
 
     column_details_list = [
-        'pool', 'chain', 'coin', 'is_active', 'lock_period', 'created_at', 'apr', 'amount_from', 'pool_share',
+        'pool', 'chain', 'coin', 'is_active', 'lock_period', 'created_at', 'valid_to', 'apr', 'amount_from', 'pool_share',
         'liquidity_token', 'liquidity_token_name', 'id',
     ]
 
@@ -2,7 +2,7 @@ from typing import Any
 from starlette.requests import Request
 from wtforms import validators
 from wtforms.fields import FileField
-from fastapi import HTTPException, UploadFile
+from fastapi import HTTPException
 
 from core.models import Pool
 from core import logger, pool_storage
@@ -16,6 +16,8 @@ class PoolAdmin(BaseAdminModel, model=Pool):
     column_filters = [Pool.is_active, Pool.name, Pool.parsing_source]
     column_details_list = ['name', 'website_url', 'is_active', 'id', 'logo', 'parsing_source', 'coin_pool_offers']
 
+    logo_storage = pool_storage
+
     form_columns = ['name', 'website_url', 'is_active', 'logo', 'parsing_source']
     form_args = {
         'name': {'validators': [validators.DataRequired()]},
@@ -33,21 +35,7 @@ class PoolAdmin(BaseAdminModel, model=Pool):
         try:
             action = "Created" if is_created else "Updated"
             logger.info(f"{action} Pool successfully with id: {model.id}")
-
-            # Process logo upload
-            logo = data.get('logo')
-            if logo and isinstance(logo, UploadFile):
-                try:
-                    file_path = await pool_storage.put(logo)
-                    model.logo = file_path
-                    logger.info(f"Logo uploaded for pool: {model.name}")
-
-                    async with self.session as session:
-                        await session.merge(model)
-                        await session.commit()
-
-                except Exception as e:
-                    logger.error(f"Error uploading logo for pool {model.name}: {str(e)}")
+            await super().after_model_change(data, model, is_created, request)
         except Exception as e:
             logger.error(f"Error in after_model_change for {self.name}: {str(e)}")
             raise HTTPException(status_code=500, detail=f"An unexpected error occurred while create/update {self.name}. Error: {str(e)}")
@@ -56,7 +44,7 @@ class PoolAdmin(BaseAdminModel, model=Pool):
         model = await self.get_one(pk)
         if model and model.logo:
             try:
-                pool_storage.delete(model.logo)
+                await pool_storage.delete(model.logo)
                 logger.info(f"Logo deleted for pool: {model.name}")
             except Exception as e:
                 logger.error(f"Error deleting logo for pool {model.name}: {str(e)}")
@@ -37,9 +37,42 @@ DATA_UPD_OFFERS_TIME_RANDOM_MINUTE_FORM_TUPLE = os.getenv("DATA_UPD_OFFERS_TIME_
 
 # Scraper ENV variables
 SCRAPER_DEBUG = os.getenv("SCRAPER_DEBUG", "False").lower() in ('true', '1')
+SCRAPER_REPLAY_MODE = os.getenv("SCRAPER_REPLAY_MODE", "off").lower()  # off / record / replay
+SCRAPER_FIXTURES_DIR = os.getenv("SCRAPER_FIXTURES_DIR", os.path.join(os.getcwd(), "scraping_fixtures"))
+SCRAPER_REPLAY_URL = os.getenv("SCRAPER_REPLAY_URL", "http://127.0.0.1:8765")
+SCRAPER_WORKER_JOB_TIMEOUT = int(os.getenv("SCRAPER_WORKER_JOB_TIMEOUT", 3600))
+SCRAPER_WORKER_PAGE_JOB_TIMEOUT = int(os.getenv("SCRAPER_WORKER_PAGE_JOB_TIMEOUT", 180))
+SCRAPER_DRIVER_POOL_SIZE = int(os.getenv("SCRAPER_DRIVER_POOL_SIZE", 1))
+SCRAPER_DRIVER_MAX_PAGES = int(os.getenv("SCRAPER_DRIVER_MAX_PAGES", 50))
+SCRAPER_BROWSER_WORKERS = int(os.getenv("SCRAPER_BROWSER_WORKERS", 3))
+SCRAPER_DOMAIN_MAX_CONCURRENCY = int(os.getenv("SCRAPER_DOMAIN_MAX_CONCURRENCY", 2))
+SCRAPER_DOMAIN_MIN_INTERVAL = float(os.getenv("SCRAPER_DOMAIN_MIN_INTERVAL", 1.0))
+SCRAPER_EXTERNAL_LINK_WORKERS = int(os.getenv("SCRAPER_EXTERNAL_LINK_WORKERS", 4))
+SCRAPER_HTTP_TIMEOUT = int(os.getenv("SCRAPER_HTTP_TIMEOUT", 10))
+SCRAPER_IMAGE_DOWNLOAD_CONCURRENCY = int(os.getenv("SCRAPER_IMAGE_DOWNLOAD_CONCURRENCY", 16))
+SCRAPER_IMAGE_MAX_BYTES = int(os.getenv("SCRAPER_IMAGE_MAX_BYTES", 2 * 1024 * 1024))
+SCRAPER_BLOCKING_PROFILE_VALIDATOR_INFO = os.getenv("SCRAPER_BLOCKING_PROFILE_VALIDATOR_INFO", "minimal").lower()
+SCRAPER_BLOCKING_PROFILE_DEFILLAMA = os.getenv("SCRAPER_BLOCKING_PROFILE_DEFILLAMA", "minimal").lower()
+SCRAPER_USE_XVFB = os.getenv("SCRAPER_USE_XVFB", "False").lower() in ('true', '1')
+SCRAPER_WEBSITE_CACHE_TTL_DAYS = int(os.getenv("SCRAPER_WEBSITE_CACHE_TTL_DAYS", 30))
+SCRAPER_WEBSITE_CACHE_NEGATIVE_TTL_DAYS = int(os.getenv("SCRAPER_WEBSITE_CACHE_NEGATIVE_TTL_DAYS", 7))
+SCRAPER_DEFILLAMA_MODE = os.getenv("SCRAPER_DEFILLAMA_MODE", "browser").lower()  # browser / json
+SCRAPER_PROCESSED_DATA_EXPORT = os.getenv("SCRAPER_PROCESSED_DATA_EXPORT", "none").lower()  # none / csv / parquet
+SCRAPER_OFFER_STORAGE_MODE = os.getenv("SCRAPER_OFFER_STORAGE_MODE", "append").lower()  # append / ranges
+SCRAPER_OFFER_RANGE_PRECISION = int(os.getenv("SCRAPER_OFFER_RANGE_PRECISION", 2))
+
+# Chromedriver ENV variables
+CHROME_DRIVER_PATH = os.getenv("CHROME_DRIVER_PATH", "/usr/local/bin/chromedriver")
+CHROME_DRIVER_VERSION = os.getenv("CHROME_DRIVER_VERSION") or None
+CHROME_DRIVER_CACHE_DIR = os.getenv("CHROME_DRIVER_CACHE_DIR", os.path.join(os.getcwd(), ".chromedriver"))
 
 MEDIA_FILES_ALLOWED_EXTENSIONS = os.getenv("MEDIA_FILES_ALLOWED_EXTENSIONS",
                                            ['.jpg', '.jpeg', '.png', '.gif', '.svg', '.ico', '.webp'])
+MEDIA_CACHE_MAX_AGE = int(os.getenv("MEDIA_CACHE_MAX_AGE", 31536000))
+MEDIA_LEGACY_CACHE_MAX_AGE = int(os.getenv("MEDIA_LEGACY_CACHE_MAX_AGE", 3600))
+MEDIA_LOGO_VARIANT_SIZES = [int(size) for size in os.getenv("MEDIA_LOGO_VARIANT_SIZES", "32,64,128").split(",")]
+MEDIA_LOGO_WORKERS = int(os.getenv("MEDIA_LOGO_WORKERS", 2))
+MEDIA_LOGO_BUNDLE_MAX_AGE = int(os.getenv("MEDIA_LOGO_BUNDLE_MAX_AGE", 60))
 
 # TG Log cache helping ENV variables
 USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", 6))
@@ -100,6 +133,11 @@ class MediaConfig(BaseModel):
     chains_path: str = "/app/media/chains"
     clickers_path: str = "/app/media/clickers"
     allowed_image_extensions: List[str] = list(MEDIA_FILES_ALLOWED_EXTENSIONS)
+    cache_max_age: int = MEDIA_CACHE_MAX_AGE
+    legacy_cache_max_age: int = MEDIA_LEGACY_CACHE_MAX_AGE
+    logo_variant_sizes: List[int] = MEDIA_LOGO_VARIANT_SIZES
+    logo_workers: int = MEDIA_LOGO_WORKERS
+    logo_bundle_max_age: int = MEDIA_LOGO_BUNDLE_MAX_AGE
 
     @field_validator('coins_path', 'pools_path', 'chains_path')
     def validate_path(cls, v):
@@ -107,6 +145,18 @@ class MediaConfig(BaseModel):
             raise ValueError("Path must be absolute")
         return v
 
+    @field_validator('logo_variant_sizes')
+    def validate_variant_sizes(cls, v):
+        if not all(size > 0 for size in v):
+            raise ValueError("Logo variant sizes must be positive")
+        return sorted(set(v))
+
+    @field_validator('logo_workers')
+    def validate_logo_workers(cls, v):
+        if v < 1:
+            raise ValueError("Logo workers must be at least 1")
+        return v
+
     @field_validator('allowed_image_extensions')
     def validate_extensions(cls, v):
         if not all(ext.startswith('.') for ext in v):
@@ -115,13 +165,82 @@ class MediaConfig(BaseModel):
 
 
 class ChromeConfig(BaseModel):
-    path: str = os.path.abspath("/usr/local/bin/chromedriver")
+    path: str = os.path.abspath(CHROME_DRIVER_PATH)
+    driver_version: str | None = CHROME_DRIVER_VERSION  # Pinned chromedriver version, e.g. 129.0.6668.89
+    cache_dir: str = CHROME_DRIVER_CACHE_DIR  # webdriver_manager cache of downloaded drivers
 
 
 class ScraperConfig(BaseModel):
     base_dir: str = os.path.join(os.getcwd(), "collected_data")
     processed_data_dir: str = os.path.join(base_dir, "processed_data")
     debug_conf: bool = SCRAPER_DEBUG
+    replay_mode: str = SCRAPER_REPLAY_MODE  # Record pages to fixtures or replay them from a local stand-in server
+    fixtures_dir: str = SCRAPER_FIXTURES_DIR
+    replay_url: str = SCRAPER_REPLAY_URL
+    worker_job_timeout: int = SCRAPER_WORKER_JOB_TIMEOUT  # Seconds to wait for a single job of the scraping worker process
+    worker_page_job_timeout: int = SCRAPER_WORKER_PAGE_JOB_TIMEOUT  # Seconds to wait for a job that reads a single page
+    driver_pool_size: int = SCRAPER_DRIVER_POOL_SIZE  # Max browsers per driver pool
+    driver_max_pages: int = SCRAPER_DRIVER_MAX_PAGES  # Pages loaded by a pooled browser before it is recycled
+    browser_workers: int = SCRAPER_BROWSER_WORKERS  # validator.info chains scraped in parallel
+    domain_max_concurrency: int = SCRAPER_DOMAIN_MAX_CONCURRENCY  # Simultaneous page loads per domain
+    domain_min_interval: float = SCRAPER_DOMAIN_MIN_INTERVAL  # Seconds between page load starts on one domain
+    external_link_workers: int = SCRAPER_EXTERNAL_LINK_WORKERS  # Validator pages resolved concurrently per chain
+    http_timeout: int = SCRAPER_HTTP_TIMEOUT  # Seconds per plain HTTP request of the scrapers
+    image_download_concurrency: int = SCRAPER_IMAGE_DOWNLOAD_CONCURRENCY  # Logos downloaded in parallel
+    image_max_bytes: int = SCRAPER_IMAGE_MAX_BYTES  # Larger logos are rejected
+    # Resources blocked in scraper browsers: none / third_party / minimal
+    blocking_profile_validator_info: str = SCRAPER_BLOCKING_PROFILE_VALIDATOR_INFO
+    blocking_profile_defillama: str = SCRAPER_BLOCKING_PROFILE_DEFILLAMA
+    use_xvfb: bool = SCRAPER_USE_XVFB  # Run DefiLlama Chrome headed in Xvfb instead of new headless mode
+    website_cache_ttl_days: int = SCRAPER_WEBSITE_CACHE_TTL_DAYS  # Found DefiLlama validator websites
+    website_cache_negative_ttl_days: int = SCRAPER_WEBSITE_CACHE_NEGATIVE_TTL_DAYS  # Validators without a website
+    defillama_mode: str = SCRAPER_DEFILLAMA_MODE  # Read DefiLlama page JSON over HTTP or scroll the table in a browser
+    processed_data_export: str = SCRAPER_PROCESSED_DATA_EXPORT  # Side copy of the processed validator.info tables
+    offer_storage_mode: str = SCRAPER_OFFER_STORAGE_MODE  # A row per scraped offer, or a row per change of its values
+    offer_range_precision: int = SCRAPER_OFFER_RANGE_PRECISION  # Decimals of APR, fee and pool share compared in ranges mode
+
+    @field_validator('driver_pool_size', 'driver_max_pages', 'browser_workers', 'domain_max_concurrency',
+                     'worker_job_timeout', 'worker_page_job_timeout', 'external_link_workers', 'http_timeout', 'image_download_concurrency', 'image_max_bytes')
+    def validate_positive_int(cls, v):
+        if v <= 0:
+            raise ValueError("Must be a positive integer")
+        return v
+
+    @field_validator('replay_mode')
+    def validate_replay_mode(cls, v):
+        if v not in ("off", "record", "replay"):
+            raise ValueError("replay_mode must be one of: off, record, replay")
+        return v
+
+    @field_validator('blocking_profile_validator_info', 'blocking_profile_defillama')
+    def validate_blocking_profile(cls, v):
+        if v not in ("none", "third_party", "minimal"):
+            raise ValueError("blocking profile must be one of: none, third_party, minimal")
+        return v
+
+    @field_validator('defillama_mode')
+    def validate_defillama_mode(cls, v):
+        if v not in ("json", "browser"):
+            raise ValueError("defillama_mode must be one of: json, browser")
+        return v
+
+    @field_validator('processed_data_export')
+    def validate_processed_data_export(cls, v):
+        if v not in ("none", "csv", "parquet"):
+            raise ValueError("processed_data_export must be one of: none, csv, parquet")
+        return v
+
+    @field_validator('offer_storage_mode')
+    def validate_offer_storage_mode(cls, v):
+        if v not in ("append", "ranges"):
+            raise ValueError("offer_storage_mode must be one of: append, ranges")
+        return v
+
+    @field_validator('offer_range_precision')
+    def validate_offer_range_precision(cls, v):
+        if v < 0:
+            raise ValueError("offer_range_precision must not be negative")
+        return v
 
     @staticmethod
     def ensure_dir(directory):
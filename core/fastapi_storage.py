@@ -1,35 +1,255 @@
+import asyncio
+import hashlib
+import io
+import json
 import os
-from typing import Optional, List
+import re
+import threading
+import uuid
+from contextlib import contextmanager
+from typing import AsyncIterator, BinaryIO, Dict, Iterable, Optional, List
 
+import aiofiles
+import aiofiles.os
 from fastapi import UploadFile
 from fastapi_storages import FileSystemStorage
 
 from core import settings, logger
 
+try:
+    import fcntl
+except ImportError:  # Not on Windows, reference counts are then only guarded within one process
+    fcntl = None
+
+
+CHUNK_SIZE = 64 * 1024
+# One small file per stored file holds its reference count, so an update never rewrites the others
+REFCOUNTS_DIR = ".refs"
+# Single index of all counts written by earlier versions, split into REFCOUNTS_DIR on first use
+LEGACY_REFCOUNTS_FILE = ".refcounts.json"
+# Locked while reference counts are updated, shared by every process using the directory
+REFCOUNTS_LOCK_FILE = ".refcounts.lock"
+# Precompressed variants served for SVGs, in order of preference: encoding -> file suffix
+COMPRESSED_VARIANTS = {"br": ".br", "gzip": ".gz"}
+CONTENT_HASH_NAME_RE = re.compile(r"^[0-9a-f]{64}(\.[a-z0-9]+)?$")
+
+LOGO_VARIANT_NAME_RE = re.compile(r"^[0-9a-f]{64}_\d+\.webp$")
+
+
+def is_content_addressed(name: str) -> bool:
+    return bool(CONTENT_HASH_NAME_RE.match(os.path.basename(name)))
+
+
+def is_logo_variant(name: str) -> bool:
+    return bool(LOGO_VARIANT_NAME_RE.match(os.path.basename(name)))
+
+
+def logo_variant_name(name: str, size: int) -> str:
+    """Name of the resized WebP variant of a content-addressed logo."""
+    return f"{os.path.splitext(os.path.basename(name))[0]}_{size}.webp"
+
+
+class _AlreadyStored(io.BytesIO):
+    """File object of a StoredFile. FileType only reads one byte from it to check it is not empty."""
+
+
+class StoredFile:
+    """
+    A file already written to the storage, assigned to a FileType column without writing it again:
+
+        name = await pool_storage.put_stream(filename, chunks)
+        pool.logo = StoredFile(name)
+    """
+
+    def __init__(self, name: str):
+        self.filename = name
+        self.file = _AlreadyStored(b"\0")
+
 
 class CustomFileSystemStorage(FileSystemStorage):
+    """
+    Content-addressed file storage.
+
+    Files are stored under the sha256 of their content, so identical images are stored once
+    and a stored name never changes content. References to every file are counted in a small sidecar file
+    of its own, a file is removed from the disk with its last reference. Count updates hold a file lock, so the API,
+    the admin and every worker process sharing the directory see each other's changes.
+    """
+
     def __init__(self, root_path: str, allowed_extensions: Optional[List[str]] = None):
         self.root_path = root_path
         self.allowed_extensions = allowed_extensions or []
+        self._refs_lock = threading.Lock()
+        self._legacy_refcounts_checked = False
         super().__init__(self.root_path)
 
     async def put(self, file: UploadFile) -> str:
-        if not self._check_extension(file.filename):
+        async def chunks():
+            while chunk := await file.read(CHUNK_SIZE):
+                yield chunk
+
+        return await self.put_stream(file.filename, chunks())
+
+    async def put_stream(self, filename: str, chunks: AsyncIterator[bytes], max_bytes: Optional[int] = None) -> str:
+        """
+        Write a file from an async stream of chunks without buffering it in memory or blocking the event loop.
+
+        The content hash is computed while streaming into a temporary file, which is then renamed
+        to the hash name, or dropped if that content is already stored. Every call adds one reference
+        to the stored file. Returns the stored name.
+        """
+        if not self._check_extension(filename):
             raise ValueError(f"File extension not allowed. Allowed extensions: {', '.join(self.allowed_extensions)}")
 
+        await aiofiles.os.makedirs(self.root_path, exist_ok=True)
+        temp_path = os.path.join(self.root_path, f".{uuid.uuid4().hex}.part")
+        digest = hashlib.sha256()
+
+        size = 0
+        try:
+            async with aiofiles.open(temp_path, "wb") as f:
+                async for chunk in chunks:
+                    size += len(chunk)
+                    if max_bytes is not None and size > max_bytes:
+                        raise ValueError(f"File {filename} exceeds the size limit of {max_bytes} bytes")
+                    digest.update(chunk)
+                    await f.write(chunk)
+            if not size:
+                raise ValueError(f"File {filename} is empty")
+
+            name = f"{digest.hexdigest()}{os.path.splitext(filename)[1].lower()}"
+            await asyncio.to_thread(self._add_blob, temp_path, name)
+        except BaseException:
+            await asyncio.to_thread(self._remove_if_exists, temp_path)
+            raise
+
+        return name
+
+    def write(self, file: BinaryIO, name: str) -> str:
+        """
+        Synchronous write used by FileType when a model is flushed with a new file.
+        The file is copied in chunks into a temporary file that is renamed into place.
+        """
+        if isinstance(file, _AlreadyStored):
+            return os.path.join(self.root_path, self.get_name(name))
+
         os.makedirs(self.root_path, exist_ok=True)
-        full_path = os.path.join(self.root_path, file.filename)
+        full_path = os.path.join(self.root_path, self.get_name(name))
+        temp_path = os.path.join(self.root_path, f".{uuid.uuid4().hex}.part")
+        try:
+            file.seek(0, 0)
+            with open(temp_path, "wb") as output:
+                while chunk := file.read(CHUNK_SIZE):
+                    output.write(chunk)
+            os.replace(temp_path, full_path)
+        except BaseException:
+            self._remove_if_exists(temp_path)
+            raise
+        return full_path
+
+    async def exists(self, name: str) -> bool:
+        return await aiofiles.os.path.exists(os.path.join(self.root_path, os.path.basename(name)))
 
-        content = await file.read()
-        with open(full_path, "wb") as f:
-            f.write(content)
+    async def delete(self, name: str) -> None:
+        """
+        Release one reference to a file. Content-addressed files are removed with their last reference,
+        together with their compressed and resized variants. Files stored under their original name are removed right away.
+        """
+        await asyncio.to_thread(self._release, os.path.basename(name))
 
-        return file.filename
+    async def release(self, names: Iterable[str]) -> None:
+        """Release one reference to each file, e.g. of files stored for a transaction that was rolled back."""
+        for name in names:
+            try:
+                await self.delete(name)
+            except Exception as e:
+                logger.error(f"Error releasing {name} in {self.root_path}: {str(e)}")
 
-    def delete(self, name: str) -> None:
+    def _add_blob(self, temp_path: str, name: str) -> None:
+        """Move a written temporary file to its content-addressed name and add a reference to it."""
         full_path = os.path.join(self.root_path, name)
-        if os.path.exists(full_path):
-            os.remove(full_path)
+        with self._locked_refcounts():
+            if os.path.exists(full_path):
+                os.remove(temp_path)
+            else:
+                os.replace(temp_path, full_path)
+            self._change_refcount(name, 1)
+
+    def _release(self, name: str) -> None:
+        full_path = os.path.join(self.root_path, name)
+        with self._locked_refcounts():
+            if is_content_addressed(name) and self._change_refcount(name, -1) > 0:
+                return
+            derived = [full_path + suffix for suffix in COMPRESSED_VARIANTS.values()]
+            derived += [os.path.join(self.root_path, logo_variant_name(name, size))
+                        for size in settings.media.logo_variant_sizes]
+            for path in [full_path] + derived:
+                self._remove_if_exists(path)
+
+    @contextmanager
+    def _locked_refcounts(self):
+        """Hold the reference counts lock of this process and the file lock shared with other processes."""
+        with self._refs_lock:
+            if fcntl is None:
+                self._split_legacy_refcounts()
+                yield
+                return
+            os.makedirs(self.root_path, exist_ok=True)
+            with open(os.path.join(self.root_path, REFCOUNTS_LOCK_FILE), "a") as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    self._split_legacy_refcounts()
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    @staticmethod
+    def _remove_if_exists(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _read_refcount(self, name: str) -> int:
+        try:
+            with open(os.path.join(self.root_path, REFCOUNTS_DIR, name)) as f:
+                return int(f.read().strip() or 0)
+        except FileNotFoundError:
+            return 0
+
+    def _write_refcount(self, name: str, count: int) -> None:
+        """Write a count atomically and durably: a crash leaves the old count or the new one, never a torn file."""
+        path = os.path.join(self.root_path, REFCOUNTS_DIR, name)
+        if count <= 0:
+            self._remove_if_exists(path)
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{uuid.uuid4().hex}.part"
+        with open(temp_path, "w") as f:
+            f.write(str(count))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+
+    def _change_refcount(self, name: str, delta: int) -> int:
+        """Add delta to the references of a file and return the new count. Callers hold _locked_refcounts."""
+        count = self._read_refcount(name) + delta
+        self._write_refcount(name, count)
+        return count
+
+    def _split_legacy_refcounts(self) -> None:
+        """Move the counts of a legacy single index into per-file counts. Callers hold the refs lock."""
+        if self._legacy_refcounts_checked:
+            return
+        path = os.path.join(self.root_path, LEGACY_REFCOUNTS_FILE)
+        if os.path.exists(path):
+            with open(path) as f:
+                refcounts: Dict[str, int] = json.load(f)
+            for name, count in refcounts.items():
+                self._write_refcount(name, self._read_refcount(name) + count)
+            os.remove(path)
+            logger.info(f"Moved {len(refcounts)} reference counts of {self.root_path} to {REFCOUNTS_DIR}")
+        self._legacy_refcounts_checked = True
 
     def _check_extension(self, filename: str) -> bool:
         if not self.allowed_extensions:
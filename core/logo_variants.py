@@ -0,0 +1,128 @@
+"""
+Resized WebP variants of stored logos.
+
+Every content-addressed raster logo gets small WebP variants at the sizes of settings.media.logo_variant_sizes,
+stored next to the original as `<hash>_<size>.webp`; the original is kept. Decoding and resizing run in a
+process pool, off the event loop. SVGs, and files Pillow can't read, only have their original.
+"""
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set
+
+from PIL import Image
+
+from core import settings, logger
+from core.fastapi_storage import CustomFileSystemStorage, is_content_addressed, logo_variant_name
+
+
+RASTER_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".ico", ".webp"}
+WEBP_QUALITY = 85
+
+_executor: Optional[ProcessPoolExecutor] = None
+# Logo full path -> {size: variant full path}, only for logos that have all variants.
+# Content-addressed logos never change, so a complete lookup is done once
+_variants_cache: Dict[str, Dict[int, str]] = {}
+
+
+def _render_variants(full_path: str, sizes: List[int]) -> List[int]:
+    """Runs in the process pool. Writes the missing variants of a logo, returns the sizes that exist."""
+    with Image.open(full_path) as image:
+        image = image.convert("RGBA")
+        for size in sizes:
+            variant_path = os.path.join(os.path.dirname(full_path), logo_variant_name(full_path, size))
+            if os.path.exists(variant_path):
+                continue
+            variant = image.copy()
+            variant.thumbnail((size, size), Image.Resampling.LANCZOS)
+            temp_path = f"{variant_path}.{os.getpid()}.part"
+            variant.save(temp_path, "WEBP", quality=WEBP_QUALITY, method=6)
+            os.replace(temp_path, variant_path)
+    return sizes
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=settings.media.logo_workers,
+                                        mp_context=multiprocessing.get_context("spawn"))
+    return _executor
+
+
+def _needs_variants(name: str) -> bool:
+    return is_content_addressed(name) and os.path.splitext(name)[1].lower() in RASTER_EXTENSIONS
+
+
+async def create_logo_variants(storage: CustomFileSystemStorage, names: Iterable[str]) -> None:
+    """Create the WebP variants of stored logos in the process pool. Failures are logged, never raised."""
+    sizes = settings.media.logo_variant_sizes
+    paths = [os.path.join(storage.root_path, os.path.basename(name)) for name in names if _needs_variants(name)]
+    if not paths:
+        return
+
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(
+        *(loop.run_in_executor(_get_executor(), _render_variants, path, sizes) for path in paths),
+        return_exceptions=True,
+    )
+    for path, result in zip(paths, results):
+        if isinstance(result, Exception):
+            logger.error(f"Error creating logo variants of {path}: {str(result)}")
+        _variants_cache.pop(path, None)
+
+
+def _list_stored(root_path: str) -> Set[str]:
+    """Names of the files of a storage directory, empty if it doesn't exist yet."""
+    try:
+        return set(os.listdir(root_path))
+    except FileNotFoundError:
+        return set()
+
+
+async def backfill_logo_variants(storages: Iterable[CustomFileSystemStorage]) -> None:
+    """Create the missing variants of logos stored before variants existed, or by a failed run."""
+    sizes = settings.media.logo_variant_sizes
+    for storage in storages:
+        # Listing a large media directory blocks, keep it off the event loop
+        existing = await asyncio.to_thread(_list_stored, storage.root_path)
+        missing = [name for name in existing if _needs_variants(name)
+                   and any(logo_variant_name(name, size) not in existing for size in sizes)]
+        if missing:
+            logger.info(f"Creating logo variants for {len(missing)} logos in {storage.root_path}")
+            await create_logo_variants(storage, missing)
+
+
+def logo_variant_paths(logo_path: Optional[str]) -> Dict[int, str]:
+    """Full paths of the existing WebP variants of a stored logo, by pixel size."""
+    if not logo_path or not _needs_variants(logo_path):
+        return {}
+
+    variants = _variants_cache.get(logo_path)
+    if variants is None:
+        variants = {}
+        for size in settings.media.logo_variant_sizes:
+            variant_path = os.path.join(os.path.dirname(logo_path), logo_variant_name(logo_path, size))
+            if os.path.exists(variant_path):
+                variants[size] = variant_path
+        if len(variants) == len(settings.media.logo_variant_sizes):
+            # Missing variants may still be created, by the backfill or another process
+            _variants_cache[logo_path] = variants
+    return variants
+
+
+def logo_variant_urls(logo_path: Optional[str]) -> Dict[str, str]:
+    """Public URLs of the existing WebP variants of a stored logo, by pixel size."""
+    urls = {}
+    for size, variant_path in logo_variant_paths(logo_path).items():
+        if variant_path.startswith("/app/"):
+            variant_path = variant_path[4:]  # Remove "/app" prefix
+        urls[str(size)] = variant_path
+    return urls
+
+
+def close_logo_processing() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
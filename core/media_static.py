@@ -0,0 +1,169 @@
+"""
+Static serving of the media directories.
+
+Content-addressed logos and their resized variants never change, so they are served with an immutable Cache-Control, and their
+path lookup and stat are done once and kept in memory; ETag and Last-Modified come from the cached stat.
+A logo can still be deleted with its last reference: the file is opened before the response starts,
+and a missing file drops the cached entry and is answered with a 404.
+SVG logos are also served gzip or brotli compressed, from variants written next to the file on first request.
+Files with original names from earlier versions are served as before, with a short max-age.
+"""
+import gzip
+import os
+import stat
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Tuple
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, PlainTextResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Receive, Scope, Send
+
+from core import settings, logger
+from core.fastapi_storage import is_content_addressed, is_logo_variant, COMPRESSED_VARIANTS
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, SVGs are then only served gzipped
+    brotli = None
+
+
+COMPRESSORS = {
+    "br": (lambda data: brotli.compress(data)) if brotli else None,
+    "gzip": lambda data: gzip.compress(data, mtime=0),
+}
+COMPRESSIBLE_EXTENSIONS = {".svg"}
+
+
+@dataclass
+class _MediaEntry:
+    # Accepted encoding ('' for identity) -> (full path, stat) of the file to send
+    variants: Dict[str, Tuple[str, os.stat_result]] = field(default_factory=dict)
+
+
+class _CachedFileResponse(FileResponse):
+    """FileResponse from a cached stat that opens the file before sending headers, so a deleted file is a 404."""
+
+    def __init__(self, *args, on_missing: Callable[[], None], **kwargs):
+        super().__init__(*args, **kwargs)
+        self.on_missing = on_missing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            file = await anyio.open_file(self.path, mode="rb")
+        except OSError:
+            self.on_missing()
+            await PlainTextResponse("Not Found", status_code=404)(scope, receive, send)
+            return
+
+        async with file:
+            await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+            if scope["method"].upper() == "HEAD":
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+            else:
+                more_body = True
+                while more_body:
+                    chunk = await file.read(self.chunk_size)
+                    more_body = len(chunk) == self.chunk_size
+                    await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+        if self.background is not None:
+            await self.background()
+
+
+class MediaStaticFiles(StaticFiles):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._entries: Dict[str, _MediaEntry] = {}
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        name = os.path.basename(path)
+        if any(part.startswith(".") for part in path.replace("\\", "/").split("/")):
+            # Reference counts and partial uploads are not media
+            raise HTTPException(status_code=404)
+
+        immutable = is_content_addressed(name) or is_logo_variant(name)
+        if not immutable or scope["method"] not in ("GET", "HEAD"):
+            response = await super().get_response(path, scope)
+            if response.status_code in (200, 304):
+                response.headers["Cache-Control"] = f"public, max-age={settings.media.legacy_cache_max_age}"
+            return response
+
+        entry = self._entries.get(path)
+        if entry is None:
+            entry = await anyio.to_thread.run_sync(self._load_entry, path)
+            if entry is None:
+                raise HTTPException(status_code=404)
+            self._entries[path] = entry
+
+        encoding = self._pick_encoding(scope, entry)
+        full_path, stat_result = entry.variants[encoding]
+        # Deleted with its last reference since it was cached: forget it, the next request looks it up again
+        response = _CachedFileResponse(full_path, stat_result=stat_result,
+                                       on_missing=lambda: self._entries.pop(path, None))
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            response = NotModifiedResponse(response.headers)
+        response.headers["Cache-Control"] = f"public, max-age={settings.media.cache_max_age}, immutable"
+        if len(entry.variants) > 1:
+            response.headers["Vary"] = "Accept-Encoding"
+        if encoding:
+            response.headers["Content-Encoding"] = encoding
+            response.headers["Content-Type"] = "image/svg+xml"
+        return response
+
+    def _load_entry(self, path: str) -> Optional[_MediaEntry]:
+        full_path, stat_result = self.lookup_path(path)
+        if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+            return None
+
+        entry = _MediaEntry(variants={"": (full_path, stat_result)})
+        if os.path.splitext(full_path)[1].lower() in COMPRESSIBLE_EXTENSIONS:
+            for encoding, suffix in COMPRESSED_VARIANTS.items():
+                variant = self._compressed_variant(full_path, stat_result, encoding, suffix)
+                if variant:
+                    entry.variants[encoding] = variant
+        return entry
+
+    @staticmethod
+    def _compressed_variant(full_path: str, stat_result: os.stat_result, encoding: str, suffix: str):
+        """The compressed variant of a file, written on first use. None if it would not be smaller."""
+        compress = COMPRESSORS.get(encoding)
+        if compress is None:
+            return None
+
+        variant_path = full_path + suffix
+        try:
+            if not os.path.exists(variant_path):
+                with open(full_path, "rb") as f:
+                    data = compress(f.read())
+                temp_path = f"{variant_path}.{os.getpid()}.part"
+                with open(temp_path, "wb") as f:
+                    f.write(data)
+                os.replace(temp_path, variant_path)
+            variant_stat = os.stat(variant_path)
+        except OSError as e:
+            logger.error(f"Error creating {encoding} variant of {full_path}: {str(e)}")
+            return None
+
+        if variant_stat.st_size >= stat_result.st_size:
+            return None
+        return variant_path, variant_stat
+
+    @staticmethod
+    def _pick_encoding(scope: Scope, entry: _MediaEntry) -> str:
+        if len(entry.variants) == 1:
+            return ""
+
+        accepted = set()
+        for header, value in scope["headers"]:
+            if header == b"accept-encoding":
+                for token in value.decode("latin-1").split(","):
+                    coding, _, params = token.strip().partition(";")
+                    if params.replace(" ", "") not in ("q=0", "q=0.0"):
+                        accepted.add(coding.strip().lower())
+
+        for encoding in COMPRESSED_VARIANTS:
+            if encoding in entry.variants and encoding in accepted:
+                return encoding
+        return ""
@@ -13,6 +13,7 @@ __all__ = [
     'check_and_update_tables',
     'WelcomeMessage',
     'check_table',
+    'ValidatorWebsiteCache',
 ]
 
 from .db_helper import db_helper
@@ -26,3 +27,4 @@ from .coin_price import CoinPrice
 from .clicker import Clicker
 from .tg_log import TgUser, TgUserLog, check_and_update_tables
 from .tg_welcome_message import WelcomeMessage, check_table
+from .validator_website_cache import ValidatorWebsiteCache
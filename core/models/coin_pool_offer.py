@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
-from sqlalchemy import UUID, ForeignKey, Float, Integer, Boolean, String, DateTime, func
+from sqlalchemy import UUID, ForeignKey, Float, Integer, Boolean, String, DateTime, Index, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from .base import Base
@@ -12,6 +12,11 @@ if TYPE_CHECKING:
 
 
 class CoinPoolOffer(Base):
+    __table_args__ = (
+        # Current row of every offer: DISTINCT ON the offer key, newest first
+        Index("ix_coin_pool_offers_offer_key_created_at",
+              "pool_id", "coin_id", "chain_id", "lock_period", text("created_at DESC")),
+    )
 
     coin_id: Mapped[UUID] = mapped_column(ForeignKey("coins.id", ondelete="CASCADE"), nullable=False)
     coin: Mapped["Coin"] = relationship("Coin", back_populates="pools", lazy="joined")
@@ -39,6 +44,14 @@ class CoinPoolOffer(Base):
         DateTime(timezone=True),
         server_default=func.now(),
         nullable=False
+    )  # valid from
+
+    # Last time the offer was seen with these values. Equal to created_at when every scrape adds a row,
+    # extended by scrapes that find the same values with SCRAPER_OFFER_STORAGE_MODE=ranges
+    valid_to: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
     )
 
     @validates('liquidity_token_name')
@@ -0,0 +1,30 @@
+from datetime import datetime
+
+from sqlalchemy import String, DateTime, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class ValidatorWebsiteCache(Base):
+    """
+    Result of resolving a DefiLlama validator's website with the browser.
+
+    website_url is None for validators without a discoverable website (negative result),
+    so they are not visited again until the negative TTL expires.
+    """
+    name: Mapped[str] = mapped_column(String, nullable=False, unique=True)
+    validator_link: Mapped[str] = mapped_column(String, nullable=True)
+    website_url: Mapped[str] = mapped_column(String, nullable=True)
+
+    checked_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+
+    def __repr__(self):
+        return f"ValidatorWebsiteCache(name='{self.name}', website_url={self.website_url}, checked_at={self.checked_at})"
+
+    def __str__(self):
+        return f"{self.name}: {self.website_url or 'not found'}"
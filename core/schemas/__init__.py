@@ -1,7 +1,7 @@
 _all_ = ["ChainResponse", "CoinResponse", "PoolResponse", "OfferResponse",
          "OfferResponseWithHistory", "OfferHistory", "CoinExtendedResponse",
          "ClickerResponse", "PaginatedOfferResponse", "PaginationMetadata",
-         "TgUserCreate", "TgUserLogCreate"]
+         "TgUserCreate", "TgUserLogCreate", "LogoBundleResponse"]
 
 from .chain import ChainResponse
 from .coin import CoinResponse, CoinExtendedResponse
@@ -10,3 +10,4 @@ from .offer import OfferResponse
 from .offer import OfferResponseWithHistory, OfferHistory, PaginatedOfferResponse, PaginationMetadata
 from .clicker import ClickerResponse
 from .tg_log import TgUserCreate, TgUserLogCreate
+from .logo import LogoBundleResponse
@@ -1,13 +1,15 @@
-from typing import Optional
+from typing import Dict, Optional
 
 from pydantic import Field
 
+from core.logo_variants import logo_variant_urls
 from .base import BaseResponse
 
 
 class ChainResponse(BaseResponse):
     name: str
     logo: Optional[str] = Field(None, )
+    logo_variants: Dict[str, str] = Field(default_factory=dict, description="WebP logo variants by pixel size")
 
     @classmethod
     def model_validate(cls, obj, **kwargs):
@@ -18,4 +20,5 @@ class ChainResponse(BaseResponse):
             id=obj.id,
             name=obj.name,
             logo=logo_path,
+            logo_variants=logo_variant_urls(obj.logo),
         )
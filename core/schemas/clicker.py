@@ -1,8 +1,10 @@
-from typing import Optional
+from typing import Dict, Optional
 from pydantic import BaseModel, Field
 from datetime import date
 from uuid import UUID
 
+from core.logo_variants import logo_variant_urls
+
 
 class ClickerResponse(BaseModel):
     id: UUID
@@ -18,6 +20,7 @@ class ClickerResponse(BaseModel):
     partners: Optional[str]
     comment: Optional[str]
     logo: Optional[str] = Field(None, description="Path to the logo image")
+    logo_variants: Dict[str, str] = Field(default_factory=dict, description="WebP logo variants by pixel size")
 
     class Config:
         from_attributes = True
@@ -41,4 +44,5 @@ class ClickerResponse(BaseModel):
             partners=obj.partners,
             comment=obj.comment,
             logo=logo_path,
+            logo_variants=logo_variant_urls(obj.logo),
         )
@@ -1,7 +1,8 @@
-from typing import Optional
+from typing import Dict, Optional
 
 from pydantic import Field
 
+from core.logo_variants import logo_variant_urls
 from .base import BaseResponse
 
 
@@ -9,6 +10,7 @@ class CoinResponse(BaseResponse):
     name: Optional[str]
     code: str
     logo: Optional[str] = Field(None, )
+    logo_variants: Dict[str, str] = Field(default_factory=dict, description="WebP logo variants by pixel size")
     current_price: Optional[float] = Field(None, description="Current price of the coin")
 
     @classmethod
@@ -21,6 +23,7 @@ class CoinResponse(BaseResponse):
             name=obj.name,
             code=obj.code,
             logo=logo_path,
+            logo_variants=logo_variant_urls(obj.logo),
             current_price=obj.latest_price.price if obj.latest_price else None,
         )
 
@@ -0,0 +1,9 @@
+from typing import Dict
+
+from pydantic import BaseModel, Field
+
+
+class LogoBundleResponse(BaseModel):
+    coins: Dict[str, str] = Field(default_factory=dict, description="Logo data URIs by coin ID")
+    chains: Dict[str, str] = Field(default_factory=dict, description="Logo data URIs by chain ID")
+    pools: Dict[str, str] = Field(default_factory=dict, description="Logo data URIs by pool ID")
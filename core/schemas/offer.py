@@ -20,6 +20,7 @@ class OfferResponse(BaseResponse):
     liquidity_token: bool
     liquidity_token_name: Optional[str]
     created_at: datetime
+    valid_to: datetime
 
     @classmethod
     def model_validate(cls, obj, **kwargs):
@@ -36,6 +37,7 @@ class OfferResponse(BaseResponse):
             liquidity_token=obj.liquidity_token,
             liquidity_token_name=obj.liquidity_token_name,
             created_at=obj.created_at,
+            valid_to=obj.valid_to,
         )
 
 
@@ -56,6 +58,7 @@ class OfferHistory(BaseResponse):
     amount_from: Optional[float]
     pool_share: Optional[float]
     created_at: datetime
+    valid_to: datetime = Field(description="Last time the offer was seen with these values")
     historical_coin_price: Optional[float] = Field(None, description="Coin price at the time of offer creation")
 
     @classmethod
@@ -66,6 +69,7 @@ class OfferHistory(BaseResponse):
             amount_from=obj.amount_from,
             pool_share=obj.pool_share,
             created_at=obj.created_at,
+            valid_to=obj.valid_to,
             historical_coin_price=obj.historical_coin_price if hasattr(obj, 'historical_coin_price') else None
         )
 
@@ -1,7 +1,8 @@
-from typing import Optional
+from typing import Dict, Optional
 
 from pydantic import Field
 
+from core.logo_variants import logo_variant_urls
 from .base import BaseResponse
 
 
@@ -9,6 +10,7 @@ class PoolResponse(BaseResponse):
     name: str
     website_url: str
     logo: Optional[str] = Field(None, )
+    logo_variants: Dict[str, str] = Field(default_factory=dict, description="WebP logo variants by pixel size")
 
     @classmethod
     def model_validate(cls, obj, **kwargs):
@@ -20,4 +22,5 @@ class PoolResponse(BaseResponse):
             name=obj.name,
             website_url=obj.website_url,
             logo=logo_path,
+            logo_variants=logo_variant_urls(obj.logo),
         )
@@ -6,7 +6,6 @@ import asyncio
 from icecream import ic
 
 from fastapi.responses import ORJSONResponse, JSONResponse
-from fastapi.staticfiles import StaticFiles
 from fastapi import FastAPI, Response, Request
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -17,11 +16,14 @@ from core.admin import async_sqladmin_db_helper, sqladmin_authentication_backend
 from core.models import db_helper, check_and_update_tables
 from core.admin.models import setup_admin
 from core import settings, logger
+from core.media_static import MediaStaticFiles
+from core.logo_variants import backfill_logo_variants, close_logo_processing
+from core import coin_storage, pool_storage, chain_storage, clicker_storage
 from api import api_router
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from services import update_coin_prices
-from scraping import run_parsing_with_delay
+from scraping import run_parsing_with_delay, scraping_worker, close_http_session
 
 from clickers_services import init_clickers
 
@@ -67,11 +69,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:  # not used: ign
     # Start the bot in a separate task
     bot_task = asyncio.create_task(start_bot())
 
+    # Create the resized variants of logos that don't have them yet
+    logo_variants_task = asyncio.create_task(
+        backfill_logo_variants([coin_storage, pool_storage, chain_storage, clicker_storage]))
+
     yield
 
     # Shutdown
     logger.info("Shutting down the FastAPI application...")
     scheduler.shutdown()
+    await asyncio.to_thread(scraping_worker.stop)
+    await close_http_session()
+    logo_variants_task.cancel()
+    close_logo_processing()
     await db_helper.dispose()
     await async_sqladmin_db_helper.dispose()
 
@@ -97,10 +107,10 @@ setup_admin(admin)
 main_app.include_router(api_router, prefix=settings.api.prefix)
 
 # Mount static file directories
-main_app.mount("/media/coins", StaticFiles(directory=settings.media.coins_path), name="coins_media")
-main_app.mount("/media/pools", StaticFiles(directory=settings.media.pools_path), name="pools_media")
-main_app.mount("/media/chains", StaticFiles(directory=settings.media.chains_path), name="chains_media")
-main_app.mount("/media/clickers", StaticFiles(directory=settings.media.clickers_path), name="clickers_media")
+main_app.mount("/media/coins", MediaStaticFiles(directory=settings.media.coins_path), name="coins_media")
+main_app.mount("/media/pools", MediaStaticFiles(directory=settings.media.pools_path), name="pools_media")
+main_app.mount("/media/chains", MediaStaticFiles(directory=settings.media.chains_path), name="chains_media")
+main_app.mount("/media/clickers", MediaStaticFiles(directory=settings.media.clickers_path), name="clickers_media")
 
 
 # Favicon.ico errors silenced
@@ -1,9 +1,14 @@
 __all__ = [
+    'close_http_session',
+    'get_http_session',
     'logger',
     'run_parsing',
     'run_parsing_with_delay',
+    'scraping_worker',
 ]
 
 from .logger import logger
+from .http_client import get_http_session, close_http_session
 from .run_parsing import run_parsing
 from .run_parsing_with_random_wait_before import run_parsing_with_delay
+from .worker import scraping_worker
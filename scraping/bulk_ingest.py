@@ -0,0 +1,207 @@
+"""
+Set-based ingestion of scraped pools and offers.
+
+Writes are one statement per batch instead of one per object: pools are upserted by their unique name,
+offers go in through multi-row INSERTs, logos are set with one executemany UPDATE and missing pools are
+deactivated with one UPDATE. The number of round trips of a run does not grow with the number of validators.
+
+With settings.scraper.offer_storage_mode "ranges" an offer row covers the range of scrapes that found the same
+values, from its created_at to its valid_to: unchanged offers only move valid_to, changed ones open a new row.
+"""
+from typing import Any, Dict, Iterable, List, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import insert, select, update, func, literal_column, true
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.models import Pool, CoinPoolOffer, coin_chain
+from scraping.logger import logger
+
+
+# Rows per statement, keeps the bind parameters of a multi-row INSERT well under the asyncpg limit of 32767
+BATCH_SIZE = 1000
+
+# Columns that identify an offer across scrapes, and the values whose change opens a new row in "ranges" mode
+# The key is in the column order of ix_coin_pool_offers_offer_key_created_at
+OFFER_KEY_COLUMNS = ("pool_id", "coin_id", "chain_id", "lock_period")
+OFFER_VALUE_DEFAULTS = {
+    "apr": None,
+    "fee": None,
+    "pool_share": None,
+    "amount_from": None,
+    "liquidity_token": False,
+    "liquidity_token_name": None,
+}
+
+
+def _batches(rows: List[Dict[str, Any]]):
+    for start in range(0, len(rows), BATCH_SIZE):
+        yield rows[start:start + BATCH_SIZE]
+
+
+async def upsert_pools(session: AsyncSession, pools: List[Dict[str, Any]]) -> Tuple[Dict[str, UUID], Set[str]]:
+    """
+    Insert pools by their unique name. Pools that already exist, from any source, are left unchanged.
+
+    Args:
+        pools: Column values of every pool, all with the same keys.
+
+    Returns:
+        tuple: ({name: id} of all given pools, names of the pools that were created)
+    """
+    ids, created = {}, set()
+    for batch in _batches(pools):
+        statement = pg_insert(Pool).values(batch)
+        statement = (
+            # A no-op update on conflict, so RETURNING also yields the ids of existing pools
+            statement.on_conflict_do_update(index_elements=[Pool.name], set_={"name": statement.excluded.name})
+            .returning(Pool.name, Pool.id, literal_column("xmax = 0").label("inserted"))
+        )
+        result = await session.execute(statement)
+        for name, pool_id, inserted in result.all():
+            ids[name] = pool_id
+            if inserted:
+                created.add(name)
+
+    logger.info(f"Upserted {len(pools)} pools, {len(created)} created")
+    return ids, created
+
+
+async def set_pool_logos(session: AsyncSession, logos: Dict[UUID, Any]) -> None:
+    """Set the logos of pools by id in one executemany UPDATE."""
+    if logos:
+        await session.execute(update(Pool), [{"id": pool_id, "logo": logo} for pool_id, logo in logos.items()])
+
+
+async def insert_offers(session: AsyncSession, offers: List[Dict[str, Any]]) -> int:
+    """
+    Insert offers with multi-row INSERTs.
+
+    Args:
+        offers: Column values of every offer, all with the same keys.
+
+    Returns:
+        int: Number of inserted offers.
+    """
+    for batch in _batches(offers):
+        await session.execute(insert(CoinPoolOffer).values(batch))
+    return len(offers)
+
+
+def _same_value(stored: Any, scraped: Any) -> bool:
+    """Numbers are equal when they round to the same value at settings.scraper.offer_range_precision."""
+    if isinstance(stored, float) or isinstance(scraped, float):
+        if stored is None or scraped is None:
+            return stored is scraped
+        precision = settings.scraper.offer_range_precision
+        return round(stored, precision) == round(scraped, precision)
+    return stored == scraped
+
+
+async def _current_offers(session: AsyncSession, pool_ids: Set[UUID]) -> Dict[Tuple, Any]:
+    """
+    Latest offer row of every offer key of the given pools, active or not.
+    The same rule as get_latest_offers of the API, which shows the newest row of a key only if it is active.
+    """
+    key_columns = [getattr(CoinPoolOffer, column) for column in OFFER_KEY_COLUMNS]
+    value_columns = [getattr(CoinPoolOffer, column) for column in OFFER_VALUE_DEFAULTS]
+    pool_ids = list(pool_ids)
+
+    current = {}
+    for start in range(0, len(pool_ids), BATCH_SIZE):
+        result = await session.execute(
+            select(CoinPoolOffer.id, CoinPoolOffer.is_active, *key_columns, *value_columns)
+            .distinct(*key_columns)
+            .where(CoinPoolOffer.pool_id.in_(pool_ids[start:start + BATCH_SIZE]))
+            .order_by(*key_columns, CoinPoolOffer.created_at.desc())
+        )
+        for row in result.all():
+            current[tuple(getattr(row, column) for column in OFFER_KEY_COLUMNS)] = row
+    return current
+
+
+async def store_offers(session: AsyncSession, offers: List[Dict[str, Any]]) -> int:
+    """
+    Store scraped offers the way settings.scraper.offer_storage_mode asks for.
+
+    "append" inserts every offer. "ranges" extends the valid_to of the current row of offers whose values
+    did not change at the shown precision, with one UPDATE per batch, and inserts only new and changed offers.
+
+    Args:
+        offers: Column values of every offer, all with the same keys.
+
+    Returns:
+        int: Number of inserted offers.
+    """
+    if settings.scraper.offer_storage_mode == "append":
+        return await insert_offers(session, offers)
+
+    current = await _current_offers(session, {offer["pool_id"] for offer in offers})
+    unchanged_ids, changed = [], []
+    for offer in offers:
+        row = current.get(tuple(offer[column] for column in OFFER_KEY_COLUMNS))
+        # A deactivated current row is never extended, the offer gets a new active row as in "append" mode
+        if row is not None and row.is_active and all(_same_value(getattr(row, column), offer.get(column, default))
+                                                     for column, default in OFFER_VALUE_DEFAULTS.items()):
+            unchanged_ids.append(row.id)
+        else:
+            changed.append(offer)
+
+    for start in range(0, len(unchanged_ids), BATCH_SIZE):
+        await session.execute(
+            update(CoinPoolOffer)
+            .where(CoinPoolOffer.id.in_(unchanged_ids[start:start + BATCH_SIZE]))
+            .values(valid_to=func.now())
+            .execution_options(synchronize_session=False)
+        )
+
+    logger.info(f"{len(unchanged_ids)} offers unchanged, valid_to extended. {len(changed)} new or changed offers")
+    return await insert_offers(session, changed)
+
+
+async def deactivate_missing_pools(session: AsyncSession, parsing_source: str, seen_names: Iterable[str]) -> List[str]:
+    """
+    Deactivate the active pools of a source that were not seen in this run, in one UPDATE.
+
+    Returns:
+        list: Names of the deactivated pools.
+    """
+    seen_names = list(seen_names)
+    if not seen_names:
+        logger.warning(f"No {parsing_source} pools were seen in this run, none are deactivated")
+        return []
+
+    result = await session.execute(
+        update(Pool)
+        .where(Pool.parsing_source == parsing_source, Pool.is_active == true(), Pool.name.not_in(seen_names))
+        .values(is_active=False)
+        .returning(Pool.name)
+        .execution_options(synchronize_session=False)
+    )
+    names = list(result.scalars().all())
+    for name in names:
+        logger.warning(f"Pool deactivated: {name}, Not found in {parsing_source}")
+    return names
+
+
+async def link_coins_to_chains(session: AsyncSession, pairs: Iterable[Tuple[UUID, UUID]]) -> int:
+    """
+    Create the missing coin-chain associations in one INSERT.
+
+    Args:
+        pairs: (coin id, chain id) pairs.
+
+    Returns:
+        int: Number of created associations.
+    """
+    rows = [{"coin_id": coin_id, "chain_id": chain_id} for coin_id, chain_id in pairs]
+    if not rows:
+        return 0
+    result = await session.execute(
+        pg_insert(coin_chain).values(rows)
+        .on_conflict_do_nothing(constraint="uq_coin_chain")
+        .returning(coin_chain.c.id)
+    )
+    return len(result.all())
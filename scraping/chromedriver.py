@@ -0,0 +1,55 @@
+import glob
+import os
+from functools import lru_cache
+from typing import Optional
+
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.driver_cache import DriverCacheManager
+
+from scraping.logger import logger
+from core.config import settings
+
+
+def _is_executable(path: Optional[str]) -> bool:
+    return bool(path) and os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+def _find_cached_driver(cache_dir: str, version: str) -> Optional[str]:
+    """Look up a pinned chromedriver version in the webdriver_manager cache layout, without network."""
+    pattern = os.path.join(cache_dir, ".wdm", "drivers", "chromedriver", "*", version, "**", "chromedriver")
+    for path in sorted(glob.glob(pattern, recursive=True)):
+        if _is_executable(path):
+            return path
+    return None
+
+
+@lru_cache(maxsize=1)
+def resolve_chromedriver_path() -> str:
+    """
+    Resolve the chromedriver binary once per process.
+
+    Lookup order:
+    1. `settings.chrome.path` if it points to an executable.
+    2. The pinned `settings.chrome.driver_version` in the local cache `settings.chrome.cache_dir`.
+    3. Download of the pinned version into that cache (or of the latest version if nothing is pinned).
+    """
+    chrome = settings.chrome
+
+    if _is_executable(chrome.path):
+        logger.info(f"Using configured chromedriver: {chrome.path}")
+        return chrome.path
+
+    if chrome.driver_version:
+        cached = _find_cached_driver(chrome.cache_dir, chrome.driver_version)
+        if cached:
+            logger.info(f"Using cached chromedriver {chrome.driver_version}: {cached}")
+            return cached
+
+    logger.warning(f"Chromedriver {chrome.driver_version or 'latest'} not found locally, downloading it "
+                   f"to {chrome.cache_dir}")
+    path = ChromeDriverManager(
+        driver_version=chrome.driver_version,
+        cache_manager=DriverCacheManager(root_dir=chrome.cache_dir),
+    ).install()
+    logger.info(f"Chromedriver installed: {path}")
+    return path
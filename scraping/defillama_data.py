@@ -0,0 +1,178 @@
+"""
+Browser-less DefiLlama LSD data.
+
+The /lsd page is a Next.js page: the table is rendered from the JSON embedded in
+<script id="__NEXT_DATA__">. Reading that payload over plain HTTP gives the same records
+as scrolling the rendered table, without starting Chrome.
+
+The payload keys and units are not a public API. Record the page together with the rows of the browser
+scraper (SCRAPER_REPLAY_MODE=record, SCRAPER_DEFILLAMA_MODE=browser) and run tests/test_defillama_data.py
+against the recording before relying on SCRAPER_DEFILLAMA_MODE=json.
+"""
+import asyncio
+import json
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+import aiohttp
+
+from scraping.logger import logger
+from scraping.replay import resolve_url, record_response, FixtureStore
+from core.config import settings
+from scraping.http_client import get_http_session
+
+
+NEXT_DATA_RE = re.compile(r'<script id="__NEXT_DATA__" type="application/json"[^>]*>(.*?)</script>', re.DOTALL)
+
+PROTOCOL_URL = "https://defillama.com/protocol/{slug}"
+PROTOCOL_ICON_URL = "https://icons.llamao.fi/icons/protocols/{slug}?w=48&h=48"
+
+# Table columns in the order of the scraped tuples, with the keys they are known under in the payload
+COLUMN_KEYS = {
+    "staked_eth": ("stakedEth",),
+    "tvl": ("stakedEthInUsd", "tvl"),
+    "change_7d": ("stakedEthPctChange7d", "change_7d"),
+    "change_30d": ("stakedEthPctChange30d", "change_30d", "change_1m"),
+    "market_share": ("marketShare",),
+    "lsd": ("lsdSymbol", "symbol"),
+    "eth_peg": ("ethPeg",),
+    "mcap_tvl": ("mcapOverTvl", "mcaptvl"),
+    "lsd_apr": ("apy", "apr"),
+    "fee": ("fee",),
+}
+
+PERCENT_COLUMNS = {"change_7d", "change_30d", "market_share", "eth_peg", "lsd_apr", "fee"}
+
+# Percent columns that are stored with the offers. The payload may hold them as fractions (0.05 for 5%),
+# which is detected per page: market shares add up to 1 instead of 100, APRs and fees are all below 1
+STORED_PERCENT_COLUMNS = ("market_share", "lsd_apr", "fee")
+
+# Query string of the fixture with the rows of the browser scraper, recorded next to the page
+BROWSER_ROWS_QUERY = "scraped_rows=browser"
+
+
+def slugify(name: str) -> str:
+    """DefiLlama protocol slug: lowercase, spaces replaced by dashes."""
+    return name.strip().lower().replace(" ", "-")
+
+
+def _first(item: Dict[str, Any], keys: Iterable[str]) -> Any:
+    for key in keys:
+        if item.get(key) is not None:
+            return item[key]
+    return None
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _percent_scale(column: str, values: List[Any]) -> int:
+    """100 when the numeric values of a stored percent column are fractions, 1 when they are percents."""
+    numbers = [value for value in values if _is_number(value)]
+    if column not in STORED_PERCENT_COLUMNS or not numbers or not any(numbers):
+        return 1
+    if column == "market_share":
+        return 100 if sum(numbers) <= 1.5 else 1
+    return 100 if max(abs(number) for number in numbers) <= 1 else 1
+
+
+def _format(value: Any, percent: bool, scale: int = 1) -> str:
+    """Format a payload value like the rendered table cell, so the existing cleaning applies unchanged."""
+    if value is None or value == "":
+        return ""
+    if _is_number(value):
+        return f"{value * scale:.2f}%" if percent else f"{value:,.2f}"
+    return str(value).strip()
+
+
+def _find_protocol_rows(node: Any) -> Optional[List[Dict[str, Any]]]:
+    """Depth-first search of the page props for the list of protocol records."""
+    if isinstance(node, list):
+        if node and all(isinstance(item, dict) for item in node) and \
+                all("name" in item and "stakedEth" in item for item in node):
+            return node
+        for item in node:
+            found = _find_protocol_rows(item)
+            if found:
+                return found
+    elif isinstance(node, dict):
+        for value in node.values():
+            found = _find_protocol_rows(value)
+            if found:
+                return found
+    return None
+
+
+def parse_lsd_page(html: str) -> List[tuple]:
+    """
+    Parse the /lsd page HTML into the 13-field tuples produced by the Selenium scraper:
+    (name, validator link, image link, staked ETH, TVL, 7d change, 30d change,
+    market share, LSD, ETH peg, Mcap/TVL, LSD APR, fee).
+    """
+    match = NEXT_DATA_RE.search(html)
+    if not match:
+        logger.warning("DefiLlama: __NEXT_DATA__ payload not found")
+        return []
+
+    try:
+        payload = json.loads(match.group(1))
+    except json.JSONDecodeError as e:
+        logger.error(f"DefiLlama: error decoding __NEXT_DATA__: {str(e)}")
+        return []
+
+    rows = _find_protocol_rows(payload.get("props", {}).get("pageProps", {}))
+    if not rows:
+        logger.warning("DefiLlama: no protocol records in __NEXT_DATA__")
+        return []
+
+    values = {column: [_first(item, keys) for item in rows] for column, keys in COLUMN_KEYS.items()}
+    if not any(_is_number(value) for value in values["lsd_apr"]):
+        # Without APRs there is nothing to store, the browser scraper is used instead
+        logger.warning("DefiLlama: no APR values in __NEXT_DATA__, the payload format may have changed")
+        return []
+
+    scales = {column: _percent_scale(column, column_values) for column, column_values in values.items()}
+    for column in STORED_PERCENT_COLUMNS:
+        if scales[column] != 1:
+            logger.info(f"DefiLlama: {column} is given as fractions in __NEXT_DATA__, scaled to percents")
+
+    data = []
+    for index, item in enumerate(rows):
+        name = str(item["name"]).strip()
+        slug = item.get("slug") or slugify(name)
+        logo = item.get("logo") or PROTOCOL_ICON_URL.format(slug=slug)
+        columns = [_format(values[column][index], column in PERCENT_COLUMNS, scales[column]) for column in COLUMN_KEYS]
+        data.append((name, PROTOCOL_URL.format(slug=slug), logo, *columns))
+
+    return data
+
+
+def browser_rows_url(url: str) -> str:
+    """Fixture URL of the browser scraper rows of a page."""
+    return f"{url}?{BROWSER_ROWS_QUERY}"
+
+
+def record_browser_rows(url: str, rows: List[tuple]) -> None:
+    """Store the rows of the browser scraper next to the recorded page when record mode is on."""
+    if settings.scraper.replay_mode == "record" and rows:
+        FixtureStore(settings.scraper.fixtures_dir).save(
+            browser_rows_url(url), json.dumps([list(row) for row in rows]).encode("utf-8"),
+            content_type="application/json",
+        )
+
+
+async def fetch_lsd_rows(url: str) -> List[tuple]:
+    """Fetch the /lsd page over HTTP and parse its records. Returns an empty list on any failure."""
+    try:
+        async with get_http_session().get(resolve_url(url)) as response:
+            if response.status != 200:
+                logger.warning(f"DefiLlama: HTTP {response.status} for {url}")
+                return []
+            body = await response.read()
+            record_response(url, body, response.content_type)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.warning(f"DefiLlama: error fetching {url}: {str(e)}")
+        return []
+
+    return parse_lsd_page(body.decode("utf-8", errors="replace"))
@@ -0,0 +1,173 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+from scraping.logger import logger
+from core.config import settings
+
+
+class PooledDriver:
+    def __init__(self, driver: webdriver.Chrome):
+        self.driver = driver
+        self.pages = 0
+        self.created_at = time.monotonic()
+
+
+class DriverPool:
+    """
+    Pool of reusable Chrome drivers with lifecycle management.
+
+    - Drivers are health-checked before being lent out, dead ones are replaced.
+    - A driver is recycled after `max_pages` borrows, so memory leaks of long-lived browsers don't pile up.
+    - A driver that raised a WebDriverException while borrowed is discarded (crash recovery).
+    - At most `max_size` drivers exist at the same time, extra borrowers wait.
+
+    Every borrow is counted as one page, so scrapers should borrow a driver per page load.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], webdriver.Chrome], max_size: int, max_pages: int,
+                 on_close: Optional[Callable[[], None]] = None):
+        self.name = name
+        self.factory = factory
+        self.max_size = max_size
+        self.max_pages = max_pages
+        self.on_close = on_close
+        self.idle: List[PooledDriver] = []
+        self.total = 0
+        self.condition = threading.Condition()
+
+    @staticmethod
+    def _is_healthy(pooled: PooledDriver) -> bool:
+        try:
+            return pooled.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit(pooled: PooledDriver) -> None:
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            logger.warning(f"Error quitting driver: {str(e)}")
+
+    def _discard(self, pooled: PooledDriver) -> None:
+        self._quit(pooled)
+        with self.condition:
+            self.total -= 1
+            self.condition.notify()
+
+    def _acquire(self) -> PooledDriver:
+        while True:
+            with self.condition:
+                while not self.idle and self.total >= self.max_size:
+                    self.condition.wait()
+                if self.idle:
+                    pooled = self.idle.pop()
+                else:
+                    self.total += 1
+                    pooled = None
+
+            if pooled is None:
+                try:
+                    started = time.perf_counter()
+                    pooled = PooledDriver(self.factory())
+                    logger.info(f"Driver pool '{self.name}': started a new browser in "
+                                f"{time.perf_counter() - started:.2f}s")
+                    return pooled
+                except Exception:
+                    with self.condition:
+                        self.total -= 1
+                        self.condition.notify()
+                    raise
+
+            if self._is_healthy(pooled):
+                return pooled
+
+            logger.warning(f"Driver pool '{self.name}': unhealthy browser discarded.")
+            self._discard(pooled)
+
+    def _release(self, pooled: PooledDriver, broken: bool) -> None:
+        pooled.pages += 1
+
+        if broken:
+            logger.warning(f"Driver pool '{self.name}': browser crashed, it will be replaced.")
+            self._discard(pooled)
+            return
+
+        if pooled.pages >= self.max_pages:
+            logger.info(f"Driver pool '{self.name}': recycling browser after {pooled.pages} pages.")
+            self._discard(pooled)
+            return
+
+        try:
+            # Leave a clean browser for the next borrower
+            handles = pooled.driver.window_handles
+            for handle in handles[1:]:
+                pooled.driver.switch_to.window(handle)
+                pooled.driver.close()
+            pooled.driver.switch_to.window(handles[0])
+            pooled.driver.get("about:blank")
+            pooled.driver.delete_all_cookies()
+        except Exception:
+            self._discard(pooled)
+            return
+
+        with self.condition:
+            self.idle.append(pooled)
+            self.condition.notify()
+
+    @contextmanager
+    def borrow(self):
+        pooled = self._acquire()
+        broken = False
+        try:
+            yield pooled.driver
+        except WebDriverException:
+            broken = not self._is_healthy(pooled)
+            raise
+        finally:
+            self._release(pooled, broken)
+
+    def close(self) -> None:
+        with self.condition:
+            idle, self.idle = self.idle, []
+            self.total -= len(idle)
+        for pooled in idle:
+            self._quit(pooled)
+        if self.on_close:
+            self.on_close()
+        logger.info(f"Driver pool '{self.name}' closed.")
+
+
+_pools: Dict[str, DriverPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_driver_pool(name: str, factory: Callable[[], webdriver.Chrome],
+                    on_close: Optional[Callable[[], None]] = None) -> DriverPool:
+    """Return the process-wide pool with this name, creating it on first use."""
+    with _pools_lock:
+        pool = _pools.get(name)
+        if pool is None:
+            pool = DriverPool(
+                name=name,
+                factory=factory,
+                # Parallel browser workers beyond this size wait for a free driver
+                max_size=settings.scraper.driver_pool_size,
+                max_pages=settings.scraper.driver_max_pages,
+                on_close=on_close,
+            )
+            _pools[name] = pool
+        return pool
+
+
+def close_driver_pools() -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
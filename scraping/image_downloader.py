@@ -0,0 +1,81 @@
+"""
+Async logo downloads straight into media storage.
+
+All images are downloaded in parallel on the shared scraping HTTP session, bounded by a semaphore
+and the per-host connection limit of the session. Bodies are streamed into the storage with a size cap,
+there is no temporary file or full in-memory copy.
+"""
+import asyncio
+import os
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import aiohttp
+
+from scraping.logger import logger
+from scraping.http_client import get_http_session
+from scraping.replay import resolve_url, record_response
+from core.config import settings
+from core.fastapi_storage import CustomFileSystemStorage
+
+
+CHUNK_SIZE = 64 * 1024
+
+
+def image_extension(url: str, default: str = ".png") -> str:
+    extension = os.path.splitext(urlparse(url).path)[1].lower()
+    return extension if extension in settings.media.allowed_image_extensions else default
+
+
+async def download_image(url: str, filename: str, storage: CustomFileSystemStorage) -> Optional[str]:
+    """Stream one image into the storage. Returns the stored name, or None if the download failed."""
+    max_bytes = settings.scraper.image_max_bytes
+    timeout = aiohttp.ClientTimeout(total=settings.scraper.http_timeout)
+
+    try:
+        async with get_http_session().get(resolve_url(url), timeout=timeout) as response:
+            if response.status != 200:
+                logger.error(f"Failed to download image {url}: HTTP {response.status}")
+                return None
+            if response.content_length and response.content_length > max_bytes:
+                logger.error(f"Image {url} is too large: {response.content_length} bytes")
+                return None
+
+            recorded = []
+
+            async def chunks():
+                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                    if settings.scraper.replay_mode == "record":
+                        recorded.append(chunk)
+                    yield chunk
+
+            name = await storage.put_stream(filename, chunks(), max_bytes=max_bytes)
+            record_response(url, b"".join(recorded), response.content_type)
+            return name
+
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError, OSError) as e:
+        logger.error(f"Error downloading image {url}: {str(e)}")
+        return None
+
+
+async def download_images(images: Dict[str, tuple], storage: CustomFileSystemStorage) -> Dict[str, str]:
+    """
+    Download images in parallel.
+
+    Args:
+        images: {key: (image url, file name)}
+        storage: Storage to write the images to.
+
+    Returns:
+        dict: {key: stored name} for the successful downloads.
+    """
+    semaphore = asyncio.Semaphore(settings.scraper.image_download_concurrency)
+
+    async def bounded(url, filename):
+        async with semaphore:
+            return await download_image(url, filename, storage)
+
+    keys = list(images)
+    names = await asyncio.gather(*(bounded(*images[key]) for key in keys))
+    logger.info(f"Downloaded {sum(1 for name in names if name)} of {len(keys)} images")
+    return {key: name for key, name in zip(keys, names) if name}
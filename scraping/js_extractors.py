@@ -0,0 +1,71 @@
+"""
+Table extractors executed inside the browser.
+
+Reading a table through WebDriver costs one chromedriver round trip per find_element, .text and
+get_attribute call, i.e. dozens per row. These scripts walk the DOM in the page and return the
+whole visible table as one JSON payload from a single execute_script call.
+"""
+from typing import Dict, List, Optional
+
+
+DEFILLAMA_ROWS_JS = """
+const wrapper = arguments[0];
+const rows = wrapper.querySelectorAll('div[style*="position: absolute; top:"]');
+return Array.from(rows).map(row => {
+    const cells = Array.from(row.children).filter(cell => cell.tagName === 'DIV');
+    if (cells.length < 11) {
+        return null;
+    }
+    const nameCell = cells[0].querySelector('span[class*="sc-f61b72e9-0"]');
+    const link = nameCell && nameCell.querySelector('a');
+    const image = nameCell && nameCell.querySelector('img');
+    if (!link || !image) {
+        return null;
+    }
+    return [nameCell.innerText.trim(), link.href, image.src]
+        .concat(cells.slice(1, 11).map(cell => cell.innerText.trim()));
+});
+"""
+
+SCROLL_STATE_JS = """
+const row = arguments[0].querySelector('div[style*="position: absolute; top:"]');
+const page = document.scrollingElement || document.documentElement;
+return {
+    row_height: row ? row.getBoundingClientRect().height : 0,
+    viewport_height: window.innerHeight,
+    at_bottom: window.scrollY + window.innerHeight >= page.scrollHeight - 2,
+};
+"""
+
+VALIDATOR_INFO_ROWS_JS = """
+return Array.from(document.getElementsByClassName('el-DataListRow')).map(row => {
+    const name = row.querySelector('.el-NameText');
+    const link = row.querySelector('a');
+    const image = row.querySelector('img');
+    return {
+        cells: Array.from(row.getElementsByClassName('el-DataListRowCell')).map(cell => cell.innerText.trim()),
+        name: name ? name.innerText.trim() : null,
+        link: link ? link.href : null,
+        img_url: image ? image.src : null,
+    };
+});
+"""
+
+
+def extract_defillama_rows(driver, table_wrapper) -> List[Optional[List[str]]]:
+    """
+    Return every rendered row of the DefiLlama LSD table, in DOM order.
+
+    A row is [raw name, validator link, image link, 10 numeric cells], or None for rows that are not complete yet.
+    """
+    return driver.execute_script(DEFILLAMA_ROWS_JS, table_wrapper) or []
+
+
+def get_scroll_state(driver, table_wrapper) -> Dict:
+    """Return {"row_height", "viewport_height", "at_bottom"} for a virtualized table."""
+    return driver.execute_script(SCROLL_STATE_JS, table_wrapper)
+
+
+def extract_validator_info_rows(driver) -> List[Dict]:
+    """Return every validator.info row as {"cells", "name", "link", "img_url"}, in DOM order."""
+    return driver.execute_script(VALIDATOR_INFO_ROWS_JS) or []
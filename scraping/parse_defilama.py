@@ -4,15 +4,15 @@ from contextlib import contextmanager
 import sys
 import os
 import re
-import io
 from typing import List, Dict
+from uuid import UUID
 import random
+from datetime import datetime, timedelta, timezone
 
-from fastapi import UploadFile
 from selenium.webdriver import ActionChains
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-import requests
 import asyncio
 
 from selenium import webdriver
@@ -23,15 +23,26 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
-from webdriver_manager.chrome import ChromeDriverManager
 from pyvirtualdisplay import Display
 
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, project_root)
 
 from scraping import logger
+from scraping.replay import record_page
+from scraping.politeness import load_page
+from scraping.js_extractors import extract_defillama_rows, get_scroll_state
+from scraping.worker import scraping_worker, ScrapingWorkerError
+from scraping.defillama_data import fetch_lsd_rows, record_browser_rows
+from scraping.driver_pool import get_driver_pool
+from scraping.chromedriver import resolve_chromedriver_path
+from scraping.resource_blocking import apply_resource_blocking
+from scraping.image_downloader import download_images
+from scraping.bulk_ingest import upsert_pools, store_offers, set_pool_logos, deactivate_missing_pools
 from core.config import settings
-from core.models import Pool, Coin, Chain, CoinPoolOffer, db_helper
+from core import pool_storage, StoredFile
+from core.logo_variants import create_logo_variants
+from core.models import Pool, Coin, Chain, ValidatorWebsiteCache, db_helper
 
 # TODO: Add deactivation for polls with no offers found!
 
@@ -44,15 +55,16 @@ class DefiLamaScraper:
     processing the data, and storing it in the database.
 
     Attributes:
-       driver: Selenium WebDriver instance.
-       display: Virtual display for headless browser operation.
+       driver: Selenium WebDriver instance borrowed from the "defillama" driver pool.
+       display: Virtual display shared by all pooled browsers of the process, only with SCRAPER_USE_XVFB.
        filename: Name of the file to save scraped data.
        url: URL of the DeFi Llama page to scrape.
        validator_links: Dictionary mapping validator names to their website URLs.
     """
+    display = None
+
     def __init__(self):
         self.driver = None
-        self.display = None
         self.filename = 'defillama_lsd_data.csv'
         self.url = 'https://defillama.com/lsd'
         self.validator_links = {
@@ -91,13 +103,16 @@ class DefiLamaScraper:
         """
         Set up and return a Chrome WebDriver instance with specific options.
 
+        Chrome runs in the new headless mode. With `settings.scraper.use_xvfb` it runs headed
+        inside the shared Xvfb display instead, started by `_create_pooled_driver`.
+
         Returns:
             webdriver.Chrome: Configured Chrome WebDriver instance.
         """
         options = Options()
-        options.headless = False
 
-        options.add_argument("--headless")
+        if not settings.scraper.use_xvfb:
+            options.add_argument("--headless=new")
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
         options.add_argument("--disable-gpu")
@@ -110,7 +125,7 @@ class DefiLamaScraper:
         options.add_argument("--ignore-certificate-errors")
         options.add_argument("user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/237.84.2.178 Safari/537.36")
 
-        service = Service(ChromeDriverManager().install())
+        service = Service(resolve_chromedriver_path())
 
         _driver = webdriver.Chrome(service=service, options=options)
 
@@ -220,22 +235,33 @@ class DefiLamaScraper:
                 '''
         })
 
+        apply_resource_blocking(_driver, settings.scraper.blocking_profile_defillama)
+
         return _driver
 
+    @classmethod
+    def _create_pooled_driver(cls) -> webdriver.Chrome:
+        # Opt-in fallback: one virtual display is shared by every browser of the pool
+        if settings.scraper.use_xvfb and DefiLamaScraper.display is None:
+            DefiLamaScraper.display = Display(size=(1920, 1080), visible=False, backend="xvfb")
+            DefiLamaScraper.display.start()
+        return cls.get_chrome_driver()
+
+    @staticmethod
+    def _stop_display() -> None:
+        if DefiLamaScraper.display is not None:
+            DefiLamaScraper.display.stop()
+            DefiLamaScraper.display = None
+
     @contextmanager
     def get_driver(self):
-        self.display = Display(size=(1920, 1080), visible=False, backend="xvfb")
-        self.display.start()
-        self.driver = self.get_chrome_driver()
-        try:
-            yield self.driver
-        finally:
-            if self.driver:
-                self.driver.quit()
+        pool = get_driver_pool("defillama", self._create_pooled_driver, on_close=self._stop_display)
+        with pool.borrow() as driver:
+            self.driver = driver
+            try:
+                yield driver
+            finally:
                 self.driver = None
-            if self.display:
-                self.display.stop()
-                self.display = None
 
     @staticmethod
     def _clean_validator_name(name: str) -> str:
@@ -364,12 +390,31 @@ class DefiLamaScraper:
     #
     #         return []
 
-    async def scrape_validator_data(self, url):
+    def _collect_new_rows(self, driver, table_wrapper, rows_by_name: Dict[str, tuple]) -> int:
+        """Add rendered rows not seen yet, keyed by validator name. Returns the number of new rows."""
+        added = 0
+        for row in extract_defillama_rows(driver, table_wrapper):
+            if row is None:
+                continue
+            name, *fields = row
+            clean_name = self._clean_validator_name(name)
+            if clean_name not in rows_by_name:
+                rows_by_name[clean_name] = (clean_name, *fields)
+                added += 1
+        return added
+
+    @staticmethod
+    def _rendered_names(driver, table_wrapper) -> set:
+        return {row[0] for row in extract_defillama_rows(driver, table_wrapper) if row is not None}
+
+    def scrape_validator_data(self, url):
         """
         Scrape validator data from the given URL.
 
-        This method navigates to the specified URL, scrolls through the page,
-        and extracts data for each validator found.
+        The table is virtualized: only the rows in view are rendered, so their DOM index says nothing
+        about which rows are new. Rows are collected by validator name, the page is scrolled by
+        a viewport worth of measured rows, and every scroll waits until the rendered rows change.
+        It blocks on the browser, so it is executed in the scraping worker process.
 
         Args:
             url (str): The URL to scrape data from.
@@ -379,86 +424,55 @@ class DefiLamaScraper:
         """
         with self.get_driver() as driver:
             try:
-                driver.get(url)
-                time.sleep(10)  # Wait for page to load
+                load_page(driver, url)
 
                 table_wrapper = WebDriverWait(driver, 30).until(
                     EC.presence_of_element_located((By.XPATH, "//div[@id='table-wrapper']"))
                 )
+                WebDriverWait(driver, 30, poll_frequency=0.5).until(
+                    lambda d: self._rendered_names(d, table_wrapper)
+                )
+                record_page(url, driver.page_source)
 
-                data = []
-                processed_rows = 0
+                rows_by_name: Dict[str, tuple] = {}
                 no_new_data_count = 0
-                max_no_new_data = 5
-                scroll_distance = 300
+                max_no_new_data = 3
+                scrolls = 0
 
                 while True:
                     try:
-                        rows = table_wrapper.find_elements(By.XPATH,
-                                                           ".//div[contains(@style, 'position: absolute; top:')]")
-
-                        if not rows:
-                            logger.warning("No rows found. Waiting and trying again...")
-                            time.sleep(5)
-                            no_new_data_count += 1
-                            if no_new_data_count >= max_no_new_data:
-                                break
-                            continue
-
-                        new_data_added = False
-                        for row in rows[processed_rows:]:
-                            try:
-                                cells = row.find_elements(By.XPATH, "./div")
-
-                                if len(cells) >= 11:
-                                    name_cell = cells[0].find_element(By.XPATH,
-                                                                      ".//span[contains(@class, 'sc-f61b72e9-0')]")
-                                    name = name_cell.text.strip()
-                                    clean_name = self._clean_validator_name(name)
-
-                                    validator_link = name_cell.find_element(By.XPATH, ".//a").get_attribute('href')
-                                    image_link = name_cell.find_element(By.XPATH, ".//img").get_attribute('src')
-
-                                    staked_eth = cells[1].text.strip()
-                                    tvl = cells[2].text.strip()
-                                    change_7d = cells[3].text.strip()
-                                    change_30d = cells[4].text.strip()
-                                    market_share = cells[5].text.strip()
-                                    lsd = cells[6].text.strip()
-                                    eth_peg = cells[7].text.strip()
-                                    mcap_tvl = cells[8].text.strip()
-                                    lsd_apr = cells[9].text.strip()
-                                    fee = cells[10].text.strip()
-
-                                    item = (
-                                        clean_name, validator_link, image_link, staked_eth, tvl, change_7d, change_30d,
-                                        market_share, lsd, eth_peg, mcap_tvl, lsd_apr, fee
-                                    )
-                                    data.append(item)
-                                    new_data_added = True
-                                    processed_rows += 1
-
-                            except Exception as e:
-                                logger.error(f"Error processing row: {str(e)}")
-                                continue
-
-                        if new_data_added:
-                            no_new_data_count = 0
-                        else:
-                            no_new_data_count += 1
+                        added = self._collect_new_rows(driver, table_wrapper, rows_by_name)
+                        state = get_scroll_state(driver, table_wrapper)
+
+                        # At the bottom every remaining row is rendered and has just been collected
+                        if state["at_bottom"]:
+                            break
 
+                        no_new_data_count = 0 if added else no_new_data_count + 1
                         if no_new_data_count >= max_no_new_data:
                             logger.info("No new data after multiple attempts. Exiting loop.")
                             break
 
-                        driver.execute_script(f"window.scrollBy(0, {scroll_distance});")
-                        time.sleep(2)
+                        # Scroll by the rows that fit in the viewport, keeping one row of overlap
+                        row_height = state["row_height"] or 50
+                        rows_per_scroll = max(1, int(state["viewport_height"] // row_height) - 1)
+                        rendered_before = self._rendered_names(driver, table_wrapper)
+                        driver.execute_script(f"window.scrollBy(0, {rows_per_scroll * row_height});")
+                        scrolls += 1
+
+                        try:
+                            WebDriverWait(driver, 5, poll_frequency=0.2).until(
+                                lambda d: self._rendered_names(d, table_wrapper) != rendered_before
+                            )
+                        except TimeoutException:
+                            logger.debug("Rendered rows did not change after scrolling.")
 
                     except Exception as e:
                         logger.error(f"Error during scraping: {str(e)}")
                         break
 
-                return data
+                logger.info(f"Collected {len(rows_by_name)} rows in {scrolls} scrolls")
+                return list(rows_by_name.values())
 
             except TimeoutException:
                 logger.error("Timed out waiting for page to load")
@@ -466,22 +480,23 @@ class DefiLamaScraper:
                 logger.error(f"Element not found: {str(e)}")
             except Exception as e:
                 logger.error(f"Unexpected error during scraping: {str(e)}")
-            finally:
-                driver.quit()
 
             return []
 
-    async def extract_validator_website(self, validator_link):
-        self.display = Display(size=(1920, 1080), visible=False, backend='xvfb')
-        self.display.start()
-        driver = self.get_chrome_driver()
+    def extract_validator_website(self, validator_link):
+        with self.get_driver() as driver:
+            return self._extract_validator_website(driver, validator_link)
+
+    @staticmethod
+    def _extract_validator_website(driver, validator_link):
         try:
-            driver.get(validator_link)
-            await asyncio.sleep(random.randint(8, 12))  # Wait for page to load
+            load_page(driver, validator_link)
+            time.sleep(random.randint(8, 12))  # Wait for page to load
 
             # Scroll to the middle of the page
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight / 2);")
-            await asyncio.sleep(2)  # Wait for the page to load
+            time.sleep(2)  # Wait for the page to load
+            record_page(validator_link, driver.page_source)
 
             # Look for "Protocol Information" section
             try:
@@ -491,7 +506,7 @@ class DefiLamaScraper:
 
                 # Scroll to the "Protocol Information" section
                 driver.execute_script("arguments[0].scrollIntoView();", info_section)
-                await asyncio.sleep(1)
+                time.sleep(1)
 
                 # Look for "Website" link
                 website_link = WebDriverWait(info_section, 5).until(
@@ -500,7 +515,7 @@ class DefiLamaScraper:
 
                 # Emulate mouse hover
                 ActionChains(driver).move_to_element(website_link).perform()
-                await asyncio.sleep(1)  # Wait for the website link to appear
+                time.sleep(1)  # Wait for the website link to appear
 
                 # Get the link
                 href = website_link.get_attribute('href')
@@ -513,17 +528,15 @@ class DefiLamaScraper:
 
                 return href
 
-            except Exception as e:
+            except (TimeoutException, NoSuchElementException) as e:
+                # The page loaded but has no website, the only result that is cached as "not found"
                 logger.warning(f"Website link not found for {validator_link}: {str(e)}")
                 return None
 
         except Exception as e:
+            # Page load and browser errors are not a lookup result, the caller retries on the next run
             logger.error(f"Error extracting website for {validator_link}: {str(e)}")
-            return None
-
-        finally:
-            driver.quit()
-            self.display.stop()
+            raise
 
     def get_file_path(self):
         filename = self.filename
@@ -535,7 +548,16 @@ class DefiLamaScraper:
     async def process_data(self):
         # Main execution
         url = self.url
-        scraped_data = await self.scrape_validator_data(url)
+        scraped_data = []
+        if settings.scraper.defillama_mode == "json":
+            scraped_data = await fetch_lsd_rows(url)
+            logger.info(f"Read {len(scraped_data)} items from DefiLlama page data")
+
+        if not scraped_data:
+            # Browser fallback, also used when the page data format changes
+            logger.info("Scraping DefiLlama table in the browser.")
+            scraped_data = await scraping_worker.submit("defillama_table", url)
+            record_browser_rows(url, scraped_data)
 
         # Save to CSV
         full_path = self.get_file_path()
@@ -559,8 +581,10 @@ class DefiLamaScraper:
 
     async def process_scraped_data(self, scraped_data: List[tuple]):
         async for session in db_helper.session_getter():
+            stored_logos = []
             try:
                 existing_validators = await self.get_all_validators(session)
+                website_cache = await self.get_website_cache(session)
                 chain = await self.get_or_create_chain(session, "ERC-20")
                 coin = await self.get_or_create_coin(session, "ETH")
 
@@ -568,7 +592,7 @@ class DefiLamaScraper:
                     chain.coins.append(coin)
                     await session.flush()
 
-                validators_to_create = []
+                validators_to_create = {}
                 offers_to_create = []
                 link_image_data = {}
                 processed_validators = set()
@@ -576,100 +600,138 @@ class DefiLamaScraper:
                 for validator_data in scraped_data:
                     name, validator_link, image_link, _, _, _, _, market_share, lsd, _, _, apr, fee = validator_data
 
-                    validator = existing_validators.get(name)
-
-                    if not validator:
+                    if name not in existing_validators and name not in validators_to_create:
                         website_url = self.validator_links.get(name)
                         if website_url is None:
-                            website_url = await self.extract_validator_website(validator_link)
+                            website_url = await self.resolve_website(website_cache, name, validator_link)
                         if website_url:
-                            validator = Pool(
+                            validators_to_create[name] = dict(
                                 name=name,
                                 website_url=website_url,
                                 is_active=True,
                                 parsing_source="defillama",
                             )
-                            validators_to_create.append(validator)
-                            logger.info(f"Created new validator: {name}, website: {website_url}")
+                            logger.info(f"Found new validator: {name}, website: {website_url}")
 
                             link_image_data[name] = {'img_src': image_link}
-                            logger.info(f"Created new image link: {image_link}")
+                            logger.info(f"Found new image link: {image_link}")
 
-                # Add new validators to get ID
-                session.add_all(validators_to_create)
-                await session.flush()
-
-                # Fill existing_validators with new validators
-                for validator in validators_to_create:
-                    existing_validators[validator.name] = validator
+                # Add new validators in one statement to get their IDs
+                pool_ids = {name: validator.id for name, validator in existing_validators.items()}
+                new_pool_ids, created_validators = await upsert_pools(session, list(validators_to_create.values()))
+                pool_ids.update(new_pool_ids)
 
                 # Create new offers
                 for validator_data in scraped_data:
                     name, _, _, _, _, _, _, market_share, lsd, _, _, apr, fee = validator_data
-                    validator = existing_validators.get(name)
+                    pool_id = pool_ids.get(name)
 
-                    if validator and apr and apr.strip() != "":
-                        offer = self.create_coin_pool_offer_object(validator, chain, coin, market_share, lsd, apr, fee)
-                        session.add(offer)
-                        offers_to_create.append(offer)
+                    if pool_id and apr and apr.strip() != "":
+                        offers_to_create.append(self.create_coin_pool_offer_row(pool_id, chain, coin, market_share,
+                                                                                lsd, apr, fee))
                         processed_validators.add(name)
-                        logger.info(f"Created new offer: {offer}")
-
-                # Deactivate validators not found in scraped data or without valid offers
-                if len(offers_to_create) > 10:
-                    for name, validator in existing_validators.items():
-                        if name not in processed_validators and validator.is_active:
-                            validator.is_active = False
-                            logger.info(f"Deactivated validator: {name}")
-
-                await self.process_logos(session, link_image_data, existing_validators)
-
-                session.add_all(offers_to_create)
 
                 if len(offers_to_create) == 0:
                     logger.error("!!!!!!!!!! No offers to add from DefiLama! Check if parser is broken !!!!!!!!!!")
                     raise Exception("No offers to add from DefiLama! Check if parser is broken!")
 
-                await session.flush()
+                # Deactivate validators not found in scraped data or without valid offers
+                if len(offers_to_create) > 10:
+                    await deactivate_missing_pools(session, "defillama", processed_validators)
+
+                stored_logos = await self.process_logos(session, link_image_data,
+                                                        {name: pool_ids[name] for name in created_validators})
+
+                added = await store_offers(session, offers_to_create)
                 await session.commit()
-                logger.info(f"Added {len(validators_to_create)} new validators and {len(offers_to_create)} new offers.")
+                logger.info(f"Added {len(created_validators)} new validators and {added} new offers.")
 
             except Exception as e:
                 logger.exception(f"Error in database session: {str(e)}")
                 await session.rollback()
+                await pool_storage.release(stored_logos)
             finally:
                 await session.close()
 
     @staticmethod
-    async def process_logos(session: AsyncSession, link_image_data, existing_pools):
+    async def process_logos(session: AsyncSession, link_image_data, pools_without_logo: Dict[str, UUID]) -> List[str]:
+        """
+        Download the logos of new validators in parallel, straight into the pool storage, and set them in one UPDATE.
+        Returns the stored names, the caller releases them if the session is rolled back before the commit.
+        """
+        images = {}
         for validator_name, data in link_image_data.items():
-            pool = existing_pools.get(validator_name)
-            if pool and pool.logo is None:
+            if validator_name in pools_without_logo:
                 image_link = data.get('img_src', '')
                 if image_link:
-                    try:
-                        response = await asyncio.get_event_loop().run_in_executor(
-                            None, lambda: requests.get(image_link, stream=True)
-                        )
-                        if response.status_code == 200:
-                            content = response.content
+                    images[validator_name] = (image_link, f"{validator_name}_logo.png")
+                else:
+                    logger.warning(f"Logo path not found or invalid for {validator_name}")
 
-                            filename = f"{validator_name}_logo.png"
-                            upload_file = UploadFile(filename=filename, file=io.BytesIO(content))
+        stored = await download_images(images, pool_storage)
+        try:
+            await create_logo_variants(pool_storage, stored.values())
+            await set_pool_logos(session, {pools_without_logo[validator_name]: StoredFile(name)
+                                           for validator_name, name in stored.items()})
+        except Exception:
+            await pool_storage.release(stored.values())
+            raise
+        for validator_name, name in stored.items():
+            logger.info(f"Logo saved for {validator_name} at {name}")
+        return list(stored.values())
 
-                            logger.info(f"Logo saved for {validator_name} at {filename}")
+    @staticmethod
+    async def get_website_cache(session: AsyncSession) -> Dict[str, ValidatorWebsiteCache]:
+        result = await session.execute(select(ValidatorWebsiteCache))
+        return {entry.name: entry for entry in result.scalars().all()}
 
-                            pool.logo = upload_file
-                            session.add(pool)
+    @staticmethod
+    def website_cache_is_fresh(entry: ValidatorWebsiteCache) -> bool:
+        ttl_days = settings.scraper.website_cache_ttl_days if entry.website_url \
+            else settings.scraper.website_cache_negative_ttl_days
+        return entry.checked_at + timedelta(days=ttl_days) > datetime.now(timezone.utc)
 
-                            logger.info(f"Logo saved for {validator_name} at {filename}")
+    async def resolve_website(self, website_cache: Dict[str, ValidatorWebsiteCache], name: str, validator_link: str):
+        """
+        Website of a validator, visiting its DefiLlama page in the browser at most once per TTL.
+        Validators without a website are cached too, with a shorter TTL. A page that could not be read
+        returns None without caching anything, so it is tried again on the next run.
 
-                    except Exception as e:
-                        logger.error(f"Error saving logo for {validator_name}: {str(e)}")
-                else:
-                    logger.warning(f"Logo path not found or invalid for {validator_name}")
+        Results are committed in their own session right away, so they survive a rollback of the ingestion.
+        """
+        entry = website_cache.get(name)
+        if entry and self.website_cache_is_fresh(entry):
+            logger.info(f"Website cache hit for {name}: {entry.website_url or 'not found'}")
+            return entry.website_url
+
+        try:
+            website_url = await scraping_worker.submit("defillama_website", validator_link)
+        except ScrapingWorkerError as e:
+            logger.error(f"Website of {name} not resolved, not cached: {str(e).splitlines()[0]}")
+            return None
+        except asyncio.TimeoutError:
+            logger.error(f"Website of {name} not resolved in {settings.scraper.worker_page_job_timeout}s, not cached")
+            return None
+        checked_at = datetime.now(timezone.utc)
+
+        async for cache_session in db_helper.session_getter():
+            try:
+                values = dict(validator_link=validator_link, website_url=website_url, checked_at=checked_at)
+                await cache_session.execute(
+                    pg_insert(ValidatorWebsiteCache)
+                    .values(name=name, is_active=True, **values)
+                    .on_conflict_do_update(index_elements=[ValidatorWebsiteCache.name], set_=values)
+                )
+                await cache_session.commit()
+            except Exception as e:
+                logger.error(f"Error caching website for {name}: {str(e)}")
+                await cache_session.rollback()
+            finally:
+                await cache_session.close()
 
-        await session.flush()
+        website_cache[name] = ValidatorWebsiteCache(name=name, validator_link=validator_link,
+                                                    website_url=website_url, checked_at=checked_at)
+        return website_url
 
     @staticmethod
     async def get_all_validators(session: AsyncSession) -> Dict[str, Pool]:
@@ -709,16 +771,13 @@ class DefiLamaScraper:
 
         return coin
 
-    def create_coin_pool_offer_object(self, validator: Pool, chain: Chain, coin: Coin, pool_share: str, lsd: str,
-                                      apr: str, fee: str) -> CoinPoolOffer:
-        logger.info(f"Creating offer: validator={validator.name} (id={validator.id}), chain={chain.name} (id={chain.id}), coin={coin.code} (id={coin.id})")
-        return CoinPoolOffer(
+    def create_coin_pool_offer_row(self, pool_id: UUID, chain: Chain, coin: Coin, pool_share: str, lsd: str,
+                                   apr: str, fee: str) -> Dict:
+        """Column values of an offer for the bulk insert."""
+        return dict(
             coin_id=coin.id,
-            coin=coin,
-            pool_id=validator.id,
-            pool=validator,
+            pool_id=pool_id,
             chain_id=chain.id,
-            chain=chain,
             pool_share=self.clean_percentage(pool_share),
             liquidity_token=(True if lsd else False),
             liquidity_token_name=lsd,
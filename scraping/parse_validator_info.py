@@ -7,18 +7,18 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, project_root)
 
 from scraping.logger import logger
-from scraping.scrapers_validator_info import (
-    MainPageScraper, ValidatorDataScraper, ValidatorLinkAndImageScraper,
-    ValidatorExternalLinksScraper
-)
+from scraping.worker import scraping_worker
+from scraping.scrapers_validator_info import MainPageScraper
+from scraping.validator_table import clean_validator_names
+from scraping.bulk_ingest import upsert_pools, deactivate_missing_pools
 from scraping.utils_validator_info import (
     get_existing_pools_validator_info, clean_validator_name,
     process_validator_data, chains_and_coins_are_created_or_create,
-    get_pools_name_id_dict, process_offers_from_csv, process_logos, is_valid_url,
+    get_pools_name_id_dict, process_offers, export_processed_table, process_logos, is_valid_url,
     get_latest_price_from_db, normalize_chain_name,
 )
-from core.models import Pool, db_helper, Chain, Coin
-from core import settings
+from core.models import db_helper, Chain, Coin
+from core import settings, pool_storage
 
 
 async def get_chain_data(chain_name, chains_data):
@@ -57,7 +57,6 @@ async def parse_validator_info():
     logger.info("Scraping started.")
 
     settings.scraper.ensure_dir(settings.scraper.base_dir)
-    settings.scraper.ensure_dir(settings.scraper.processed_data_dir)
 
     urls = [
         "https://validator.info/lava",
@@ -104,10 +103,13 @@ async def parse_validator_info():
     }
 
     try:
-        # Scrape main page
+        # Main page over plain HTTP, the browser in the scraping worker process is the fallback
         main_page_scraper = MainPageScraper(["https://validator.info"])
-        main_page_content = main_page_scraper.scrape_main_page()
-        chains_data = main_page_scraper.extract_data_from_main_page(main_page_content)
+        main_page_content = await main_page_scraper.fetch_main_page()
+        if main_page_content:
+            chains_data = main_page_scraper.extract_data_from_main_page(main_page_content)
+        else:
+            chains_data = await scraping_worker.submit("validator_info_main_page", "https://validator.info")
 
         if not isinstance(chains_data, list):
             logger.error(f"Unexpected data type from extract_data_from_main_page: {type(chains_data)}")
@@ -117,6 +119,7 @@ async def parse_validator_info():
         all_validators = set()
 
         async for session in db_helper.session_getter():
+            stored_logos = []
             try:
 
                 existing_pools = await get_existing_pools_validator_info(session)
@@ -177,19 +180,29 @@ async def parse_validator_info():
 
                 logger.info(f"Proceeding with scraping for the following URLs: {urls}")
 
+                # Scrape all chains in parallel in the worker process, results come back in URL order
+                all_link_image_data = {}
+                # Processed tables by chain, handed to the offers ingestion in memory
+                chain_tables = {}
+                # New pools by name
+                new_pools = {}
+                chain_results = await scraping_worker.submit(
+                    "validator_info_chains", urls, set(existing_pools.keys()))
+
                 for url in urls:
                     try:
                         chain_name = settings.scraper.get_chain_name(url)
                         logger.info(f"Processing chain: {chain_name}")
 
-                        # Scrape validator data
-                        validators_page_scraper = ValidatorDataScraper([url])
-                        df_validators = validators_page_scraper.scrape_validator_data(url)
+                        chain_result = chain_results.get(url)
 
-                        if df_validators is None or df_validators.empty:
+                        if chain_result is None:
                             logger.warning(f"No validator data found for {chain_name}")
                             continue
 
+                        df_validators = chain_result["df"]
+                        link_image_data = chain_result["link_image_data"]
+
                         chain_data = await get_chain_data(chain_name, chains_data)
 
                         if chain_data is None:
@@ -222,74 +235,60 @@ async def parse_validator_info():
                         logger.info(f"Final chain price for {chain_name}: {chain_price}")
 
                         # Clean and get current validators
-                        current_validators = set(df_validators['Validator'].apply(clean_validator_name))
+                        current_validators = set(clean_validator_names(df_validators['Validator']))
                         all_validators.update(current_validators)
 
-                        # Get new validators
-                        new_validators = current_validators - set(existing_pools.keys())
-
-                        # Scrape links and images for new validators
-                        link_image_scraper = ValidatorLinkAndImageScraper([url])
-                        link_image_data = link_image_scraper.scrape_validator_links_and_images(new_validators)
-
-                        # Scrape external links for new validators
-                        external_links_scraper = ValidatorExternalLinksScraper()
-                        external_links_data = external_links_scraper.scrape_external_links(link_image_data)
-
-                        # Update link_image_data with external links
-                        for validator_name, external_link in external_links_data.items():
-                            if validator_name in link_image_data:
-                                link_image_data[validator_name]['external_link'] = external_link
-
                         # Process validator data
                         final_table = process_validator_data(chain_name, staked_total, df_validators, link_image_data,
                                                              chain_price)
 
-                        # Add new pools
+                        # Collect new pools, they are inserted together after all chains
                         for validator_name in current_validators:
                             cleaned_name = clean_validator_name(validator_name)
-                            external_link = link_image_data.get(cleaned_name, {}).get('external_link', '')
-                            is_active = is_valid_url(external_link)
+                            if cleaned_name in existing_pools or cleaned_name in new_pools:
+                                continue
 
-                            if cleaned_name in existing_pools:
+                            external_link = link_image_data.get(cleaned_name, {}).get('external_link', '')
+                            if external_link is None:
+                                # Not stored without a website because of a failed page, retried on the next run
+                                logger.warning(f"Website of new pool {cleaned_name} not resolved, skipped in this run")
                                 continue
-                            else:
-                                new_pool = Pool(
-                                    name=cleaned_name,
-                                    website_url=external_link if is_active else None,
-                                    is_active=is_active,
-                                    logo=None,
-                                    parsing_source="validator.info",
-                                )
-                                session.add(new_pool)
-                                existing_pools[cleaned_name] = new_pool
-                                logger.info(f"New pool added: {cleaned_name}, Active: {is_active}")
+                            is_active = is_valid_url(external_link)
+                            new_pools[cleaned_name] = dict(
+                                name=cleaned_name,
+                                website_url=external_link if is_active else None,
+                                is_active=is_active,
+                                parsing_source="validator.info",
+                            )
+                            logger.info(f"New pool found: {cleaned_name}, Active: {is_active}")
 
                     except Exception as e:
-                        logger.error(f"Error processing chain. Error: {e[:100]}")
+                        logger.error(f"Error processing chain. Error: {str(e)[:100]}")
                         continue
 
-                    # Process logos for new pools
-                    await process_logos(link_image_data, existing_pools)
+                    # Logos of new pools are downloaded together, after all chains
+                    all_link_image_data.update(link_image_data)
+
+                    chain_tables[chain_name] = final_table
+                    logger.info(f"Processed data ready for chain: {chain_name}")
+                    export_processed_table(chain_name, final_table)
 
-                    # Save processed data
-                    output_file = os.path.join(settings.scraper.processed_data_dir,
-                                               f"{chain_name}_validators_processed.csv")
-                    final_table.to_csv(output_file, index=False)
+                # Insert the new pools of all chains in one statement
+                new_pool_ids, created_pools = await upsert_pools(session, list(new_pools.values()))
 
-                    logger.info(f"Processed data saved for chain: {chain_name}")
-                    logger.info(f"Final table saved to: {output_file}")
+                # Download logos for pools without one in parallel
+                pools_without_logo = {name: pool.id for name, pool in existing_pools.items() if pool.logo is None}
+                pools_without_logo.update({name: new_pool_ids[name] for name in created_pools})
+                stored_logos = await process_logos(session, all_link_image_data, pools_without_logo)
 
                 # Deactivate pools not found in any chain
-                for pool_name, pool in existing_pools.items():
-                    if pool_name not in all_validators:
-                        if pool.is_active:
-                            pool.is_active = False
-                            logger.warning(f"Pool deactivated: {pool_name}, Not found in validator.info")
+                await deactivate_missing_pools(session, "validator.info", all_validators)
 
                 # Commit all changes
                 logger.info("Committing all changes to the database.")
                 await session.commit()
+                # The logos are referenced by the committed pools now
+                stored_logos = []
                 logger.info("All changes committed to the database.")
 
                 logger.info("Starting to create or get chains and coins.")
@@ -300,15 +299,16 @@ async def parse_validator_info():
                 pools_dict = await get_pools_name_id_dict(session)
                 logger.info(f"Retrieved {len(pools_dict)} pools.")
 
-                logger.info("Starting to process offers from CSV files.")
-                await process_offers_from_csv(session, coins_dict, chain_dict, pools_dict)
-                logger.info("Finished processing offers from CSV files.")
+                logger.info(f"Starting to process offers of {len(chain_tables)} chains.")
+                await process_offers(session, chain_tables, coins_dict, chain_dict, pools_dict)
+                logger.info("Finished processing offers.")
 
                 logger.info("All scraping and database operations completed successfully.")
 
             except Exception as e:
                 logger.exception(f"Error in database session: {str(e)}")
                 await session.rollback()
+                await pool_storage.release(stored_logos)
 
             finally:
                 await session.close()
@@ -0,0 +1,60 @@
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict
+from urllib.parse import urlparse
+
+from scraping.logger import logger
+from scraping.replay import resolve_url
+from scraping.resource_blocking import get_page_metrics
+from core.config import settings
+
+
+class DomainThrottle:
+    """
+    Per-domain politeness limits shared by all browser threads of a process.
+
+    At most `max_concurrency` page loads run against one domain at a time,
+    and consecutive loads from the same domain start at least `min_interval` seconds apart.
+    """
+
+    def __init__(self, max_concurrency: int, min_interval: float):
+        self.max_concurrency = max_concurrency
+        self.min_interval = min_interval
+        self.semaphores: Dict[str, threading.BoundedSemaphore] = defaultdict(
+            lambda: threading.BoundedSemaphore(self.max_concurrency))
+        self.next_start: Dict[str, float] = defaultdict(float)
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def slot(self, url: str):
+        domain = urlparse(url).netloc
+        with self.lock:
+            semaphore = self.semaphores[domain]
+
+        with semaphore:
+            with self.lock:
+                now = time.monotonic()
+                start = max(now, self.next_start[domain])
+                self.next_start[domain] = start + self.min_interval
+            if start > now:
+                time.sleep(start - now)
+            yield
+
+
+domain_throttle = DomainThrottle(
+    max_concurrency=settings.scraper.domain_max_concurrency,
+    min_interval=settings.scraper.domain_min_interval,
+)
+
+
+def load_page(driver, url: str) -> None:
+    """Navigate the driver to the url within the politeness limits of its domain."""
+    with domain_throttle.slot(url):
+        driver.get(resolve_url(url))
+
+    if settings.scraper.debug_conf:
+        metrics = get_page_metrics(driver)
+        logger.info(f"Page {url}: {metrics.get('load_ms')} ms, {metrics.get('requests')} requests, "
+                    f"{metrics.get('bytes', 0) / 1024:.0f} KiB")
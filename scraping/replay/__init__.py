@@ -0,0 +1,45 @@
+__all__ = [
+    'FixtureStore',
+    'ReplayServer',
+    'resolve_url',
+    'record_page',
+    'record_response',
+]
+
+from urllib.parse import urlparse
+
+from core.config import settings
+from .fixtures import FixtureStore
+from .server import ReplayServer
+
+
+def resolve_url(url: str) -> str:
+    """
+    Rewrite an external URL to the local stand-in server when replay mode is on.
+
+    https://validator.info/lava -> http://127.0.0.1:8765/validator.info/lava
+    """
+    if settings.scraper.replay_mode != "replay" or not url:
+        return url
+
+    parsed = urlparse(url)
+    replay_base = settings.scraper.replay_url.rstrip("/")
+    if not parsed.netloc or parsed.netloc == urlparse(replay_base).netloc:
+        return url
+
+    target = f"{replay_base}/{parsed.netloc}{parsed.path or '/'}"
+    if parsed.query:
+        target = f"{target}?{parsed.query}"
+    return target
+
+
+def record_page(url: str, html: str) -> None:
+    """Store a rendered page as a fixture when record mode is on."""
+    if settings.scraper.replay_mode == "record" and html:
+        FixtureStore(settings.scraper.fixtures_dir).save(url, html.encode("utf-8"))
+
+
+def record_response(url: str, body: bytes, content_type: str) -> None:
+    """Store a raw HTTP response (API JSON, images) as a fixture when record mode is on."""
+    if settings.scraper.replay_mode == "record" and body:
+        FixtureStore(settings.scraper.fixtures_dir).save(url, body, content_type=content_type)
@@ -0,0 +1,21 @@
+"""
+Run the stand-in server on SCRAPER_REPLAY_URL, so the app can scrape recorded fixtures:
+
+    python -m scraping.replay
+    SCRAPER_REPLAY_MODE=replay python collect_data_on_start.py
+"""
+import time
+from urllib.parse import urlparse
+
+from core.config import settings
+from scraping.replay import ReplayServer
+
+
+if __name__ == "__main__":
+    replay_url = urlparse(settings.scraper.replay_url)
+    server = ReplayServer(settings.scraper.fixtures_dir, host=replay_url.hostname, port=replay_url.port or 80).start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,61 @@
+import hashlib
+import json
+import os
+from typing import Optional, Tuple, Dict, List
+from urllib.parse import urlparse
+
+
+class FixtureStore:
+    """
+    File based store of recorded pages and API responses.
+
+    Every response is stored under `<root>/<host>/<key>.body` with a `<key>.json` metadata file next to it,
+    where the key is a hash of the path and query string of the original URL.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    @staticmethod
+    def _key(path: str, query: str) -> str:
+        target = path or "/"
+        if query:
+            target = f"{target}?{query}"
+        return hashlib.sha1(target.encode("utf-8")).hexdigest()
+
+    def _paths(self, host: str, path: str, query: str) -> Tuple[str, str]:
+        base = os.path.join(self.root, host, self._key(path, query))
+        return f"{base}.body", f"{base}.json"
+
+    def hosts(self) -> List[str]:
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(d for d in os.listdir(self.root) if os.path.isdir(os.path.join(self.root, d)))
+
+    def save(self, url: str, body: bytes, content_type: str = "text/html; charset=utf-8", status: int = 200) -> str:
+        parsed = urlparse(url)
+        body_path, meta_path = self._paths(parsed.netloc, parsed.path, parsed.query)
+        os.makedirs(os.path.dirname(body_path), exist_ok=True)
+
+        with open(body_path, "wb") as f:
+            f.write(body)
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump({"url": url, "status": status, "content_type": content_type}, f, indent=2)
+
+        return body_path
+
+    def load(self, host: str, path: str, query: str = "") -> Optional[Tuple[Dict, bytes]]:
+        body_path, meta_path = self._paths(host, path, query)
+        if not os.path.exists(body_path):
+            return None
+
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(body_path, "rb") as f:
+            body = f.read()
+
+        return meta, body
+
+    def load_url(self, url: str) -> Optional[Tuple[Dict, bytes]]:
+        parsed = urlparse(url)
+        return self.load(parsed.netloc, parsed.path, parsed.query)
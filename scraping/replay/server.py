@@ -0,0 +1,90 @@
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Optional, Tuple, Dict
+from urllib.parse import urlparse
+
+from scraping.logger import logger
+from .fixtures import FixtureStore
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    store: FixtureStore = None
+
+    def _lookup(self) -> Optional[Tuple[Dict, bytes]]:
+        parsed = urlparse(self.path)
+        hosts = self.store.hosts()
+
+        # Rewritten URLs look like /<original host>/<original path>
+        segments = parsed.path.lstrip("/").split("/", 1)
+        if segments[0] in hosts:
+            path = "/" + (segments[1] if len(segments) > 1 else "")
+            return self.store.load(segments[0], path, parsed.query)
+
+        # Relative links inside replayed pages lose the host prefix:
+        # try the host of the referring page first, then every recorded host
+        referer = self.headers.get("Referer")
+        if referer:
+            referer_segments = urlparse(referer).path.lstrip("/").split("/", 1)
+            if referer_segments[0] in hosts:
+                hosts = [referer_segments[0]] + [h for h in hosts if h != referer_segments[0]]
+
+        for host in hosts:
+            found = self.store.load(host, parsed.path, parsed.query)
+            if found:
+                return found
+        return None
+
+    def do_GET(self):
+        found = self._lookup()
+        if found is None:
+            self.send_error(404, "Fixture not recorded")
+            return
+
+        meta, body = found
+        self.send_response(meta.get("status", 200))
+        self.send_header("Content-Type", meta.get("content_type", "application/octet-stream"))
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(f"Replay server: {format % args}")
+
+
+class ReplayServer:
+    """
+    Local HTTP stand-in for defillama.com, validator.info, CoinGecko and image hosts.
+
+    Serves responses recorded in a FixtureStore. Use `scraping.replay.resolve_url` to
+    rewrite original URLs to this server.
+    """
+
+    def __init__(self, fixtures_dir: str, host: str = "127.0.0.1", port: int = 0):
+        handler = type("ReplayHandler", (_ReplayHandler,), {"store": FixtureStore(fixtures_dir)})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "ReplayServer":
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="replay-server", daemon=True)
+        self.thread.start()
+        logger.info(f"Replay server started at {self.url}")
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+        logger.info("Replay server stopped")
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -0,0 +1,60 @@
+"""
+Resource blocking profiles for scraper browsers.
+
+Extraction only needs the HTML and the scripts that render the tables. Images, fonts, media and
+analytics are blocked with CDP Network.setBlockedURLs. Image URLs are still read from the
+<img src> attributes of the DOM, only their download by the browser is skipped.
+"""
+from typing import Dict, List
+
+from scraping.logger import logger
+
+
+IMAGES = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.avif",
+          "*icons.llamao.fi*", "*/_next/image*"]
+FONTS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*fonts.googleapis.com*", "*fonts.gstatic.com*"]
+MEDIA = ["*.mp4", "*.webm", "*.mp3"]
+THIRD_PARTY = [
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*googlesyndication.com*",
+    "*hotjar.com*", "*mixpanel.com*", "*segment.io*", "*segment.com*", "*sentry.io*", "*cloudflareinsights.com*",
+    "*plausible.io*", "*intercom.io*", "*facebook.net*", "*twitter.com/i/*",
+]
+
+BLOCKING_PROFILES: Dict[str, List[str]] = {
+    "none": [],
+    "third_party": THIRD_PARTY,
+    "minimal": IMAGES + FONTS + MEDIA + THIRD_PARTY,
+}
+
+PAGE_METRICS_JS = """
+const navigation = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource');
+const size = entry => entry.transferSize || entry.encodedBodySize || 0;
+return {
+    load_ms: navigation ? Math.round(navigation.loadEventEnd || navigation.duration) : null,
+    requests: resources.length + 1,
+    bytes: resources.reduce((total, entry) => total + size(entry), navigation ? size(navigation) : 0),
+};
+"""
+
+
+def apply_resource_blocking(driver, profile: str) -> None:
+    """Block the URL patterns of a profile for every page the driver loads."""
+    patterns = BLOCKING_PROFILES.get(profile)
+    if patterns is None:
+        logger.warning(f"Unknown resource blocking profile: {profile}, nothing is blocked")
+        return
+    if not patterns:
+        return
+
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+
+
+def get_page_metrics(driver) -> Dict:
+    """
+    Load time and transferred bytes of the current page from the Performance API.
+
+    Cross-origin resources without Timing-Allow-Origin report no size, so bytes are a lower bound.
+    """
+    return driver.execute_script(PAGE_METRICS_JS) or {}
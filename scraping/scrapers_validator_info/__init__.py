@@ -4,6 +4,8 @@ __all__ = [
     "ValidatorDataScraper",
     "ValidatorExternalLinksScraper",
     "ValidatorLinkAndImageScraper",
+    "scrape_chain",
+    "scrape_chains",
 ]
 
 from .base import BaseScraper
@@ -11,3 +13,4 @@ from .main_page import MainPageScraper
 from .validators_page import ValidatorDataScraper
 from .validator_link_and_image import ValidatorLinkAndImageScraper
 from .validator_external_links import ValidatorExternalLinksScraper
+from .chains import scrape_chain, scrape_chains
@@ -1,11 +1,15 @@
 from typing import List
-import re
 from contextlib import contextmanager
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+
+from scraping.driver_pool import get_driver_pool
+from scraping.chromedriver import resolve_chromedriver_path
+from scraping.resource_blocking import apply_resource_blocking
+from scraping.validator_table import LEADING_NUMBERS_RE, NEW_MARKER_RE, WHITESPACE_RE, VOTES_JUNK_RE, NUMERIC_JUNK_RE
+from core.config import settings
 
 
 class BaseScraper:
@@ -16,7 +20,7 @@ class BaseScraper:
     @staticmethod
     def get_chrome_driver() -> webdriver.Chrome:
         chrome_options = Options()
-        chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--headless=new")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-gpu")
@@ -25,31 +29,33 @@ class BaseScraper:
         chrome_options.add_argument("--disable-extensions")
         chrome_options.add_argument("--disable-infobars")
         chrome_options.add_argument("--disable-popup-blocking")
-        service = Service(ChromeDriverManager().install())
-        return webdriver.Chrome(service=service, options=chrome_options)
+        service = Service(resolve_chromedriver_path())
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+        apply_resource_blocking(driver, settings.scraper.blocking_profile_validator_info)
+        return driver
 
     @contextmanager
     def get_driver(self):
-        self.driver = self.get_chrome_driver()
-        try:
-            yield self.driver
-        finally:
-            if self.driver:
-                self.driver.quit()
+        """Borrow a browser from the process-wide "validator_info" pool, one borrow per page load."""
+        with get_driver_pool("validator_info", self.get_chrome_driver).borrow() as driver:
+            self.driver = driver
+            try:
+                yield driver
+            finally:
                 self.driver = None
 
     @staticmethod
     def _clean_validator_name(name: str) -> str:
-        name = re.sub(r'^(\d+\s+)+', '', name)
-        name = re.sub(r'\bNEW\s*', '', name)
-        name = re.sub(r'\s+', ' ', name).strip()
+        name = LEADING_NUMBERS_RE.sub('', name)
+        name = NEW_MARKER_RE.sub('', name)
+        name = WHITESPACE_RE.sub(' ', name).strip()
         return name
 
     @staticmethod
     def _clean_numeric_value(value: str, column_name: str) -> str:
         value = value.split('\n')[0] if '\n' in value else value
         if column_name == "Votes":
-            value = re.sub(r'[^0-9/\s]', '', value)
+            value = VOTES_JUNK_RE.sub('', value)
         else:
-            value = re.sub(r'[^0-9.,%]', '', value)
+            value = NUMERIC_JUNK_RE.sub('', value)
         return value.strip()
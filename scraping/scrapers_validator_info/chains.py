@@ -0,0 +1,61 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+from scraping import logger
+from scraping.validator_table import clean_validator_names
+from scraping.scrapers_validator_info.validators_page import ValidatorDataScraper
+from scraping.scrapers_validator_info.validator_link_and_image import ValidatorLinkAndImageScraper
+from scraping.scrapers_validator_info.validator_external_links import ValidatorExternalLinksScraper
+
+
+def scrape_chain(url: str, existing_pool_names: Iterable[str]) -> Optional[Dict]:
+    """
+    Run all browser phases for one validator.info chain: validator data, links/images and external links.
+
+    Returns:
+        dict: {"df": validators DataFrame, "link_image_data": {validator: {"link", "img_url", "external_link"}}}
+        or None if no validator data was found. external_link is '' for validators without a website
+        and None for those whose page could not be read.
+    """
+    df_validators, validator_links = ValidatorDataScraper([url]).scrape_validator_page(url)
+    if df_validators is None or df_validators.empty:
+        return None
+
+    current_validators = set(clean_validator_names(df_validators['Validator']))
+    new_validators = current_validators - set(existing_pool_names)
+
+    link_image_data = ValidatorLinkAndImageScraper([url]).scrape_validator_links_and_images(
+        validator_links, new_validators)
+    external_links_data = ValidatorExternalLinksScraper().scrape_external_links(link_image_data)
+
+    # None marks a validator whose page could not be read, it is not created in this run
+    for validator_name in link_image_data:
+        link_image_data[validator_name]['external_link'] = external_links_data.get(validator_name)
+
+    return {"df": df_validators, "link_image_data": link_image_data}
+
+
+def scrape_chains(urls: List[str], existing_pool_names: Iterable[str], workers: int) -> Dict[str, Optional[Dict]]:
+    """
+    Scrape chains in parallel on up to `workers` threads, sharing the browsers of the driver pool.
+
+    Results are returned in the order of `urls`, whatever order the chains finish in,
+    so ingestion is deterministic. A failed chain maps to None.
+    """
+    existing_pool_names = frozenset(existing_pool_names)
+    started = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(urls))), thread_name_prefix="chain") as executor:
+        futures = {url: executor.submit(scrape_chain, url, existing_pool_names) for url in urls}
+
+        results = {}
+        for url in urls:
+            try:
+                results[url] = futures[url].result()
+            except Exception as e:
+                logger.exception(f"Error scraping chain {url}: {str(e)}")
+                results[url] = None
+
+    logger.info(f"Scraped {len(urls)} chains with {workers} browser workers in {time.perf_counter() - started:.1f}s")
+    return results
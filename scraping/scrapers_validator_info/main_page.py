@@ -1,26 +1,59 @@
+import asyncio
 import time
 import json
 import re
 
+import aiohttp
+
 from selenium.webdriver.support import expected_conditions as ec
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.common.by import By
 
 from .base import BaseScraper
 from scraping import logger
+from scraping.replay import resolve_url, record_page, record_response
+from scraping.http_client import get_http_session
+from scraping.politeness import load_page
 
 
 class MainPageScraper(BaseScraper):
+    MAIN_PAGE_MARKER = "regularBlockchainsListModel:make-api-fetch-model:$data"
+
+    async def fetch_main_page(self):
+        """
+        Fetch the server-rendered main page over plain HTTP, without a browser.
+
+        Returns the HTML if it contains the embedded blockchains model, None otherwise.
+        """
+        url = self.urls[0]
+        try:
+            async with get_http_session().get(resolve_url(url)) as response:
+                if response.status != 200:
+                    logger.warning(f"HTTP {response.status} for validator.info main page")
+                    return None
+                body = await response.read()
+                record_response(url, body, response.content_type)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"Error fetching validator.info main page over HTTP: {str(e)}")
+            return None
+
+        html = body.decode("utf-8", errors="replace")
+        if self.MAIN_PAGE_MARKER not in html:
+            logger.warning("Blockchains model not found in validator.info main page HTML")
+            return None
+        return html
+
     def scrape_main_page(self):
         logger.info("Starting to scrape validator.info main page...")
         with self.get_driver() as driver:
             try:
-                driver.get(self.urls[0])
+                load_page(driver, self.urls[0])
                 time.sleep(1)
 
                 WebDriverWait(driver, 20).until(
                     ec.presence_of_element_located((By.TAG_NAME, "body"))
                 )
+                record_page(self.urls[0], driver.page_source)
 
                 body_content = driver.find_element(By.TAG_NAME, "body").get_attribute('innerHTML')
 
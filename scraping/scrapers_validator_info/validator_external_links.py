@@ -1,47 +1,158 @@
+import html
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.support import expected_conditions as ec
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.by import By
 
 from scraping.scrapers_validator_info import BaseScraper
 from scraping import logger
+from scraping.replay import resolve_url, record_page, record_response
+from scraping.politeness import load_page, domain_throttle
+
+from core import settings
+
+
+EXTERNAL_LINK_CLASS = "el-BlockchainAgentExternalLink"
+EXTERNAL_LINK_TAG_RE = re.compile(r'<a\b[^>]*\bel-BlockchainAgentExternalLink\b[^>]*>', re.IGNORECASE)
+HREF_RE = re.compile(r'\bhref="([^"]*)"', re.IGNORECASE)
+# An element whose class list has the exact el-BlockchainAgent class: the server-rendered validator block
+AGENT_BLOCK_RE = re.compile(r'<[a-z][^>]*\bclass="(?:[^"]*\s)?el-BlockchainAgent(?:\s[^"]*)?"', re.IGNORECASE)
+# Scripts and styles may mention the class names without rendering anything
+SCRIPT_STYLE_RE = re.compile(r'<(script|style)\b[^>]*>.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+
+# One executor for the external links of all chains scraped in parallel,
+# so the browsers used here never exceed external_link_workers, whatever the number of chains
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=settings.scraper.external_link_workers,
+                                           thread_name_prefix="external-link")
+        return _executor
 
 
 class ValidatorExternalLinksScraper(BaseScraper):
+    """
+    Resolves the external website of validators from their validator.info pages.
+
+    Pages are fetched over plain HTTP first, concurrently, and the link is read from the server-rendered HTML.
+    Only pages where the validator block is not server-rendered are loaded in pooled browsers.
+    Pages of all chains share one executor of external_link_workers threads.
+    """
+
     def __init__(self):
         super().__init__(urls=[])
+        self.workers = settings.scraper.external_link_workers
+        self.timeout = settings.scraper.http_timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def scrape_external_links(self, validator_links):
+        """
+        Returns:
+            dict: {validator: external link, or '' if its page has none}. Validators whose page
+            could not be read are left out, so they can be retried on the next run.
+        """
         logger.info("Starting to scrape external links for new validators...")
+        started = time.perf_counter()
         result = {}
 
-        with self.get_driver() as driver:
-            for validator_name, data in validator_links.items():
-                internal_link = data['link']
-                logger.debug(f"Processing validator: {validator_name}")
-
-                try:
-                    driver.get(internal_link)
-                    WebDriverWait(driver, 10).until(
-                        ec.presence_of_element_located((By.CLASS_NAME, "el-BlockchainAgentExternalLink"))
-                    )
-
-                    external_link = self.get_external_link(driver)
+        executor = _get_executor()
+        names = list(validator_links)
+        try:
+            http_links = list(executor.map(
+                lambda name: self.fetch_external_link(validator_links[name]['link']), names))
 
-                    if external_link and not external_link.startswith("mailto:"):
-                        result[validator_name] = external_link
-                    else:
-                        logger.info(f"External link not found for validator: {validator_name}")
+            # None means the page has to be rendered in the browser
+            browser_names = [name for name, link in zip(names, http_links) if link is None]
+            browser_links = list(executor.map(
+                lambda name: self.scrape_external_link(validator_links[name]['link']), browser_names))
+        finally:
+            self.session.close()
 
-                except:
-                    logger.info(f"External link not found for validator: {validator_name}")
+        links = {**dict(zip(names, http_links)), **dict(zip(browser_names, browser_links))}
+        for validator_name in names:
+            external_link = links[validator_name]
+            if external_link is None:
+                logger.warning(f"External link of validator {validator_name} not resolved, retried on the next run")
+                continue
+            if external_link.startswith("mailto:"):
+                external_link = ''
+            if not external_link:
+                logger.info(f"External link not found for validator: {validator_name}")
+            result[validator_name] = external_link
 
-        logger.info("Finished scraping external links for new validators")
+        elapsed = time.perf_counter() - started
+        logger.info(f"Finished scraping external links for {len(names)} new validators in {elapsed:.1f}s "
+                    f"({len(names) / elapsed if elapsed else 0:.2f} validators/s, "
+                    f"{len(names) - len(browser_names)} over HTTP, {len(browser_names)} in browser)")
         return result
 
-    @staticmethod
-    def get_external_link(driver):
+    def fetch_external_link(self, internal_link):
+        """
+        Read the external link from the server-rendered page.
+
+        Returns the link, '' if the page has no external link, or None if the browser is needed.
+        """
         try:
-            link_element = driver.find_element(By.CLASS_NAME, "el-BlockchainAgentExternalLink")
-            return link_element.get_attribute("href")
-        except:
+            with domain_throttle.slot(internal_link):
+                response = self.session.get(resolve_url(internal_link), timeout=self.timeout)
+            if response.status_code != 200:
+                return None
+            record_response(internal_link, response.content, response.headers.get('Content-Type', 'text/html'))
+        except requests.RequestException as e:
+            logger.debug(f"HTTP fetch failed for {internal_link}: {str(e)}")
+            return None
+
+        markup = SCRIPT_STYLE_RE.sub('', response.text)
+        tag = EXTERNAL_LINK_TAG_RE.search(markup)
+        if tag:
+            href = HREF_RE.search(tag.group(0))
+            if href:
+                return html.unescape(href.group(1))
+        elif EXTERNAL_LINK_CLASS not in markup and AGENT_BLOCK_RE.search(markup):
+            # The validator block is rendered and has no link
             return ''
+        # A link that can't be read here, or a block rendered client-side
+        return None
+
+    def scrape_external_link(self, internal_link):
+        """
+        Read the external link from the page rendered in a browser.
+
+        Returns the link, '' if the validator block rendered without one, or None if the page could not be read.
+        """
+        try:
+            with self.get_driver() as driver:
+                load_page(driver, internal_link)
+                WebDriverWait(driver, 10).until(ec.presence_of_element_located((By.CLASS_NAME, "el-BlockchainAgent")))
+                try:
+                    link_element = WebDriverWait(driver, 3).until(
+                        ec.presence_of_element_located((By.CLASS_NAME, EXTERNAL_LINK_CLASS))
+                    )
+                except TimeoutException:
+                    link_element = None
+                record_page(internal_link, driver.page_source)
+
+                return (link_element.get_attribute("href") or '') if link_element else ''
+        except TimeoutException:
+            logger.warning(f"Validator block not rendered on {internal_link}")
+            return None
+        except WebDriverException as e:
+            logger.error(f"Browser error reading the external link of {internal_link}: {str(e)}")
+            return None
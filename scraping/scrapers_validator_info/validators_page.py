@@ -9,32 +9,53 @@ import pandas as pd
 
 from scraping import logger
 from scraping.scrapers_validator_info import BaseScraper
+from scraping.replay import record_page
+from scraping.politeness import load_page
+from scraping.js_extractors import extract_validator_info_rows
+from scraping.validator_table import clean_validator_names, clean_numeric_values
 
 
 class ValidatorDataScraper(BaseScraper):
     def scrape_validator_data(self, url):
+        df, _ = self.scrape_validator_page(url)
+        return df
+
+    def scrape_validator_page(self, url):
+        """
+        Read the chain page once: row data together with the internal link and image URL of every validator.
+
+        Returns:
+            tuple: (validators DataFrame or None, {validator name: {"link": ..., "img_url": ...}})
+        """
         max_retries = 2
         for attempt in range(max_retries):
             with self.get_driver() as driver:
                 try:
-                    driver.get(url)
+                    load_page(driver, url)
                     time.sleep(3)
 
                     WebDriverWait(driver, 30).until(
                         ec.presence_of_element_located((By.CLASS_NAME, "el-DataListRow"))
                     )
+                    record_page(url, driver.page_source)
 
-                    rows = driver.find_elements(By.CLASS_NAME, "el-DataListRow")
+                    # The whole table in one round trip to the browser
+                    rows = extract_validator_info_rows(driver)
 
                     if not rows:
                         logger.warning(f"No rows found for {url}. Retrying...")
                         continue
 
                     data = []
+                    validator_links = {}
                     for row in rows:
-                        cols = row.find_elements(By.CLASS_NAME, "el-DataListRowCell")
-                        row_data = [col.text.strip() for col in cols]
-                        data.append(row_data)
+                        data.append(row["cells"])
+
+                        if row["name"] and row["link"] and row["img_url"]:
+                            validator_links[self._clean_validator_name(row["name"])] = {
+                                "link": row["link"],
+                                "img_url": row["img_url"],
+                            }
 
                     if not data:
                         logger.warning(f"No data found for {url}. Retrying...")
@@ -44,15 +65,17 @@ class ValidatorDataScraper(BaseScraper):
                     logger.info(f"Scraped data from: {url}")
                     logger.info(f"DataFrame shape: {df.shape}")
                     logger.info(f"Columns: {df.columns.tolist()}")
-                    return df
+                    return df, validator_links
 
                 except (TimeoutException, NoSuchElementException) as e:
                     logger.warning(f"Attempt {attempt + 1} failed for {url}: {str(e)}")
                     if attempt == max_retries - 1:
                         logger.error(f"Failed to scrape {url} after {max_retries} attempts")
-                        return None
+                        return None, {}
                     time.sleep(5)
 
+        return None, {}
+
     def process_data(self, data, url):
         count_of_columns = len(data[0])
         excluded_urls = ["https://validator.info/polygon"]
@@ -71,9 +94,9 @@ class ValidatorDataScraper(BaseScraper):
 
         for col in df.columns:
             if col == "Validator":
-                df[col] = df[col].apply(self._clean_validator_name)
+                df[col] = clean_validator_names(df[col])
             else:
-                df[col] = df[col].apply(lambda x: self._clean_numeric_value(x, col))
+                df[col] = clean_numeric_values(df[col], col)
 
         df = df.dropna(how='all')
         df = df.dropna(axis=1, how='all')
@@ -1,25 +1,28 @@
-import glob
-import io
 import re
 import os
 import sys
-from typing import Dict
+from typing import Dict, List
 from urllib.parse import urlparse
 from uuid import UUID
 
-import aiofiles
 import pandas as pd
-from fastapi import UploadFile
 from sqlalchemy import select, insert, true
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core import settings, pool_storage
+from core import settings, pool_storage, StoredFile
 from core.models import Pool, Coin, Chain, CoinPoolOffer, coin_chain, CoinPrice
+from core.logo_variants import create_logo_variants
 
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, project_root)
 
 from scraping.logger import logger
+from scraping.image_downloader import download_images, image_extension
+from scraping.bulk_ingest import store_offers, link_coins_to_chains, set_pool_logos
+from scraping.validator_table import (
+    LEADING_NUMBERS_RE, NEW_MARKER_RE, WHITESPACE_RE,
+    clean_validator_names, parse_amounts, build_offer_columns, offer_rows,
+)
 
 
 async def get_existing_pools_validator_info(session: AsyncSession) -> Dict[str, Pool]:
@@ -47,9 +50,9 @@ async def get_pools_name_id_dict(session: AsyncSession) -> Dict[str, UUID]:
 
 
 def clean_validator_name(name):
-    name = re.sub(r'^(\d+\s+)+', '', name)
-    name = re.sub(r'\bNEW\s*', '', name)
-    name = re.sub(r'\s+', ' ', name).strip()
+    name = LEADING_NUMBERS_RE.sub('', name)
+    name = NEW_MARKER_RE.sub('', name)
+    name = WHITESPACE_RE.sub(' ', name).strip()
     return name
 
 
@@ -59,20 +62,19 @@ def process_validator_data(chain: str, staked_total: float, df_validator: pd.Dat
     if 'Validator' in df_validator.columns:
         df_validator = df_validator.rename(columns={'Validator': 'validator_name'})
 
-    df_validator['validator_name'] = df_validator['validator_name'].apply(clean_validator_name)
+    df_validator['validator_name'] = clean_validator_names(df_validator['validator_name'])
 
     # Add link and image data
     df_validator['external_link'] = df_validator['validator_name'].map(
-        {name: data.get('external_link', '') for name, data in link_image_data.items()}
+        {name: data.get('external_link') or '' for name, data in link_image_data.items()}
     )
-    df_validator['img_src'] = df_validator['validator_name'].map(
-        {name: data.get('img_src', '') for name, data in link_image_data.items()}
+    df_validator['img_url'] = df_validator['validator_name'].map(
+        {name: data.get('img_url', '') for name, data in link_image_data.items()}
     )
 
     # Calculate pool_share
     if 'Total staked' in df_validator.columns:
-        df_validator['staked_usd'] = df_validator['Total staked'].apply(
-            lambda x: float(re.sub(r'[^\d.]', '', str(x))) if pd.notna(x) else 0) * chain_price
+        df_validator['staked_usd'] = parse_amounts(df_validator['Total staked']) * chain_price
         if staked_total > 0:
             df_validator['pool_share'] = (df_validator['staked_usd'] / staked_total) * 100
         else:
@@ -85,7 +87,7 @@ def process_validator_data(chain: str, staked_total: float, df_validator: pd.Dat
     # Select and rename columns for the final table
     final_columns = {
         'validator_name': 'name',
-        'img_src': 'logo',
+        'img_url': 'logo',
         'external_link': 'web_url',
         'APR': 'apr',
         'Fee': 'fee',
@@ -145,35 +147,12 @@ async def chains_and_coins_are_created_or_create(session: AsyncSession):
         chain_dict = {chain.name: chain.id for chain in existing_chains if
                       chain.name in validator_info_chains_with_coins.keys()}
 
-        # Create associations between coins and chains
-        updated = False
-
-        for chain in existing_chains:
-            coin_code = validator_info_chains_with_coins.get(chain.name)
-
-            if coin_code:
-                coin = next((c for c in existing_coins if c.code == coin_code), None)
-                if coin:
-                    # Check if association already exists
-                    existing_association = await session.execute(
-                        select(coin_chain).where(
-                            (coin_chain.c.coin_id == coin.id) & (coin_chain.c.chain_id == chain.id)
-                        )
-                    )
-                    if existing_association.first() is None:
-                        # If association doesn't exist, create it
-                        await session.execute(
-                            insert(coin_chain).values(coin_id=coin.id, chain_id=chain.id)
-                        )
-                        logger.info(f"Created association between coin {coin_code} and chain {chain.name}")
-                        updated = True
-
-                else:
-                    logger.warning(f"Coin {coin_code} not found for chain {chain.name}")
-
-        # Commit associations
-        if updated:
-            logger.info("Committing associations to the database.")
+        # Create the missing associations between coins and chains in one statement
+        pairs = [(coin_dict[coin_code], chain_id) for chain_name, chain_id in chain_dict.items()
+                 if (coin_code := validator_info_chains_with_coins[chain_name]) in coin_dict]
+        created = await link_coins_to_chains(session, pairs)
+        if created:
+            logger.info(f"Created {created} associations between coins and chains, committing them to the database.")
             await session.commit()
 
         return coin_dict, chain_dict
@@ -194,16 +173,32 @@ def normalize_chain_name(name: str) -> str:
     return name.lower()
 
 
-async def process_offers_from_csv(session: AsyncSession, coins_dict: Dict[str, UUID], chain_dict: Dict[str, UUID],
-                                  pools_dict: Dict[str, UUID]):
-    """
-    Process offers data from CSV files and insert them into the database.
+def export_processed_table(chain_name: str, final_table: pd.DataFrame) -> None:
+    """Write a processed chain table to the processed data directory, if an export format is configured."""
+    export_format = settings.scraper.processed_data_export
+    if export_format == "none":
+        return
+
+    settings.scraper.ensure_dir(settings.scraper.processed_data_dir)
+    output_file = os.path.join(settings.scraper.processed_data_dir, f"{chain_name}_validators_processed.{export_format}")
+    try:
+        if export_format == "parquet":
+            final_table.to_parquet(output_file, index=False)
+        else:
+            final_table.to_csv(output_file, index=False)
+        logger.info(f"Final table for {chain_name} exported to: {output_file}")
+    except Exception as e:
+        logger.error(f"Error exporting final table for {chain_name}: {str(e)}")
+
 
-    This function reads CSV files containing validator data, processes each row,
-    and creates CoinPoolOffer objects to be inserted into the database.
+async def process_offers(session: AsyncSession, chain_tables: Dict[str, pd.DataFrame], coins_dict: Dict[str, UUID],
+                         chain_dict: Dict[str, UUID], pools_dict: Dict[str, UUID]):
+    """
+    Insert the offers of the processed chain tables of this run into the database, all chains in one bulk insert.
 
     Args:
         session (AsyncSession): The database session.
+        chain_tables (Dict[str, pd.DataFrame]): Processed validator tables by validator.info chain slug, e.g. 'terra-classic'.
         coins_dict (Dict[str, UUID]): Dictionary mapping coin codes to their UUIDs.
         chain_dict (Dict[str, UUID]): Dictionary mapping chain names to their UUIDs.
         pools_dict (Dict[str, UUID]): Dictionary mapping pool names to their UUIDs.
@@ -211,141 +206,87 @@ async def process_offers_from_csv(session: AsyncSession, coins_dict: Dict[str, U
     Returns:
         None
     """
-    csv_files = glob.glob(
-        os.path.join(settings.scraper.processed_data_dir, '*_validators_processed.csv'))
-
-    # Get all coins and chains
-    all_coins = await session.execute(select(Coin))
-    all_chains = await session.execute(select(Chain))
-    coin_by_chain = {chain.name: coin for chain, coin in zip(all_chains.scalars().all(), all_coins.scalars().all())}
-
     # Create a mapping for normalized chain names
     chain_name_mapping = {normalize_chain_name(chain_name): chain_name for chain_name in chain_dict.keys()}
 
-    for file in csv_files:
-        file_chain_name = os.path.basename(file).split('_')[0]
-        normalized_file_chain_name = normalize_chain_name(file_chain_name)
+    # TODO: Fix duplications in the code (LATER)
+    url_to_coin_code = {
+        "lava": "LAVA",
+        "dydx": "DYDX",
+        "cronos-pos": "CRO",
+        "celestia": "TIA",
+        "terra-classic": "LUNC",
+        "dymension": "DYM",
+        "saga": "SAGA",
+        "haqq": "ISLM",
+        "coreum": "COREUM",
+        "nolus": "NLS",
+        "polygon": "POL",
+    }
 
-        chain_name = chain_name_mapping.get(normalized_file_chain_name)
+    offers = []
+    for chain_slug, df in chain_tables.items():
+        chain_name = chain_name_mapping.get(normalize_chain_name(chain_slug))
         if not chain_name:
-            logger.warning(f"Chain name from file '{file_chain_name}' not found in chain_dict. Skipping file {file}")
+            logger.warning(f"Chain '{chain_slug}' not found in chain_dict. Skipping its offers")
             continue
 
         chain_id = chain_dict.get(chain_name)
         if not chain_id:
-            logger.warning(f"Chain ID for '{chain_name}' not found in chain_dict. Skipping file {file}")
+            logger.warning(f"Chain ID for '{chain_name}' not found in chain_dict. Skipping its offers")
             continue
 
-        # TODO: Fix duplications in the code (LATER)
-
-        url_to_coin_code = {
-            "lava": "LAVA",
-            "dydx": "DYDX",
-            "cronos-pos": "CRO",
-            "celestia": "TIA",
-            "terra-classic": "LUNC",
-            "dymension": "DYM",
-            "saga": "SAGA",
-            "haqq": "ISLM",
-            "coreum": "COREUM",
-            "nolus": "NLS",
-            "polygon": "POL",
-        }
-
-        url_to_chain_name = {
-            "lava": "Lava",
-            "dydx": "dYdX",
-            "cronos-pos": "Cronos Pos",
-            "celestia": "Celestia",
-            "terra-classic": "Terra Classic",
-            "dymension": "Dymension",
-            "saga": "Saga",
-            "haqq": "HAQQ",
-            "coreum": "Coreum",
-            "nolus": "Nolus",
-            "polygon": "Polygon",
-        }
-
         # Получаем правильный код монеты для данной сети
-        coin_code = next((code for url, code in url_to_coin_code.items() if url_to_chain_name[url] == chain_name), None)
+        coin_code = url_to_coin_code.get(chain_slug)
         if not coin_code:
-            logger.warning(f"Coin code not found for chain {chain_name}. Skipping file {file}")
+            logger.warning(f"Coin code not found for chain {chain_name}. Skipping its offers")
             continue
 
         coin_id = coins_dict.get(coin_code)
         if not coin_id:
-            logger.warning(f"Coin {coin_code} not found in coins_dict for chain {chain_name}. Skipping file {file}")
+            logger.warning(f"Coin {coin_code} not found in coins_dict for chain {chain_name}. Skipping its offers")
             continue
 
-        try:
-            df = pd.read_csv(file)
-        except Exception as e:
-            logger.error(f"Error reading CSV file {file}: {str(e)}")
-            continue
+        chain_offers = offer_rows(build_offer_columns(df, pools_dict, coin_id, chain_id))
+        offers.extend(chain_offers)
+        logger.info(f"Prepared {len(chain_offers)} offers for chain {chain_name}")
 
-        offers_to_add = []
-        for _, row in df.iterrows():
-            pool_name = row['name']
-            pool_id = pools_dict.get(pool_name)
-            if not pool_id:
-                logger.info(f"Pool {pool_name} not found in pools_dict, no valid link for this provider was found. Skipping this offer.")
-                continue
-
-            try:
-                apr = float(row['apr'].strip('%')) if pd.notna(row['apr']) else None
-                fee = float(row['fee'].strip('%')) if pd.notna(row['fee']) else None
-                pool_share = float(row['pool_share']) if pd.notna(row['pool_share']) else None
-
-                offer = CoinPoolOffer(
-                    coin_id=coin_id,
-                    pool_id=pool_id,
-                    chain_id=chain_id,
-                    apr=apr,
-                    fee=fee,
-                    pool_share=pool_share,
-                    lock_period=0,
-                )
-                offers_to_add.append(offer)
-            except Exception as e:
-                logger.error(f"Error processing offer for pool {pool_name}: {str(e)}")
-
-        try:
-            session.add_all(offers_to_add)
-            await session.commit()
-            logger.info(f"Added {len(offers_to_add)} offers for chain {chain_name}")
-        except Exception as e:
-            logger.error(f"Error adding offers to database for chain {chain_name}: {str(e)}")
-            await session.rollback()
+    try:
+        added = await store_offers(session, offers)
+        await session.commit()
+        logger.info(f"Added {added} offers of {len(chain_tables)} chains")
+    except Exception as e:
+        logger.error(f"Error adding offers to database: {str(e)}")
+        await session.rollback()
 
-    logger.info("All offers from CSV files have been processed and added to the database.")
+    logger.info("All processed offers have been added to the database.")
 
 
-async def process_logos(link_image_data, existing_pools):
+async def process_logos(session: AsyncSession, link_image_data, pools_without_logo: Dict[str, UUID]) -> List[str]:
+    """
+    Download the logos of pools without one in parallel, straight into the pool storage, and set them in one UPDATE.
+    Returns the stored names, the caller releases them if the session is rolled back before the commit.
+    """
+    images = {}
     for validator_name, data in link_image_data.items():
-        pool = existing_pools.get(validator_name)
-        if pool and pool.logo is None:
-            logo_path = data.get('img_src', '')
-            if logo_path and os.path.exists(logo_path):
-                try:
-                    async with aiofiles.open(logo_path, 'rb') as f:
-                        content = await f.read()
-
-                    filename = os.path.basename(logo_path)
-                    upload_file = UploadFile(filename=filename, file=io.BytesIO(content))
-
-                    file_path = await pool_storage.put(upload_file)
-                    logger.info(f"Logo saved for {validator_name} at {file_path}")
-
-                    db_upload_file = UploadFile(filename=filename, file=io.BytesIO(content))
-                    pool.logo = db_upload_file
-
-                    # Remove the original file after successful upload
-                    os.remove(logo_path)
-
-                except Exception as e:
-                    logger.error(f"Error saving logo for {validator_name}: {str(e)}")
+        if validator_name in pools_without_logo:
+            img_url = data.get('img_url', '')
+            if img_url:
+                images[validator_name] = (img_url, f"{validator_name}{image_extension(img_url)}")
             else:
-                logger.warning(f"Logo path not found or invalid for {validator_name}")
+                logger.warning(f"Logo URL not found for {validator_name}")
+
+    stored = await download_images(images, pool_storage)
+    try:
+        await create_logo_variants(pool_storage, stored.values())
+        await set_pool_logos(session, {pools_without_logo[validator_name]: StoredFile(name)
+                                       for validator_name, name in stored.items()})
+    except Exception:
+        await pool_storage.release(stored.values())
+        raise
+    for validator_name, name in stored.items():
+        logger.info(f"Logo saved for {validator_name} at {name}")
+    return list(stored.values())
 
 
 def is_valid_url(url):
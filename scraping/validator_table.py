@@ -0,0 +1,98 @@
+"""
+Vectorized cleaning of validator.info tables and offer building.
+
+Every step works on whole columns with pandas .str methods and precompiled patterns,
+there are no per-cell Python calls. Offers are built as column arrays, ready for a bulk insert.
+"""
+import re
+from typing import Any, Dict, List
+from uuid import UUID
+
+import pandas as pd
+
+from scraping.logger import logger
+
+
+LEADING_NUMBERS_RE = re.compile(r'^(\d+\s+)+')
+NEW_MARKER_RE = re.compile(r'\bNEW\s*')
+WHITESPACE_RE = re.compile(r'\s+')
+VOTES_JUNK_RE = re.compile(r'[^0-9/\s]')
+NUMERIC_JUNK_RE = re.compile(r'[^0-9.,%]')
+NON_DECIMAL_RE = re.compile(r'[^\d.]')
+
+# One pass per column: everything after the first line, or a character that is not part of the value
+NAME_NOISE_RE = re.compile(r'^(\d+\s+)+|\bNEW\s*')
+VOTES_CELL_NOISE_RE = re.compile(r'\n[\s\S]*|[^0-9/\s]')
+NUMERIC_CELL_NOISE_RE = re.compile(r'\n[\s\S]*|[^0-9.,%]')
+
+OFFER_COLUMNS = ("coin_id", "pool_id", "chain_id", "apr", "fee", "pool_share", "lock_period")
+
+
+def clean_validator_names(names: pd.Series) -> pd.Series:
+    """Drop rank numbers, the NEW marker and repeated whitespace from validator names."""
+    return (
+        names.fillna('').astype(str)
+        .str.replace(NAME_NOISE_RE, '', regex=True)
+        .str.replace(WHITESPACE_RE, ' ', regex=True)
+        .str.strip()
+    )
+
+
+def clean_numeric_values(values: pd.Series, column_name: str) -> pd.Series:
+    """Keep the first line of a cell and only the characters of its number ('/' and spaces for votes)."""
+    noise = VOTES_CELL_NOISE_RE if column_name == "Votes" else NUMERIC_CELL_NOISE_RE
+    return values.fillna('').astype(str).str.replace(noise, '', regex=True).str.strip()
+
+
+def parse_amounts(values: pd.Series) -> pd.Series:
+    """Amounts like '1,234.5 TIA' as floats, 0 for empty or unreadable cells."""
+    cleaned = values.astype('string').str.replace(NON_DECIMAL_RE, '', regex=True)
+    return pd.to_numeric(cleaned, errors='coerce').fillna(0.0)
+
+
+def parse_percentages(values: pd.Series) -> pd.Series:
+    """Percentages like '12.5%' as floats, NaN for empty or unreadable cells."""
+    return pd.to_numeric(values.astype('string').str.strip().str.strip('%'), errors='coerce').astype(float)
+
+
+def _nullable(values: pd.Series) -> List[Any]:
+    """Column values as a list with None instead of NaN."""
+    return values.astype(object).where(values.notna(), None).tolist()
+
+
+def build_offer_columns(df: pd.DataFrame, pools_dict: Dict[str, UUID], coin_id: UUID, chain_id: UUID) -> Dict[str, List]:
+    """
+    Offers of a processed chain table as column arrays.
+
+    Rows of pools that are not in the database, and rows without an APR, are left out.
+
+    Returns:
+        dict: {column name: list of values} for OFFER_COLUMNS, all lists of the same length.
+    """
+    pool_ids = df['name'].map(pools_dict)
+    apr = parse_percentages(df['apr'])
+
+    missing_pool = pool_ids.isna()
+    if missing_pool.any():
+        logger.info(f"{int(missing_pool.sum())} pools not found in pools_dict, no valid link for these providers "
+                    f"was found. Skipping their offers: {df.loc[missing_pool, 'name'].tolist()}")
+    missing_apr = apr.isna() & ~missing_pool
+    if missing_apr.any():
+        logger.error(f"No valid APR for pools {df.loc[missing_apr, 'name'].tolist()}. Skipping their offers")
+
+    valid = ~(missing_pool | missing_apr)
+    count = int(valid.sum())
+    return {
+        "coin_id": [coin_id] * count,
+        "pool_id": pool_ids[valid].tolist(),
+        "chain_id": [chain_id] * count,
+        "apr": apr[valid].tolist(),
+        "fee": _nullable(parse_percentages(df.loc[valid, 'fee'])),
+        "pool_share": _nullable(pd.to_numeric(df.loc[valid, 'pool_share'], errors='coerce')),
+        "lock_period": [0] * count,
+    }
+
+
+def offer_rows(columns: Dict[str, List]) -> List[Dict[str, Any]]:
+    """Column arrays as the list of parameter dicts of an executemany insert."""
+    return [dict(zip(columns, values)) for values in zip(*columns.values())]
@@ -0,0 +1,231 @@
+import asyncio
+import itertools
+import multiprocessing
+import queue
+import signal
+import sys
+import threading
+import traceback
+from typing import Any, Callable, Dict, Optional
+
+from scraping.logger import logger
+from core.config import settings
+
+
+class ScrapingWorkerError(Exception):
+    """Raised when a scraping job fails or the worker process dies."""
+
+
+# Jobs executed inside the worker process. Everything that drives a browser lives here,
+# database ingestion stays in the calling process.
+
+def _defillama_table(url):
+    from scraping.parse_defilama import DefiLamaScraper
+    return DefiLamaScraper().scrape_validator_data(url)
+
+
+def _defillama_website(validator_link):
+    from scraping.parse_defilama import DefiLamaScraper
+    return DefiLamaScraper().extract_validator_website(validator_link)
+
+
+def _validator_info_main_page(url):
+    from scraping.scrapers_validator_info import MainPageScraper
+    scraper = MainPageScraper([url])
+    content = scraper.scrape_main_page()
+    return scraper.extract_data_from_main_page(content) if content else []
+
+
+def _validator_info_chains(urls, existing_pool_names):
+    from scraping.scrapers_validator_info import scrape_chains
+    return scrape_chains(urls, existing_pool_names, workers=settings.scraper.browser_workers)
+
+
+JOBS: Dict[str, Callable] = {
+    "defillama_table": _defillama_table,
+    "defillama_website": _defillama_website,
+    "validator_info_main_page": _validator_info_main_page,
+    "validator_info_chains": _validator_info_chains,
+}
+
+# Jobs that read a single page, they get the short timeout instead of the one of a full scrape
+PAGE_JOBS = {"defillama_website", "validator_info_main_page"}
+
+
+def _worker_main(jobs: multiprocessing.Queue, results: multiprocessing.Queue) -> None:
+    from scraping.driver_pool import close_driver_pools
+
+    # Terminated after a job timeout: exit through the finally below, so the browsers are quit too
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    logger.info("Scraping worker process started.")
+    try:
+        while True:
+            job = jobs.get()
+            if job is None:
+                break
+
+            job_id, name, args, kwargs = job
+            try:
+                results.put((job_id, True, JOBS[name](*args, **kwargs)))
+            except Exception as e:
+                logger.exception(f"Scraping job {name} failed: {str(e)}")
+                results.put((job_id, False, f"{type(e).__name__}: {str(e)}\n{traceback.format_exc()}"))
+    finally:
+        # Browsers are kept alive between jobs, quit them together with the process
+        close_driver_pools()
+
+    logger.info("Scraping worker process stopped.")
+
+
+class ScrapingWorker:
+    """
+    Runs browser scraping jobs in a dedicated process, so the API event loop never blocks on Selenium.
+
+    Jobs are sent through a multiprocessing queue, results are handed back to awaiting coroutines
+    by a reader thread. The process is started lazily on the first job and restarted if it dies.
+    A job that runs past its timeout gets the process terminated, with the jobs queued behind it,
+    so a hung browser never delays later jobs; the next job starts a fresh process.
+    """
+
+    def __init__(self, job_timeout: int, page_job_timeout: int):
+        self.job_timeout = job_timeout
+        self.page_job_timeout = page_job_timeout
+        self.process: Optional[multiprocessing.Process] = None
+        self.jobs: Optional[multiprocessing.Queue] = None
+        self.results: Optional[multiprocessing.Queue] = None
+        self.reader: Optional[threading.Thread] = None
+        self.pending: Dict[int, tuple] = {}
+        self.lock = threading.Lock()
+        self.ids = itertools.count()
+
+    @property
+    def is_running(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+
+        context = multiprocessing.get_context("spawn")
+        self.jobs = context.Queue()
+        self.results = context.Queue()
+        self.process = context.Process(target=_worker_main, args=(self.jobs, self.results),
+                                       name="scraping-worker", daemon=True)
+        self.process.start()
+
+        self.reader = threading.Thread(target=self._read_results, args=(self.process, self.results),
+                                       name="scraping-worker-reader", daemon=True)
+        self.reader.start()
+        logger.info(f"Scraping worker started, pid: {self.process.pid}")
+
+    def _read_results(self, process: multiprocessing.Process, results: multiprocessing.Queue) -> None:
+        while True:
+            try:
+                job_id, ok, payload = results.get(timeout=1)
+            except queue.Empty:
+                if not process.is_alive():
+                    # A process replaced after a timeout already failed its jobs
+                    if process is self.process:
+                        self._fail_pending(f"Scraping worker process exited with code {process.exitcode}")
+                    return
+                continue
+            except (EOFError, OSError):
+                return
+
+            if job_id is None:
+                return
+
+            with self.lock:
+                loop, future = self.pending.pop(job_id, (None, None))
+            if future is not None:
+                loop.call_soon_threadsafe(self._resolve, future, ok, payload)
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, ok: bool, payload: Any) -> None:
+        if future.done():
+            return
+        if ok:
+            future.set_result(payload)
+        else:
+            future.set_exception(ScrapingWorkerError(payload))
+
+    def _fail_pending(self, message: str) -> None:
+        with self.lock:
+            pending, self.pending = self.pending, {}
+        for loop, future in pending.values():
+            loop.call_soon_threadsafe(self._resolve, future, False, message)
+
+    async def submit(self, name: str, *args, **kwargs) -> Any:
+        """
+        Run a job in the worker process and wait for its result without blocking the event loop.
+
+        Raises ScrapingWorkerError when the job fails or the worker dies, asyncio.TimeoutError when it runs too long.
+        """
+        if name not in JOBS:
+            raise ValueError(f"Unknown scraping job: {name}")
+
+        self.start()
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        job_id = next(self.ids)
+        with self.lock:
+            self.pending[job_id] = (loop, future)
+
+        self.jobs.put((job_id, name, args, kwargs))
+        timeout = self.page_job_timeout if name in PAGE_JOBS else self.job_timeout
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Scraping job {name} timed out after {timeout}s, terminating the worker process")
+            process, results = self._detach(f"Scraping worker terminated after job {name} timed out")
+            await asyncio.to_thread(self._terminate, process, results)
+            raise
+        finally:
+            with self.lock:
+                self.pending.pop(job_id, None)
+
+    def _detach(self, reason: str):
+        """Fail every job sent to the current process and forget it, so the next submit starts a new one."""
+        process, results = self.process, self.results
+        self.process = None
+        self.reader = None
+        self._fail_pending(reason)
+        return process, results
+
+    @staticmethod
+    def _terminate(process: Optional[multiprocessing.Process], results: Optional[multiprocessing.Queue],
+                   timeout: float = 10) -> None:
+        if process is not None and process.is_alive():
+            process.terminate()
+            process.join(timeout)
+            if process.is_alive():
+                process.kill()
+                process.join()
+        if results is not None:
+            # Stop the reader thread of the terminated process
+            results.put((None, True, None))
+
+    def stop(self, timeout: float = 30) -> None:
+        if self.process is None:
+            return
+
+        if self.process.is_alive():
+            self.jobs.put(None)
+            self.process.join(timeout)
+            if self.process.is_alive():
+                logger.warning("Scraping worker did not stop in time, terminating.")
+                self.process.terminate()
+                self.process.join()
+
+        self.results.put((None, True, None))
+        if self.reader:
+            self.reader.join(timeout)
+        self._fail_pending("Scraping worker stopped")
+
+        self.process = None
+        self.reader = None
+        logger.info("Scraping worker stopped.")
+
+
+scraping_worker = ScrapingWorker(job_timeout=settings.scraper.worker_job_timeout,
+                                 page_job_timeout=settings.scraper.worker_page_job_timeout)
@@ -1,3 +1,5 @@
+import json
+
 import aiohttp
 import sys
 import os
@@ -12,6 +14,7 @@ from core import logger
 from core.models import db_helper
 from core.models.coin import Coin
 from core.models.coin_price import CoinPrice
+from scraping.replay import resolve_url, record_response
 
 
 coins_should_exist = {
@@ -79,8 +82,10 @@ def format_price(_price):
 async def get_crypto_prices(crypto_ids):
     url = f"https://api.coingecko.com/api/v3/simple/price?ids={','.join(crypto_ids)}&vs_currencies=usd"
     async with aiohttp.ClientSession() as session:
-        async with session.get(url) as response:
-            return await response.json()
+        async with session.get(resolve_url(url)) as response:
+            body = await response.read()
+            record_response(url, body, response.content_type)
+            return json.loads(body)
 
 
 async def update_coin_prices():
@@ -0,0 +1,84 @@
+import json
+import os
+
+import pytest
+
+from scraping.defillama_data import parse_lsd_page, browser_rows_url
+from scraping.replay import FixtureStore
+
+
+LSD_URL = "https://defillama.com/lsd"
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+# Tuple fields that are stored with the offers: market share, LSD, APR and fee
+NAME, MARKET_SHARE, LSD, APR, FEE = 0, 7, 8, 11, 12
+
+
+def lsd_page(protocols):
+    payload = {"props": {"pageProps": {"data": protocols}}}
+    return f'<html><script id="__NEXT_DATA__" type="application/json">{json.dumps(payload)}</script></html>'
+
+
+def percent(value: str) -> float:
+    """Cell value as stored, like DefiLamaScraper.clean_percentage."""
+    return float(value.strip('%').replace(',', '')) if value and value.strip() != '' else 0.0
+
+
+def test_rows_have_the_fields_of_the_browser_scraper():
+    rows = parse_lsd_page(lsd_page([
+        {"name": "Lido", "stakedEth": 9500000, "marketShare": 28.5, "lsdSymbol": "stETH", "apy": 3.2, "fee": 10},
+    ]))
+
+    assert rows == [(
+        "Lido", "https://defillama.com/protocol/lido", "https://icons.llamao.fi/icons/protocols/lido?w=48&h=48",
+        "9,500,000.00", "", "", "", "28.50%", "stETH", "", "", "3.20%", "10.00%",
+    )]
+
+
+def test_fractions_are_scaled_to_percents():
+    rows = parse_lsd_page(lsd_page([
+        {"name": "Lido", "stakedEth": 9500000, "marketShare": 0.7, "apy": 0.032, "fee": 0.1},
+        {"name": "Rocket Pool", "stakedEth": 1000000, "marketShare": 0.3, "apy": 0.029, "fee": 0.14},
+    ]))
+
+    assert [(row[MARKET_SHARE], row[APR], row[FEE]) for row in rows] == [
+        ("70.00%", "3.20%", "10.00%"),
+        ("30.00%", "2.90%", "14.00%"),
+    ]
+
+
+def test_percents_are_kept():
+    rows = parse_lsd_page(lsd_page([
+        {"name": "Lido", "stakedEth": 9500000, "marketShare": 70, "apy": 3.2, "fee": 10},
+        {"name": "Frax", "stakedEth": 100000, "marketShare": 0.4, "apy": 0.9, "fee": 0},
+    ]))
+
+    assert [(row[MARKET_SHARE], row[APR], row[FEE]) for row in rows] == [
+        ("70.00%", "3.20%", "10.00%"),
+        ("0.40%", "0.90%", "0.00%"),
+    ]
+
+
+def test_page_without_apr_falls_back_to_the_browser():
+    assert parse_lsd_page(lsd_page([{"name": "Lido", "stakedEth": 9500000, "marketShare": 70}])) == []
+
+
+def test_recorded_page_matches_browser_rows():
+    store = FixtureStore(FIXTURES_DIR)
+    page, browser_rows = store.load_url(LSD_URL), store.load_url(browser_rows_url(LSD_URL))
+    if page is None or browser_rows is None:
+        pytest.skip("No recorded DefiLlama LSD page, see tests/fixtures/README.md")
+
+    json_rows = {row[NAME]: row for row in parse_lsd_page(page[1].decode("utf-8"))}
+    browser_rows = {row[NAME]: row for row in json.loads(browser_rows[1])}
+    assert json_rows, "parse_lsd_page found no rows in the recorded page"
+
+    # The browser only renders rows it scrolled past, every one of them must be in the page data
+    assert set(browser_rows) <= set(json_rows)
+    for name, browser_row in browser_rows.items():
+        json_row = json_rows[name]
+        assert len(json_row) == len(browser_row) == 13
+        assert json_row[LSD] == browser_row[LSD], name
+        for field in (MARKET_SHARE, APR, FEE):
+            # Cells are rendered with two decimals
+            assert percent(json_row[field]) == pytest.approx(percent(browser_row[field]), abs=0.01), (name, field)